@@ -188,18 +188,22 @@ class ExecutionPlanner:
         current_group = []
         current_files: Set[str] = set()
 
-        for gap in gaps:
-            gap_files = set(gap.file_paths)
-            combined_files = current_files | gap_files
+        # Build each gap's file set once; the fit check below only counts
+        # files not yet in the group, so no union is built for a gap that
+        # ends up starting a new group.
+        gap_sets = [(gap, frozenset(gap.file_paths)) for gap in gaps]
+
+        for gap, gap_files in gap_sets:
+            new_files = gap_files - current_files
 
-            if len(combined_files) <= max_files:
+            if len(current_files) + len(new_files) <= max_files:
                 current_group.append(gap)
-                current_files = combined_files
+                current_files.update(new_files)
             else:
                 if current_group:
                     groups.append(current_group)
                 current_group = [gap]
-                current_files = gap_files
+                current_files = set(gap_files)
 
         if current_group:
             groups.append(current_group)
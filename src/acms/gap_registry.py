@@ -90,12 +90,37 @@ class GapRegistry:
     def __init__(self, storage_path: Optional[Path] = None):
         self.storage_path = storage_path
         self.gaps: Dict[str, GapRecord] = {}
+        # Severity/category indexes, rebuilt lazily when ``gaps`` changes
+        self._index_key: Optional[tuple] = None
+        self._by_severity: Dict[GapSeverity, List[GapRecord]] = {}
+        self._by_category: Dict[str, List[GapRecord]] = {}
         if storage_path and storage_path.exists():
             self.load()
 
     def add_gap(self, gap: GapRecord) -> None:
         """Add or update a gap record"""
+        replaced = gap.gap_id in self.gaps
         self.gaps[gap.gap_id] = gap
+        if replaced:
+            self._index_key = None
+        elif self._index_key is not None:
+            self._by_severity.setdefault(gap.severity, []).append(gap)
+            self._by_category.setdefault(gap.category, []).append(gap)
+            self._index_key = (id(self.gaps), len(self.gaps))
+
+    def _ensure_indexes(self) -> None:
+        """Rebuild severity/category indexes if gaps were added or replaced"""
+        key = (id(self.gaps), len(self.gaps))
+        if key == self._index_key:
+            return
+        by_severity: Dict[GapSeverity, List[GapRecord]] = {}
+        by_category: Dict[str, List[GapRecord]] = {}
+        for g in self.gaps.values():
+            by_severity.setdefault(g.severity, []).append(g)
+            by_category.setdefault(g.category, []).append(g)
+        self._by_severity = by_severity
+        self._by_category = by_category
+        self._index_key = key
 
     def get_gap(self, gap_id: str) -> Optional[GapRecord]:
         """Retrieve a gap by ID"""
@@ -127,11 +152,13 @@ class GapRegistry:
 
     def get_by_category(self, category: str) -> List[GapRecord]:
         """Query gaps by category"""
-        return [g for g in self.gaps.values() if g.category == category]
+        self._ensure_indexes()
+        return list(self._by_category.get(category, ()))
 
     def get_by_severity(self, severity: GapSeverity) -> List[GapRecord]:
         """Query gaps by severity"""
-        return [g for g in self.gaps.values() if g.severity == severity]
+        self._ensure_indexes()
+        return list(self._by_severity.get(severity, ()))
 
     def get_by_workstream(self, workstream_id: str) -> List[GapRecord]:
         """Query gaps by workstream"""
@@ -150,6 +177,10 @@ class GapRegistry:
         with open(report_path, "r", encoding="utf-8") as f:
             report = json.load(f)
 
+        return self.load_from_dict(report)
+
+    def load_from_dict(self, report: Dict[str, Any]) -> int:
+        """Load gaps from an already-parsed gap analysis report"""
         count = 0
         timestamp = datetime.now(UTC).isoformat()
 
@@ -201,16 +232,18 @@ class GapRegistry:
             data = json.load(f)
 
         self.gaps = {g["gap_id"]: GapRecord.from_dict(g) for g in data.get("gaps", [])}
+        self._index_key = None
 
     def get_stats(self) -> Dict[str, Any]:
         """Get registry statistics"""
+        self._ensure_indexes()
         return {
             "total": len(self.gaps),
             "by_status": {
                 status.value: len(self.get_by_status(status)) for status in GapStatus
             },
             "by_severity": {
-                severity.value: len(self.get_by_severity(severity))
+                severity.value: len(self._by_severity.get(severity, ()))
                 for severity in GapSeverity
             },
             "unresolved": len(self.get_unresolved()),
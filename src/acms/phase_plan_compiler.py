@@ -14,6 +14,13 @@ from typing import Any, Dict, List, Optional, Set
 
 from src.acms.execution_planner import Workstream
 
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 # GUARDRAILS: Import guardrails enforcement
 try:
     from src.acms.guardrails import PatternGuardrails
@@ -478,5 +485,13 @@ class PhasePlanCompiler:
     def save_plan(self, plan: MiniPipeExecutionPlan, output_path: Path) -> None:
         """Save execution plan to JSON"""
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        if _ORJSON_AVAILABLE:
+            output_path.write_bytes(
+                orjson.dumps(
+                    plan.to_dict(),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+            return
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(plan.to_dict(), f, indent=2)
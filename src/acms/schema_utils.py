@@ -6,17 +6,26 @@ Provides validation helpers for all ACMS data structures.
 
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 try:
     import jsonschema
-    from jsonschema import validate, ValidationError
+    from jsonschema import ValidationError
 
     JSONSCHEMA_AVAILABLE = True
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
     print("⚠️  jsonschema not installed. Install with: pip install jsonschema")
 
+try:
+    import fastjsonschema
+
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+SchemaCheck = Callable[[Any], Tuple[bool, Optional[str]]]
+
 
 class SchemaValidator:
     """Validates JSON data against schemas"""
@@ -26,6 +35,7 @@ class SchemaValidator:
             Path(__file__).parent.parent.parent / "schemas"
         )
         self.schemas = {}
+        self._compiled: Dict[str, SchemaCheck] = {}
         self._load_schemas()
 
     def _load_schemas(self) -> None:
@@ -55,23 +65,46 @@ class SchemaValidator:
         Returns:
             (is_valid, error_message)
         """
-        if not JSONSCHEMA_AVAILABLE:
-            return True, "jsonschema not available - skipping validation"
+        return self.compile(schema_name)(data)
+
+    def compile(self, schema_name: str) -> SchemaCheck:
+        """
+        Get a reusable checker for a schema
+
+        The schema is checked and compiled on first use; later calls return
+        the same callable, so hot loops skip per-call schema setup.
+        """
+        check = self._compiled.get(schema_name)
+        if check is None:
+            check = self._compiled[schema_name] = self._compile(schema_name)
+        return check
+
+    def _compile(self, schema_name: str) -> SchemaCheck:
+        if not (JSONSCHEMA_AVAILABLE or FASTJSONSCHEMA_AVAILABLE):
+            return lambda data: (
+                True,
+                "jsonschema not available - skipping validation",
+            )
 
         schema = self.schemas.get(schema_name)
         if not schema:
-            return False, f"Schema '{schema_name}' not found"
+            return lambda data: (False, f"Schema '{schema_name}' not found")
 
         try:
-            validate(instance=data, schema=schema)
-            return True, None
-        except ValidationError as e:
-            return (
-                False,
-                f"Validation error: {e.message} at {'.'.join(str(p) for p in e.path)}",
-            )
+            if FASTJSONSCHEMA_AVAILABLE:
+                # Match jsonschema.validate: don't fill in defaults (which
+                # would mutate the caller's data) or enforce "format"
+                return _fast_check(
+                    fastjsonschema.compile(
+                        schema, use_default=False, use_formats=False
+                    )
+                )
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+            return _jsonschema_check(validator_cls(schema))
         except Exception as e:
-            return False, f"Unexpected error: {str(e)}"
+            message = f"Unexpected error: {str(e)}"
+            return lambda data: (False, message)
 
     def validate_file(
         self, file_path: Path, schema_name: str
@@ -89,6 +122,38 @@ class SchemaValidator:
         return list(self.schemas.keys())
 
 
+def _fast_check(compiled: Callable[[Any], Any]) -> SchemaCheck:
+    def check(data: Any) -> Tuple[bool, Optional[str]]:
+        try:
+            compiled(data)
+            return True, None
+        except fastjsonschema.JsonSchemaValueException as e:
+            # e.path starts with the root name ("data"); report the rest
+            # like the jsonschema path does
+            path = ".".join(str(p) for p in (e.path or [])[1:])
+            return False, f"Validation error: {e.message} at {path}"
+        except Exception as e:
+            return False, f"Unexpected error: {str(e)}"
+
+    return check
+
+
+def _jsonschema_check(validator: Any) -> SchemaCheck:
+    def check(data: Any) -> Tuple[bool, Optional[str]]:
+        try:
+            validator.validate(data)
+            return True, None
+        except ValidationError as e:
+            return (
+                False,
+                f"Validation error: {e.message} at {'.'.join(str(p) for p in e.path)}",
+            )
+        except Exception as e:
+            return False, f"Unexpected error: {str(e)}"
+
+    return check
+
+
 # Convenience functions
 _validator = None
 
@@ -22,14 +22,46 @@ Examples:
     
     # Show all details
     python acms_show_run.py --all
+
+    # Show ledger entries without metadata
+    python acms_show_run.py --ledger --brief
 """
 
-import argparse
 import json
+import mmap
+import os
+import re
 import sys
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+# Top-level string fields read by the brief ledger view. The controller writes
+# "meta" last, so the first occurrence of each key is the top-level one.
+_LEDGER_FIELD_RE = re.compile(rb'"(state|event|ts)":\s*"([^"\\]*)"')
+_LEDGER_FIELDS = ("state", "event", "ts")
+
+_STATUS_INDICATORS = MappingProxyType(
+    {
+        "success": "✅ SUCCESS",
+        "failed": "❌ FAILED",
+        "partial": "⚠️  PARTIAL",
+        "cancelled": "🚫 CANCELLED",
+    }
+)
+
+
+def _parse_iso(timestamp: str) -> "datetime":
+    """Parse an ISO timestamp, accepting a trailing 'Z' for UTC"""
+    # Deferred so --help and --json never pay for the datetime import
+    from datetime import datetime
+
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    return datetime.fromisoformat(timestamp)
 
 
 class RunViewer:
@@ -67,135 +99,204 @@ class RunViewer:
 
     def load_ledger(self, run_id: str) -> List[Dict]:
         """Load ledger entries for a run"""
+        return list(self.iter_ledger(run_id))
+
+    def iter_ledger(self, run_id: str) -> Iterator[Dict]:
+        """Yield ledger entries for a run one at a time"""
         run_dir = self.runs_dir / run_id
         ledger_file = run_dir / "run.ledger.jsonl"
 
         if not ledger_file.exists():
-            return []
+            return
 
-        entries = []
         try:
-            with open(ledger_file, "r", encoding="utf-8") as f:
-                for line in f:
+            if ledger_file.stat().st_size == 0:
+                return
+
+            # Map the file and slice lines out of the page cache instead of
+            # reading the whole ledger into a second buffer first.
+            with open(ledger_file, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                pos = 0
+                size = len(mm)
+                while pos < size:
+                    nl = mm.find(b"\n", pos)
+                    if nl == -1:
+                        nl = size
+                    line = mm[pos:nl]
                     if line.strip():
-                        entries.append(json.loads(line))
+                        yield json.loads(line)
+                    pos = nl + 1
         except Exception as e:
             print(f"Error loading ledger: {e}", file=sys.stderr)
 
-        return entries
+    def load_ledger_summary(self, run_id: str) -> List[Dict]:
+        """Load only state/event/ts from ledger entries, skipping metadata"""
+        return list(self.iter_ledger_summary(run_id))
+
+    def iter_ledger_summary(self, run_id: str) -> Iterator[Dict]:
+        """Yield only state/event/ts from ledger entries, skipping metadata
+
+        Fields are pulled out with a regex instead of decoding each line;
+        lines with escapes or missing fields fall back to json.loads.
+        """
+        run_dir = self.runs_dir / run_id
+        ledger_file = run_dir / "run.ledger.jsonl"
+
+        if not ledger_file.exists():
+            return
+
+        try:
+            with open(ledger_file, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+
+                    entry: Dict[str, str] = {}
+                    if b"\\" not in line:
+                        for match in _LEDGER_FIELD_RE.finditer(line):
+                            key = match.group(1).decode()
+                            if key not in entry:
+                                entry[key] = match.group(2).decode("utf-8")
+                                if len(entry) == len(_LEDGER_FIELDS):
+                                    break
+
+                    if len(entry) != len(_LEDGER_FIELDS):
+                        full = json.loads(line)
+                        entry = {k: full[k] for k in _LEDGER_FIELDS if k in full}
+
+                    yield entry
+        except Exception as e:
+            print(f"Error loading ledger: {e}", file=sys.stderr)
 
     def display_summary(self, status: Dict) -> None:
         """Display run summary in human-readable format"""
-        print()
-        print("=" * 70)
-        print(f"ACMS RUN STATUS - {status['run_id']}")
-        print("=" * 70)
-        print()
+        lines = [
+            "",
+            "=" * 70,
+            f"ACMS RUN STATUS - {status['run_id']}",
+            "=" * 70,
+            "",
+        ]
+        add = lines.append
 
         # Basic info
-        print("📋 Basic Information")
-        print(f"  Run ID:       {status['run_id']}")
-        print(f"  Repository:   {status['repo_root']}")
-        print(f"  Status:       {self._format_status(status['final_status'])}")
-        print(f"  Started:      {self._format_time(status['started_at'])}")
+        add("📋 Basic Information")
+        add(f"  Run ID:       {status['run_id']}")
+        add(f"  Repository:   {status['repo_root']}")
+        add(f"  Status:       {self._format_status(status['final_status'])}")
+        add(f"  Started:      {self._format_time(status['started_at'])}")
         if status.get("completed_at"):
-            print(f"  Completed:    {self._format_time(status['completed_at'])}")
+            add(f"  Completed:    {self._format_time(status['completed_at'])}")
             duration = self._calculate_duration(
                 status["started_at"], status["completed_at"]
             )
-            print(f"  Duration:     {duration}")
-        print()
+            add(f"  Duration:     {duration}")
+        add("")
 
         # Metrics
         metrics = status.get("metrics", {})
-        print("📊 Metrics")
-        print(f"  Gaps Discovered:      {metrics.get('gaps_discovered', 0)}")
-        print(f"  Gaps Resolved:        {metrics.get('gaps_resolved', 0)}")
-        print(f"  Workstreams Created:  {metrics.get('workstreams_created', 0)}")
-        print(f"  Tasks Executed:       {metrics.get('tasks_executed', 0)}")
-        print(f"  Tasks Failed:         {metrics.get('tasks_failed', 0)}")
+        add("📊 Metrics")
+        add(f"  Gaps Discovered:      {metrics.get('gaps_discovered', 0)}")
+        add(f"  Gaps Resolved:        {metrics.get('gaps_resolved', 0)}")
+        add(f"  Workstreams Created:  {metrics.get('workstreams_created', 0)}")
+        add(f"  Tasks Executed:       {metrics.get('tasks_executed', 0)}")
+        add(f"  Tasks Failed:         {metrics.get('tasks_failed', 0)}")
         if metrics.get("patches_applied"):
-            print(f"  Patches Applied:      {metrics.get('patches_applied', 0)}")
-        print()
+            add(f"  Patches Applied:      {metrics.get('patches_applied', 0)}")
+        add("")
 
         # State transitions
         transitions = status.get("state_transitions", [])
         if transitions:
-            print("🔄 State Transitions")
+            add("🔄 State Transitions")
             for i, trans in enumerate(transitions):
                 state = trans["state"]
                 time = self._format_time(trans["timestamp"])
                 prev = trans.get("previous", "")
 
                 if i == 0:
-                    print(f"  {state.upper()}")
+                    add(f"  {state.upper()}")
                 else:
-                    print(f"  {prev} → {state.upper()}")
-                print(f"    {time}")
-            print()
+                    add(f"  {prev} → {state.upper()}")
+                add(f"    {time}")
+            add("")
 
         # Configuration
         config = status.get("config", {})
         if config:
-            print("⚙️  Configuration")
-            print(
+            add("⚙️  Configuration")
+            add(
                 f"  Triggers:        {'enabled' if config.get('triggers_enabled') else 'disabled'}"
             )
-            print(
+            add(
                 f"  Resilience:      {'enabled' if config.get('enable_resilience') else 'disabled'}"
             )
-            print(
+            add(
                 f"  Patch Ledger:    {'enabled' if config.get('enable_patch_ledger') else 'disabled'}"
             )
-            print(f"  Max Concurrent:  {config.get('max_concurrent_tasks', 'N/A')}")
-            print(f"  Timeout:         {config.get('timeout_seconds', 'N/A')}s")
-            print()
+            add(f"  Max Concurrent:  {config.get('max_concurrent_tasks', 'N/A')}")
+            add(f"  Timeout:         {config.get('timeout_seconds', 'N/A')}s")
+            add("")
 
         # Artifacts
         artifacts = status.get("artifacts", {})
         if artifacts:
-            print("📄 Artifacts")
+            add("📄 Artifacts")
+            root = os.fspath(status["repo_root"])
+            exists_at = os.path.exists
+            join = os.path.join
             for name, path in artifacts.items():
                 if path:
-                    exists = (Path(status["repo_root"]) / path).exists()
+                    exists = exists_at(join(root, path))
                     indicator = "✓" if exists else "✗"
-                    print(f"  {indicator} {name}: {path}")
-            print()
+                    add(f"  {indicator} {name}: {path}")
+            add("")
 
         # Error if failed
         if status.get("error"):
-            print("❌ Error")
-            print(f"  {status['error']}")
-            print()
+            add("❌ Error")
+            add(f"  {status['error']}")
+            add("")
 
-        print("=" * 70)
-        print()
+        add("=" * 70)
+        add("")
 
-    def display_ledger(self, entries: List[Dict]) -> None:
-        """Display ledger entries"""
-        print()
-        print("=" * 70)
-        print(f"LEDGER ENTRIES ({len(entries)} total)")
-        print("=" * 70)
-        print()
+        # One write for the whole report instead of one per line
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def display_ledger(self, entries: Iterable[Dict]) -> None:
+        """Display ledger entries
+
+        Accepts any iterable so entries can be streamed from iter_ledger;
+        the total in the header is counted while formatting.
+        """
+        lines = ["", "=" * 70, "", "=" * 70, ""]
+        add = lines.append
+        total = 0
 
         for entry in entries:
+            total += 1
             state = entry.get("state", "unknown").ljust(15)
             event = entry.get("event", "unknown").ljust(30)
             time = self._format_time(entry.get("ts", ""))
 
-            print(f"  {state} {event} {time}")
+            add(f"  {state} {event} {time}")
 
             # Show metadata if interesting
             meta = entry.get("meta", {})
             if meta and any(k not in ["message"] for k in meta.keys()):
                 for key, value in meta.items():
                     if key != "message":
-                        print(f"    {key}: {value}")
+                        add(f"    {key}: {value}")
+
+        add("")
+        add("=" * 70)
+        add("")
 
-        print()
-        print("=" * 70)
-        print()
+        lines[2] = f"LEDGER ENTRIES ({total} total)"
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_json(self, status: Dict) -> None:
         """Display run status as JSON"""
@@ -203,13 +304,7 @@ class RunViewer:
 
     def _format_status(self, status: str) -> str:
         """Format status with color indicators"""
-        indicators = {
-            "success": "✅ SUCCESS",
-            "failed": "❌ FAILED",
-            "partial": "⚠️  PARTIAL",
-            "cancelled": "🚫 CANCELLED",
-        }
-        return indicators.get(status, status.upper())
+        return _STATUS_INDICATORS.get(status, status.upper())
 
     def _format_time(self, timestamp: str) -> str:
         """Format ISO timestamp to readable string"""
@@ -217,7 +312,7 @@ class RunViewer:
             return "N/A"
 
         try:
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            dt = _parse_iso(timestamp)
             return dt.strftime("%Y-%m-%d %H:%M:%S")
         except:
             return timestamp
@@ -225,8 +320,8 @@ class RunViewer:
     def _calculate_duration(self, start: str, end: str) -> str:
         """Calculate duration between timestamps"""
         try:
-            dt_start = datetime.fromisoformat(start.replace("Z", "+00:00"))
-            dt_end = datetime.fromisoformat(end.replace("Z", "+00:00"))
+            dt_start = _parse_iso(start)
+            dt_end = _parse_iso(end)
             delta = dt_end - dt_start
 
             if delta.total_seconds() < 60:
@@ -241,6 +336,8 @@ class RunViewer:
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="View ACMS run status and details",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -251,6 +348,7 @@ Examples:
   acms_show_run.py --json                       # JSON output
   acms_show_run.py --ledger                     # Show ledger
   acms_show_run.py --all                        # Show everything
+  acms_show_run.py --ledger --brief             # Ledger without metadata
         """,
     )
 
@@ -260,6 +358,11 @@ Examples:
     parser.add_argument(
         "--all", action="store_true", help="Show all details (summary + ledger)"
     )
+    parser.add_argument(
+        "--brief",
+        action="store_true",
+        help="Show ledger entries without metadata (faster on large ledgers)",
+    )
     parser.add_argument(
         "--repo-root",
         type=Path,
@@ -293,7 +396,10 @@ Examples:
         if not args.ledger:
             viewer.display_summary(status)
 
-        ledger = viewer.load_ledger(run_id)
+        if args.brief:
+            ledger = viewer.iter_ledger_summary(run_id)
+        else:
+            ledger = viewer.iter_ledger(run_id)
         viewer.display_ledger(ledger)
     else:
         viewer.display_summary(status)
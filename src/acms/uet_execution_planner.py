@@ -7,7 +7,7 @@ All workstreams validate against uet_workstream.schema.json.
 Reference: UET_WORKSTREAM_SPEC.md, Track 2 of alignment plan
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
@@ -19,6 +19,12 @@ from src.acms.uet_submodule_io_contracts import (
 )
 
 
+def _write_bytes(file_path: Path, payload: bytes) -> None:
+    """Write a serialized workstream to disk."""
+    with open(file_path, "wb") as f:
+        f.write(payload)
+
+
 class UETExecutionPlanner:
     """
     Clusters gaps into UET-compatible workstreams.
@@ -153,17 +159,18 @@ class UETExecutionPlanner:
         """
         self._ws_counter += 1
         ws_id = f"ws-acms-{self.run_id}-{self._ws_counter:03d}"
+        task_prefix = ws_id + "-task-"
 
         # Build tasks from gaps
         tasks = []
         file_scope: Set[str] = set()
         gap_to_task_id: Dict[str, str] = {}  # Map gap_id to task_id
 
-        for gap in gaps:
+        for task_num, gap in enumerate(gaps, 1):
             # Determine pattern and operation based on gap category
             pattern_id, operation_kind = self._map_gap_to_pattern(gap)
 
-            task_id = f"{ws_id}-task-{len(tasks) + 1:03d}"
+            task_id = f"{task_prefix}{task_num:03d}"
             gap_to_task_id[gap.gap_id] = task_id
 
             # Derive task dependencies from gap dependencies
@@ -293,18 +300,22 @@ class UETExecutionPlanner:
         current_group = []
         current_files: Set[str] = set()
 
-        for gap in gaps:
-            gap_files = set(gap.file_paths)
-            combined_files = current_files | gap_files
+        # Build each gap's file set once; the fit check below only counts
+        # files not yet in the group, so no union is built for a gap that
+        # ends up starting a new group.
+        gap_sets = [(gap, frozenset(gap.file_paths)) for gap in gaps]
+
+        for gap, gap_files in gap_sets:
+            new_files = gap_files - current_files
 
-            if len(combined_files) <= max_files:
+            if len(current_files) + len(new_files) <= max_files:
                 current_group.append(gap)
-                current_files = combined_files
+                current_files.update(new_files)
             else:
                 if current_group:
                     groups.append(current_group)
                 current_group = [gap]
-                current_files = gap_files
+                current_files = set(gap_files)
 
         if current_group:
             groups.append(current_group)
@@ -355,16 +366,22 @@ class UETExecutionPlanner:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        saved_paths = []
-        for ws_id, ws in self.workstreams.items():
-            file_path = output_dir / f"{ws_id}.json"
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(ws.to_dict(), f, indent=2)
-
-            saved_paths.append(file_path)
+        # Serialize serially so output is deterministic, then fan the file
+        # writes out to threads; per-file open/write/close latency dominates
+        # on network filesystems and the GIL is released during the syscalls.
+        items = [
+            (output_dir / f"{ws_id}.json", ws.to_json(indent=True))
+            for ws_id, ws in self.workstreams.items()
+        ]
+
+        if len(items) <= 1:
+            for file_path, payload in items:
+                _write_bytes(file_path, payload)
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(items))) as executor:
+                list(executor.map(lambda item: _write_bytes(*item), items))
 
-        return saved_paths
+        return [file_path for file_path, _ in items]
 
     def validate_workstreams(self) -> List[str]:
         """
@@ -373,28 +390,35 @@ class UETExecutionPlanner:
         Returns:
             List of validation errors (empty if all valid)
         """
-        errors = []
+        errors: List[str] = []
+        add_error = errors.append
 
+        # Single pass; attributes are read once into locals and messages are
+        # only formatted on the failure branches.
         for ws_id, ws in self.workstreams.items():
+            tasks = ws.tasks
+
             # Basic validation
             if not ws.ws_id:
-                errors.append(f"{ws_id}: Missing ws_id")
+                add_error(f"{ws_id}: Missing ws_id")
 
             if not ws.name:
-                errors.append(f"{ws_id}: Missing name")
+                add_error(f"{ws_id}: Missing name")
 
-            if not ws.tasks:
-                errors.append(f"{ws_id}: No tasks defined")
+            if not tasks:
+                add_error(f"{ws_id}: No tasks defined")
+                continue
 
             # Validate tasks
-            for task in ws.tasks:
-                if not task.task_id:
-                    errors.append(f"{ws_id}: Task missing task_id")
+            for task in tasks:
+                task_id = task.task_id
+                if not task_id:
+                    add_error(f"{ws_id}: Task missing task_id")
 
                 if not task.pattern_id:
-                    errors.append(f"{ws_id}/{task.task_id}: Missing pattern_id")
+                    add_error(f"{ws_id}/{task_id}: Missing pattern_id")
 
                 if not task.operation_kind:
-                    errors.append(f"{ws_id}/{task.task_id}: Missing operation_kind")
+                    add_error(f"{ws_id}/{task_id}: Missing operation_kind")
 
         return errors
@@ -6,12 +6,39 @@ All module boundaries MUST use these typed structures.
 Reference: UET_SUBMODULE_IO_CONTRACTS.md
 """
 
+import json
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") - swapped as one tuple so
+# concurrent callers never see a mismatched pair.
+_TS_CACHE = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as ISO-8601 with microseconds and a 'Z' suffix.
+
+    The date/time part is formatted at most once per second and reused.
+    """
+    global _TS_CACHE
+    now = time.time()
+    secs = int(now)
+    cached_secs, prefix = _TS_CACHE
+    if secs != cached_secs:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs))
+        _TS_CACHE = (secs, prefix)
+    return "%s.%06dZ" % (prefix, int((now - secs) * 1_000_000))
+
 
 # ============================================================================
 # EXECUTION CONTRACTS
@@ -39,7 +66,7 @@ class ExecutionRequestV1:
 
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = datetime.utcnow().isoformat() + "Z"
+            self.created_at = utc_now_iso()
 
 
 @dataclass
@@ -62,9 +89,7 @@ class ExecutionResultV1:
 
     def __post_init__(self):
         if self.completed_at is None:
-            self.completed_at = (
-                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            )
+            self.completed_at = utc_now_iso()
 
 
 # ============================================================================
@@ -88,7 +113,7 @@ class ToolRunRequestV1:
     context: Dict[str, Any] = field(default_factory=dict)  # For logging/tracing
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolRunResultV1:
     """
     Result from external tool execution.
@@ -106,13 +131,9 @@ class ToolRunResultV1:
 
     def __post_init__(self):
         if self.started_at is None:
-            self.started_at = (
-                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            )
+            self.started_at = utc_now_iso()
         if self.completed_at is None:
-            self.completed_at = (
-                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            )
+            self.completed_at = utc_now_iso()
 
     @property
     def success(self) -> bool:
@@ -140,9 +161,7 @@ class GitWorkspaceRefV1:
 
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = (
-                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            )
+            self.created_at = utc_now_iso()
 
 
 @dataclass
@@ -162,9 +181,7 @@ class GitStatusV1:
 
     def __post_init__(self):
         if self.checked_at is None:
-            self.checked_at = (
-                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            )
+            self.checked_at = utc_now_iso()
 
 
 # ============================================================================
@@ -190,7 +207,7 @@ class PatchRecordV1:
 
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = datetime.utcnow().isoformat() + "Z"
+            self.created_at = utc_now_iso()
 
 
 # ============================================================================
@@ -207,7 +224,7 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEventV1:
     """
     Structured error event.
@@ -224,12 +241,10 @@ class ErrorEventV1:
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = (
-                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            )
+            self.timestamp = utc_now_iso()
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEventV1:
     """
     Structured log event.
@@ -243,12 +258,10 @@ class LogEventV1:
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = (
-                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            )
+            self.timestamp = utc_now_iso()
 
 
-@dataclass
+@dataclass(slots=True)
 class RunRecordV1:
     """
     Complete record of a pattern/task execution.
@@ -264,9 +277,7 @@ class RunRecordV1:
 
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = (
-                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            )
+            self.created_at = utc_now_iso()
 
 
 # ============================================================================
@@ -274,7 +285,7 @@ class RunRecordV1:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkstreamTaskV1:
     """
     A single task within a workstream.
@@ -291,7 +302,7 @@ class WorkstreamTaskV1:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkstreamV1:
     """
     UET-compatible workstream definition.
@@ -312,38 +323,25 @@ class WorkstreamV1:
 
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = (
-                datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-            )
+            self.created_at = utc_now_iso()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        ws_ref = self.workspace_ref
         return {
             "ws_id": self.ws_id,
             "name": self.name,
             "description": self.description,
-            "tasks": [
-                {
-                    "task_id": t.task_id,
-                    "pattern_id": t.pattern_id,
-                    "operation_kind": t.operation_kind,
-                    "file_scope": t.file_scope,
-                    "dependencies": t.dependencies,
-                    "inputs": t.inputs,
-                    "timeout_seconds": t.timeout_seconds,
-                    "metadata": t.metadata,
-                }
-                for t in self.tasks
-            ],
+            "tasks": [_task_to_dict(t) for t in self.tasks],
             "parallelism": self.parallelism,
             "workspace_ref": {
-                "ws_id": self.workspace_ref.ws_id,
-                "root_path": self.workspace_ref.root_path,
-                "branch_name": self.workspace_ref.branch_name,
-                "commit_sha": self.workspace_ref.commit_sha,
-                "created_at": self.workspace_ref.created_at,
+                "ws_id": ws_ref.ws_id,
+                "root_path": ws_ref.root_path,
+                "branch_name": ws_ref.branch_name,
+                "commit_sha": ws_ref.commit_sha,
+                "created_at": ws_ref.created_at,
             }
-            if self.workspace_ref
+            if ws_ref
             else None,
             "gap_ids": self.gap_ids,
             "priority_score": self.priority_score,
@@ -351,3 +349,32 @@ class WorkstreamV1:
             "metadata": self.metadata,
             "created_at": self.created_at,
         }
+
+    def to_json(self, indent: bool = False) -> bytes:
+        """
+        Serialize to UTF-8 JSON bytes.
+
+        With orjson the dataclass tree is encoded directly (field names match
+        to_dict), skipping the intermediate dicts; otherwise falls back to
+        json.dumps(to_dict()).
+        """
+        if _ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(self, option=option)
+        return json.dumps(self.to_dict(), indent=2 if indent else None).encode("utf-8")
+
+
+def _task_to_dict(task: WorkstreamTaskV1) -> Dict[str, Any]:
+    """Serialize a WorkstreamTaskV1 for WorkstreamV1.to_dict."""
+    return {
+        "task_id": task.task_id,
+        "pattern_id": task.pattern_id,
+        "operation_kind": task.operation_kind,
+        "file_scope": task.file_scope,
+        "dependencies": task.dependencies,
+        "inputs": task.inputs,
+        "timeout_seconds": task.timeout_seconds,
+        "metadata": task.metadata,
+    }
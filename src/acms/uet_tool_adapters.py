@@ -11,13 +11,17 @@ maintaining full backward compatibility with UET contracts.
 Reference: DOC_AIDER_CONTRACT.md, UET_ABSTRACTION_GUIDELINES.md, DOC-INVOKE-TOOLS-WRAPPER-001
 """
 
+import atexit
+import functools
 import json
 import os
+import queue
 import subprocess
+import sys
+import threading
 import time
-import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional, Set, Union
 
 from src.acms.uet_submodule_io_contracts import (
     ErrorEventV1,
@@ -25,8 +29,30 @@ from src.acms.uet_submodule_io_contracts import (
     LogEventV1,
     ToolRunRequestV1,
     ToolRunResultV1,
+    utc_now_iso,
 )
 
+# How long to wait for output readers after killing a timed-out tool
+_READER_GRACE_SECONDS = 1.0
+
+# Working directories already confirmed to exist (see _cwd_exists)
+_KNOWN_CWDS: Set[str] = set()
+_MAX_KNOWN_CWDS = 32
+
+# Background stderr log writer (see _log_event / flush_logs)
+_LOG_QUEUE: "queue.SimpleQueue[Union[str, threading.Event]]" = queue.SimpleQueue()
+_LOG_BATCH_SIZE = 32
+_LOG_FLUSH_INTERVAL = 0.01  # seconds to wait for a batch to fill
+_LOG_WRITER_LOCK = threading.Lock()
+_log_writer: Optional[threading.Thread] = None
+
+# orjson is optional: faster JSON for the hot logging path, stdlib fallback
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 # Phase G: Import Invoke-based tool execution
 try:
     from src.minipipe.invoke_tools import run_tool_via_invoke, create_invoke_context
@@ -101,7 +127,7 @@ def _run_tool_via_invoke(request: ToolRunRequestV1) -> ToolRunResultV1:
         )
     
     # Check working directory exists
-    if not Path(request.cwd).exists():
+    if not _cwd_exists(request.cwd):
         return ToolRunResultV1(
             tool_id=request.tool_id,
             exit_code=-3,
@@ -119,9 +145,9 @@ def _run_tool_via_invoke(request: ToolRunRequestV1) -> ToolRunResultV1:
     # Join command into string (Invoke expects string, not list)
     cmd_str = " ".join(str(part) for part in request.cmd)
     
-    # Prepare environment
-    env = os.environ.copy()
-    env.update(request.env)
+    # Invoke merges env over os.environ itself (replace_env=False), so only
+    # the per-request overrides need to be passed.
+    env = request.env
     
     # Execute via Invoke
     try:
@@ -151,6 +177,17 @@ def _run_tool_via_invoke(request: ToolRunRequestV1) -> ToolRunResultV1:
     except Exception as e:
         # Handle timeouts and other errors
         duration = time.time() - started_at
+        if isinstance(e, FileNotFoundError) and _cwd_vanished(request.cwd):
+            return ToolRunResultV1(
+                tool_id=request.tool_id,
+                exit_code=-3,
+                stdout="",
+                stderr=f"Working directory does not exist: {request.cwd}",
+                duration_seconds=duration,
+                timed_out=False,
+                started_at=start_timestamp,
+                completed_at=_utc_timestamp(),
+            )
         is_timeout = "timeout" in str(e).lower() or duration >= request.timeout_seconds
         
         return ToolRunResultV1(
@@ -216,7 +253,7 @@ def _run_tool_legacy(request: ToolRunRequestV1) -> ToolRunResultV1:
         )
 
     # Check working directory exists
-    if not Path(request.cwd).exists():
+    if not _cwd_exists(request.cwd):
         return ToolRunResultV1(
             tool_id=request.tool_id,
             exit_code=-3,
@@ -228,42 +265,84 @@ def _run_tool_legacy(request: ToolRunRequestV1) -> ToolRunResultV1:
             completed_at=_utc_timestamp(),
         )
 
-    # Prepare environment
-    env = os.environ.copy()
-    env.update(request.env)
+    # Prepare environment; with no overrides the child inherits ours as-is
+    env = {**os.environ, **request.env} if request.env else None
 
-    # Execute subprocess
+    # Execute subprocess. Both pipes are drained by reader threads while the
+    # tool runs (as communicate() does), so a chatty tool cannot fill a pipe
+    # and deadlock; the full output is kept and each stream decoded once.
+    proc: Optional[subprocess.Popen] = None
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             request.cmd,
             cwd=request.cwd,
             env=env,
-            capture_output=True,
-            text=True,
-            timeout=request.timeout_seconds,
             stdin=subprocess.PIPE if request.stdin_data else None,
-            input=request.stdin_data,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
-        exit_code = result.returncode
-        stdout = result.stdout or ""
-        stderr = result.stderr or ""
-
-    except subprocess.TimeoutExpired as e:
-        timed_out = True
-        exit_code = -1
-        stdout = e.stdout.decode("utf-8") if e.stdout else ""
-        stderr = f"Process timed out after {request.timeout_seconds} seconds"
-        if e.stderr:
-            stderr += f"\n{e.stderr.decode('utf-8')}"
+        out_parts: List[bytes] = []
+        err_parts: List[bytes] = []
+        readers = [
+            threading.Thread(target=_drain, args=(proc.stdout, out_parts), daemon=True),
+            threading.Thread(target=_drain, args=(proc.stderr, err_parts), daemon=True),
+        ]
+        # stdin is fed from its own thread too: a blocking write of more than
+        # a pipe buffer would otherwise hold off the timeout below
+        if request.stdin_data:
+            stdin_bytes = request.stdin_data.encode("utf-8")
+            readers.append(
+                threading.Thread(
+                    target=_feed, args=(proc.stdin, stdin_bytes), daemon=True
+                )
+            )
+        for reader in readers:
+            reader.start()
+
+        try:
+            exit_code = proc.wait(timeout=request.timeout_seconds)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            timed_out = True
+            exit_code = -1
+
+        # After a kill, grandchildren may still hold the pipes open; don't
+        # block on them. The readers close their pipe once it hits EOF.
+        deadline = time.monotonic() + _READER_GRACE_SECONDS
+        for reader in readers:
+            if timed_out:
+                reader.join(timeout=max(0.0, deadline - time.monotonic()))
+            else:
+                reader.join()
+
+        stdout = _decode_output(b"".join(out_parts))
+        captured_err = _decode_output(b"".join(err_parts))
+        if timed_out:
+            stderr = f"Process timed out after {request.timeout_seconds} seconds"
+            if captured_err:
+                stderr += f"\n{captured_err}"
+        else:
+            stderr = captured_err
 
     except FileNotFoundError as e:
-        exit_code = -2
-        stderr = f"Binary not found: {request.cmd[0]}\n{e}"
+        if _cwd_vanished(request.cwd):
+            exit_code = -3
+            stderr = f"Working directory does not exist: {request.cwd}"
+        else:
+            exit_code = -2
+            stderr = f"Binary not found: {request.cmd[0]}\n{e}"
 
     except Exception as e:
         exit_code = -3
         stderr = f"Execution error: {type(e).__name__}: {e}"
 
+    finally:
+        # Never leave the tool running if anything above failed part-way
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
     # Calculate duration
     duration = time.time() - started_at
     completed_timestamp = _utc_timestamp()
@@ -307,7 +386,7 @@ def build_aider_tool_request(
     Returns:
         ToolRunRequestV1 configured for Aider
     """
-    # Build command
+    # Build command, files to edit last
     cmd = [
         "aider",
         "--no-auto-commits",
@@ -316,11 +395,9 @@ def build_aider_tool_request(
         model_name,
         "--message-file",
         prompt_file,
+        *file_scope,
     ]
 
-    # Add files to edit
-    cmd.extend(file_scope)
-
     # Prepare environment
     env = {
         "AIDER_NO_AUTO_COMMITS": "1",
@@ -370,11 +447,7 @@ def run_aider(
     log_event = LogEventV1(
         level="INFO",
         message=f"Running aider: {' '.join(request.cmd)}",
-        context={
-            "tool_id": "aider",
-            "cwd": request.cwd,
-            **(context or {}),
-        },
+        context=_merge_context({"tool_id": "aider", "cwd": request.cwd}, context),
     )
     _log_event(log_event)
 
@@ -385,13 +458,15 @@ def run_aider(
     result_log = LogEventV1(
         level="INFO" if result.success else "ERROR",
         message=f"Aider completed: exit_code={result.exit_code}, duration={result.duration_seconds:.2f}s",
-        context={
-            "tool_id": "aider",
-            "exit_code": result.exit_code,
-            "duration_seconds": result.duration_seconds,
-            "timed_out": result.timed_out,
-            **(context or {}),
-        },
+        context=_merge_context(
+            {
+                "tool_id": "aider",
+                "exit_code": result.exit_code,
+                "duration_seconds": result.duration_seconds,
+                "timed_out": result.timed_out,
+            },
+            context,
+        ),
     )
     _log_event(result_log)
 
@@ -421,8 +496,7 @@ def run_pytest(
     Returns:
         ToolRunResultV1
     """
-    cmd = ["pytest", "-v", "--tb=short"]
-    cmd.extend(test_paths)
+    cmd = ["pytest", "-v", "--tb=short", *test_paths]
 
     request = ToolRunRequestV1(
         tool_id="pytest",
@@ -454,8 +528,7 @@ def run_pyrefact(
     Returns:
         ToolRunResultV1
     """
-    cmd = ["pyrefact"]
-    cmd.extend(file_paths)
+    cmd = ["pyrefact", *file_paths]
 
     request = ToolRunRequestV1(
         tool_id="pyrefact",
@@ -476,9 +549,76 @@ def run_pyrefact(
 
 def _utc_timestamp() -> str:
     """Generate ISO 8601 UTC timestamp."""
-    from datetime import datetime, timezone
+    return utc_now_iso()
+
+
+def _merge_context(
+    base: Dict[str, Any], extra: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Overlay caller context onto a freshly built log context.
+
+    Updates and returns ``base`` in place, so callers must pass a new dict.
+    Avoids the ``**(context or {})`` splat, which allocates an empty dict
+    when no context is given and always builds a third dict otherwise.
+    """
+    if extra:
+        base.update(extra)
+    return base
+
+
+def _cwd_exists(cwd: str) -> bool:
+    """
+    Check that a tool working directory exists.
+
+    Positive results are remembered (up to _MAX_KNOWN_CWDS), since the same
+    workspace is used for many tool runs. Missing directories are re-checked
+    every time so a worktree created later is picked up; a remembered one
+    that has since been deleted is dropped by _cwd_vanished().
+    """
+    if cwd in _KNOWN_CWDS:
+        return True
+    if not os.path.isdir(cwd):
+        return False
+    if len(_KNOWN_CWDS) >= _MAX_KNOWN_CWDS:
+        _KNOWN_CWDS.clear()
+    _KNOWN_CWDS.add(cwd)
+    return True
+
+
+def _cwd_vanished(cwd: str) -> bool:
+    """
+    Re-check a working directory after a FileNotFoundError.
+
+    Forgets ``cwd`` and returns True if it no longer exists, so the caller
+    reports a missing working directory rather than a missing binary.
+    """
+    if os.path.isdir(cwd):
+        return False
+    _KNOWN_CWDS.discard(cwd)
+    return True
 
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+def _drain(stream: IO[bytes], sink: List[bytes]) -> None:
+    """Copy lines from a subprocess pipe into ``sink``, then close the pipe."""
+    with stream:
+        for line in iter(stream.readline, b""):
+            sink.append(line)
+
+
+def _feed(stream: IO[bytes], data: bytes) -> None:
+    """Write ``data`` to a subprocess's stdin, then close it."""
+    try:
+        stream.write(data)
+        stream.close()
+    except (BrokenPipeError, OSError):
+        # The tool exited (or was killed) without reading all of its input
+        pass
+
+
+def _decode_output(data: Optional[bytes]) -> str:
+    """Decode captured subprocess output, tolerating invalid UTF-8."""
+    return data.decode("utf-8", errors="replace") if data else ""
 
 
 def _log_event(event: LogEventV1):
@@ -486,11 +626,9 @@ def _log_event(event: LogEventV1):
     Log an event.
 
     In production, this would write to a structured event log.
-    For now, just print to stderr.
+    For now, lines are serialized here and handed to a background writer
+    that batches them onto stderr; call flush_logs() to wait for them.
     """
-    import sys
-    import json
-
     # Simple JSON logging
     log_data = {
         "timestamp": event.timestamp,
@@ -499,8 +637,103 @@ def _log_event(event: LogEventV1):
         "context": event.context,
     }
 
-    # Write to stderr (won't interfere with stdout captures)
-    print(json.dumps(log_data), file=sys.stderr)
+    if _ORJSON_AVAILABLE:
+        line = orjson.dumps(log_data).decode("utf-8")
+    else:
+        line = json.dumps(log_data)
+
+    _ensure_log_writer()
+    _LOG_QUEUE.put(line)
+
+
+def flush_logs(timeout: float = 5.0) -> None:
+    """
+    Block until every log line queued so far has been written to stderr.
+
+    Registered with atexit so buffered lines are not lost on shutdown.
+    """
+    if _log_writer is None:
+        return
+    done = threading.Event()
+    _LOG_QUEUE.put(done)
+    done.wait(timeout)
+
+
+atexit.register(flush_logs)
+
+
+def _reset_log_writer() -> None:
+    """
+    Give a forked child its own log writer state.
+
+    Only the forking thread survives a fork, so the parent's writer thread is
+    gone while its queue and lock may have been copied mid-use. The child
+    starts a fresh writer on its first log line.
+    """
+    global _LOG_QUEUE, _LOG_WRITER_LOCK, _log_writer
+    _LOG_QUEUE = queue.SimpleQueue()
+    _LOG_WRITER_LOCK = threading.Lock()
+    _log_writer = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_log_writer)
+
+
+def _ensure_log_writer() -> None:
+    """Start the background log writer on first use."""
+    global _log_writer
+    if _log_writer is not None:
+        return
+    with _LOG_WRITER_LOCK:
+        if _log_writer is None:
+            writer = threading.Thread(
+                target=_log_writer_loop, name="uet-log-writer", daemon=True
+            )
+            writer.start()
+            _log_writer = writer
+
+
+def _log_writer_loop() -> None:
+    """Drain the log queue, writing up to _LOG_BATCH_SIZE lines per write."""
+    while True:
+        batch: List[str] = []
+        waiters: List[threading.Event] = []
+
+        item = _LOG_QUEUE.get()
+        deadline = time.monotonic() + _LOG_FLUSH_INTERVAL
+        while True:
+            if isinstance(item, threading.Event):
+                # flush_logs marker: write what we have before releasing it
+                waiters.append(item)
+                break
+            batch.append(item)
+            if len(batch) >= _LOG_BATCH_SIZE:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _LOG_QUEUE.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+        if batch:
+            _write_log_batch(batch)
+        for waiter in waiters:
+            waiter.set()
+
+
+def _write_log_batch(batch: List[str]) -> None:
+    """Write a batch of log lines to stderr in a single call."""
+    try:
+        # Write to stderr (won't interfere with stdout captures). Going
+        # through the text stream keeps ordering with other stderr writes.
+        sys.stderr.write("\n".join(batch) + "\n")
+        sys.stderr.flush()
+    except (OSError, ValueError):
+        # stderr closed or replaced during shutdown; logging is best-effort
+        pass
 
 
 def build_error_event(
@@ -524,7 +757,7 @@ def build_error_event(
         ErrorEventV1
     """
     return ErrorEventV1(
-        error_id=f"err-{uuid.uuid4().hex[:8]}",
+        error_id=f"err-{os.urandom(4).hex()}",
         severity=severity,
         message=message,
         error_code=error_code,
@@ -542,6 +775,10 @@ def load_tool_profiles(
     Args:
         profile_path: Path to tool_profiles.json
 
+    Results are cached per resolved path; the returned dict is shared
+    between callers and must be treated as read-only. Call
+    invalidate_tool_profiles_cache() after editing the file.
+
     Returns:
         Dictionary of tool profiles
 
@@ -552,12 +789,27 @@ def load_tool_profiles(
     if not path.exists():
         raise FileNotFoundError(f"Tool profiles not found: {profile_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    return _load_tool_profiles_cached(str(path.resolve()))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_tool_profiles_cached(resolved_path: str) -> Dict[str, Any]:
+    """Parse a tool profiles file; keyed on absolute path so cwd changes are safe."""
+    path = Path(resolved_path)
+    if _ORJSON_AVAILABLE:
+        config = orjson.loads(path.read_bytes())
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
 
     return config.get("profiles", {})
 
 
+def invalidate_tool_profiles_cache() -> None:
+    """Drop cached tool profiles so the next load re-reads the file."""
+    _load_tool_profiles_cached.cache_clear()
+
+
 def get_tool_profile(
     tool_id: str, profiles: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
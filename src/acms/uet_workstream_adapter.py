@@ -9,7 +9,9 @@ Reference: Track 2.3 - UET_ALIGNMENT_IMPLEMENTATION_GUIDE.md
 
 import json
 import logging
-import uuid
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -22,6 +24,12 @@ from src.acms.uet_submodule_io_contracts import (
     WorkstreamTaskV1,
 )
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,9 +72,15 @@ class UETWorkstreamAdapter:
         if not workstream_path.exists():
             raise FileNotFoundError(f"Workstream not found: {workstream_path}")
 
+        # Parsed on every call: callers get their own objects, which they are
+        # free to modify
         try:
-            with open(workstream_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if _ORJSON_AVAILABLE:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                data = orjson.loads(workstream_path.read_bytes())
+            else:
+                with open(workstream_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in workstream file: {e}")
 
@@ -95,17 +109,39 @@ class UETWorkstreamAdapter:
             logger.warning(f"Workstream directory does not exist: {directory}")
             return []
 
-        workstreams = []
-        for json_file in directory.glob("ws-*.json"):
-            try:
-                ws = self.load_workstream(json_file)
-                workstreams.append(ws)
-            except Exception as e:
-                logger.error(f"Failed to load workstream from {json_file}: {e}")
+        # Plain scandir + prefix/suffix checks instead of Path.glob, which
+        # builds a Path per entry and runs its own pattern matcher. Sorted so
+        # results come back in a stable order regardless of which thread
+        # finishes first; executor.map preserves input order.
+        with os.scandir(directory) as entries:
+            json_files = sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith("ws-")
+                and entry.name.endswith(".json")
+                and entry.is_file()
+            )
+
+        if len(json_files) <= 1:
+            loaded = [self._try_load_workstream(f) for f in json_files]
+        else:
+            max_workers = min(8, os.cpu_count() or 4, len(json_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                loaded = list(executor.map(self._try_load_workstream, json_files))
+
+        workstreams = [ws for ws in loaded if ws is not None]
 
         logger.info(f"Loaded {len(workstreams)} workstreams from {directory}")
         return workstreams
 
+    def _try_load_workstream(self, json_file: Path) -> Optional[WorkstreamV1]:
+        """Load one workstream file, logging instead of raising on failure."""
+        try:
+            return self.load_workstream(json_file)
+        except Exception as e:
+            logger.error(f"Failed to load workstream from {json_file}: {e}")
+            return None
+
     def workstream_to_execution_requests(
         self,
         workstream: WorkstreamV1,
@@ -114,15 +150,51 @@ class UETWorkstreamAdapter:
         """
         Convert a WorkstreamV1 to a list of ExecutionRequestV1 objects.
 
+        Requests are returned in dependency order (see
+        workstream_to_execution_layers); each carries its layer in
+        context["layer_index"].
+
         Args:
             workstream: Workstream to convert
             workspace_override: Optional workspace to override workstream's workspace_ref
 
         Returns:
             List of execution requests (one per task)
+
+        Raises:
+            ValueError: If no workspace is available or task dependencies form a cycle
         """
-        requests = []
+        layers = self.workstream_to_execution_layers(workstream, workspace_override)
+        requests = [request for layer in layers for request in layer]
+
+        logger.info(
+            f"Converted workstream {workstream.ws_id} to {len(requests)} execution requests"
+        )
+        return requests
+
+    def workstream_to_execution_layers(
+        self,
+        workstream: WorkstreamV1,
+        workspace_override: Optional[GitWorkspaceRefV1] = None,
+    ) -> List[List[ExecutionRequestV1]]:
+        """
+        Convert a WorkstreamV1 to execution requests grouped by dependency layer.
+
+        Tasks in the same layer have no dependencies on each other and can run
+        concurrently (up to workstream.parallelism); every task's in-workstream
+        dependencies sit in an earlier layer. Dependencies on task_ids outside
+        this workstream are ignored here (handled at workstream level).
+
+        Args:
+            workstream: Workstream to convert
+            workspace_override: Optional workspace to override workstream's workspace_ref
 
+        Returns:
+            List of layers, each a list of execution requests in task order
+
+        Raises:
+            ValueError: If no workspace is available or task dependencies form a cycle
+        """
         # Determine workspace
         workspace = workspace_override or workstream.workspace_ref or self.workspace_ref
         if not workspace:
@@ -131,30 +203,43 @@ class UETWorkstreamAdapter:
                 "Provide workspace_ref in workstream, as override, or in adapter init."
             )
 
-        # Convert each task
-        for task in workstream.tasks:
-            request = ExecutionRequestV1(
-                request_id=f"{workstream.ws_id}-{task.task_id}-{uuid.uuid4().hex[:8]}",
-                operation_kind=task.operation_kind,
-                pattern_id=task.pattern_id,
-                workspace=workspace,
-                file_scope=task.file_scope,
-                context={
-                    "ws_id": workstream.ws_id,
-                    "task_id": task.task_id,
-                    "run_id": workstream.metadata.get("run_id"),
-                    "gap_ids": workstream.gap_ids,
-                    **task.metadata,
-                },
-                inputs=task.inputs,
-                timeout_seconds=task.timeout_seconds,
-            )
-            requests.append(request)
-
-        logger.info(
-            f"Converted workstream {workstream.ws_id} to {len(requests)} execution requests"
-        )
-        return requests
+        # Workstream-level values are the same for every task; look them up
+        # once. Each request still gets its own context dict.
+        ws_id = workstream.ws_id
+        run_id = workstream.metadata.get("run_id")
+        gap_ids = workstream.gap_ids
+
+        layers = []
+        for layer_index, layer_tasks in enumerate(
+            _topological_layers(ws_id, workstream.tasks)
+        ):
+            layer = []
+            for task in layer_tasks:
+                task_id = task.task_id
+                context = {
+                    "ws_id": ws_id,
+                    "task_id": task_id,
+                    "run_id": run_id,
+                    "gap_ids": gap_ids,
+                    "layer_index": layer_index,
+                }
+                if task.metadata:
+                    context.update(task.metadata)
+
+                request = ExecutionRequestV1(
+                    request_id=f"{ws_id}-{task_id}-{os.urandom(4).hex()}",
+                    operation_kind=task.operation_kind,
+                    pattern_id=task.pattern_id,
+                    workspace=workspace,
+                    file_scope=task.file_scope,
+                    context=context,
+                    inputs=task.inputs,
+                    timeout_seconds=task.timeout_seconds,
+                )
+                layer.append(request)
+            layers.append(layer)
+
+        return layers
 
     def _dict_to_workstream(self, data: Dict[str, Any]) -> WorkstreamV1:
         """Convert dictionary to WorkstreamV1."""
@@ -209,6 +294,55 @@ class UETWorkstreamAdapter:
         return list(self.loaded_workstreams.keys())
 
 
+def _topological_layers(
+    ws_id: str, tasks: List[WorkstreamTaskV1]
+) -> List[List[WorkstreamTaskV1]]:
+    """
+    Group tasks into dependency layers using Kahn's algorithm.
+
+    Order within a layer follows the original task order, so a workstream
+    without dependencies yields a single layer identical to its task list.
+
+    Raises:
+        ValueError: If the in-workstream dependencies contain a cycle
+    """
+    index = {task.task_id: i for i, task in enumerate(tasks)}
+    indegree = [0] * len(tasks)
+    dependents: Dict[int, List[int]] = {}
+
+    for i, task in enumerate(tasks):
+        for dep_id in task.dependencies:
+            dep = index.get(dep_id)
+            if dep is None:
+                continue
+            indegree[i] += 1
+            dependents.setdefault(dep, []).append(i)
+
+    ready = deque(i for i, degree in enumerate(indegree) if degree == 0)
+    layers = []
+    placed = 0
+
+    while ready:
+        current = sorted(ready)
+        ready.clear()
+        layers.append([tasks[i] for i in current])
+        placed += len(current)
+
+        for i in current:
+            for child in dependents.get(i, ()):
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+
+    if placed != len(tasks):
+        cyclic = [tasks[i].task_id for i, degree in enumerate(indegree) if degree > 0]
+        raise ValueError(
+            f"Task dependency cycle in workstream {ws_id}: {', '.join(cyclic)}"
+        )
+
+    return layers
+
+
 def load_workstream_for_run(run_id: str) -> List[WorkstreamV1]:
     """
     Convenience function to load all workstreams for a specific run.
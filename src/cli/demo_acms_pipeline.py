@@ -6,12 +6,41 @@ Demonstrates the complete ACMS pipeline using the example gap report.
 Shows gap discovery, clustering, planning, and execution plan generation.
 """
 
+import functools
 import json
+import os
+from collections import Counter
 from pathlib import Path
 from src.acms.gap_registry import GapRegistry, GapStatus
 from src.acms.execution_planner import ExecutionPlanner
 from src.acms.phase_plan_compiler import PhasePlanCompiler
 
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+_GAP_REPORT_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "..",
+    "docs",
+    "analysis_frameworks",
+    "example_gap_report.json",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_gap_report(path_str: str) -> dict:
+    """Read and parse the example gap report once per process"""
+    with open(path_str, "rb") as f:
+        raw = f.read()
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def print_section(title: str):
     """Print a section header"""
@@ -20,18 +49,13 @@ def print_section(title: str):
     print(f"{'='*70}\n")
 
 
-def demonstrate_gap_registry():
+def demonstrate_gap_registry(report: dict):
     """Demonstrate gap registry capabilities"""
     print_section("PHASE 1: Gap Discovery & Registry")
 
     # Load example gap report
     registry = GapRegistry()
-    count = registry.load_from_report(
-        Path(__file__).parent.parent.parent
-        / "docs"
-        / "analysis_frameworks"
-        / "example_gap_report.json"
-    )
+    count = registry.load_from_dict(report)
     print(f"✓ Loaded {count} gaps from example_gap_report.json\n")
 
     # Show statistics
@@ -91,9 +115,7 @@ def demonstrate_plan_compilation(planner: ExecutionPlanner):
     print(f"✓ Total tasks: {len(plan.tasks)}\n")
 
     # Task breakdown
-    task_kinds = {}
-    for task in plan.tasks:
-        task_kinds[task.task_kind] = task_kinds.get(task.task_kind, 0) + 1
+    task_kinds = Counter(task.task_kind for task in plan.tasks)
 
     print("Task Breakdown:")
     for kind, count in sorted(task_kinds.items()):
@@ -136,22 +158,10 @@ def demonstrate_gap_queries(registry: GapRegistry):
     print(f"\nTotal Unresolved: {len(unresolved)}")
 
 
-def show_recommendations(registry: GapRegistry):
+def show_recommendations(report: dict):
     """Show priority recommendations"""
     print_section("Recommended Actions")
 
-    from gap_registry import GapSeverity
-
-    # Load original report for recommendations
-    with open(
-        Path(__file__).parent.parent.parent
-        / "docs"
-        / "analysis_frameworks"
-        / "example_gap_report.json",
-        "r",
-    ) as f:
-        report = json.load(f)
-
     print("Priority Recommendations (from gap analysis):")
     for i, rec in enumerate(report["summary"]["priority_recommendations"], 1):
         print(f"  {i}. {rec}")
@@ -168,8 +178,10 @@ def main():
     print("  Using example_gap_report.json with 12 realistic gaps")
     print("=" * 70)
 
+    report = _load_gap_report(_GAP_REPORT_PATH)
+
     # Phase 1: Gap Registry
-    registry = demonstrate_gap_registry()
+    registry = demonstrate_gap_registry(report)
 
     # Query examples
     demonstrate_gap_queries(registry)
@@ -181,7 +193,7 @@ def main():
     plan = demonstrate_plan_compilation(planner)
 
     # Recommendations
-    show_recommendations(registry)
+    show_recommendations(report)
 
     # Summary
     print_section("Demonstration Complete")
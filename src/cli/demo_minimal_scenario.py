@@ -18,12 +18,23 @@ Safety:
 
 from pathlib import Path
 import json
+import os
 import sys
 
 # Import ACMS controller
 from src.acms.controller import ACMSController
 
 
+def _py_files(root: str):
+    """Yield paths of .py files under root, without following symlinked dirs"""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _py_files(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
+
+
 def main():
     """Run minimal ACMS scenario"""
 
@@ -42,8 +53,9 @@ def main():
 
     print(f"📁 Test Repository: {test_repo}")
     print(f"📊 Files:")
-    for f in test_repo.rglob("*.py"):
-        print(f"   - {f.relative_to(test_repo)}")
+    root = str(test_repo)
+    for path in sorted(_py_files(root)):
+        print(f"   - {os.path.relpath(path, root)}")
     print()
 
     # Show expected gaps
@@ -5,7 +5,7 @@ Validates all ACMS artifacts (gap registries, plans, configs, run statuses)
 against their JSON schemas.
 
 Usage:
-    python validate_everything.py [--run-id RUN_ID] [--verbose]
+    python validate_everything.py [--run-id RUN_ID ... | --all] [--verbose]
 
 Examples:
     # Validate latest run
@@ -14,25 +14,178 @@ Examples:
     # Validate specific run
     python validate_everything.py --run-id 20251207001431_2E134BDB6F61
     
+    # Validate several runs, or every run, in one invocation
+    python validate_everything.py --run-id RUN_A --run-id RUN_B
+    python validate_everything.py --all
+
     # Verbose output
     python validate_everything.py --verbose
 """
 
 import argparse
+import functools
 import json
+import os
+import stat
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Schema and guardrail modules pull in jsonschema/yaml; they are imported on
+# first use so `--help` and argument errors stay fast.
+
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def _load_json(path: str):
+    """Parse a JSON artifact, using orjson when it is installed"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_STATUS_ICONS = {
+    "valid": "✓",
+    "invalid": "✗",
+    "missing": "⚠",
+    "error": "✗",
+}
+
+# (file name, display name, required, check kind, schema)
+_RUN_ARTIFACTS = (
+    ("run_status.json", "Run Status", True, "standard", "run_status"),
+    # Gap registry is validated gap by gap
+    ("gap_registry.json", "Gap Registry", True, "each_gap", "gap_record"),
+    ("workstreams.json", "Workstreams", False, "each_item", "workstream_definition"),
+    (
+        "mini_pipe_execution_plan.json",
+        "Execution Plan",
+        False,
+        "standard",
+        "minipipe_execution_plan",
+    ),
+)
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    """stat() a path, or None when it does not exist"""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _list_spec_files(patterns_dir: str, mtime_ns: int) -> Tuple[Tuple[str, str], ...]:
+    """
+    (path, name) of each *.spec.yaml file in a patterns directory
+
+    Keyed on the directory mtime, which changes whenever an entry is added,
+    removed or renamed, so repeated runs reuse the listing.
+    """
+    with os.scandir(patterns_dir) as it:
+        return tuple(
+            sorted(
+                (e.path, e.name[: -len(".yaml")])
+                for e in it
+                if e.name.endswith(".spec.yaml") and e.is_file()
+            )
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_spec_cached(
+    spec_path: str, mtime_ns: int, size: int
+) -> Tuple[bool, Optional[str]]:
+    """validate_pattern_spec, memoized on the spec file's identity"""
+    from src.acms.guardrails import validate_pattern_spec
+
+    return validate_pattern_spec(Path(spec_path))
+
+
+# Stop validating a collection once this many records have failed; only the
+# first few errors are ever shown
+_MAX_FAILURES = 20
+
+
+def _failure_count(failures: List[str]) -> str:
+    """Failure count for reporting, marked as a lower bound when cut short"""
+    if len(failures) >= _MAX_FAILURES:
+        return f"≥{len(failures)}"
+    return str(len(failures))
+
+
+@dataclass(slots=True)
+class ArtifactResult:
+    """Outcome of validating one artifact"""
+
+    name: str
+    path: str
+    status: str  # valid, invalid, missing, error
+    error: Optional[str] = None
+    info: Optional[str] = None
+    details: Tuple[str, ...] = ()
+
+
+ArtifactCheck = Callable[[str, str], ArtifactResult]
+
+
+def _outcome(
+    name: str,
+    path: str,
+    is_valid: bool,
+    error: Optional[str],
+    info: Optional[str] = None,
+    details: Tuple[str, ...] = (),
+) -> ArtifactResult:
+    if is_valid:
+        return ArtifactResult(name=name, path=path, status="valid", info=info)
+    return ArtifactResult(
+        name=name, path=path, status="invalid", error=error, details=details
+    )
 
-from src.acms.schema_utils import SchemaValidator
-from src.acms.guardrails import PatternGuardrails, validate_pattern_spec
+
+def _gap_records(data: Any) -> Optional[Tuple[Iterable[Tuple[Any, Any]], int]]:
+    if isinstance(data, dict) and "gaps" in data:
+        gaps = data.get("gaps", {})
+        return gaps.items(), len(gaps)
+    return None
+
+
+def _list_records(data: Any) -> Optional[Tuple[Iterable[Tuple[Any, Any]], int]]:
+    if isinstance(data, list):
+        return enumerate(data), len(data)
+    return None
+
+
+def _record(results: Dict, artifact: ArtifactResult) -> None:
+    """Add an artifact outcome to a run's results"""
+    results["total"] += 1
+    results["artifacts"].append(artifact)
+    if artifact.status == "valid":
+        results["passed"] += 1
+    else:
+        results["failed"] += 1
+        results["success"] = False
 
 
 class ArtifactValidator:
     """Validates ACMS artifacts"""
 
     def __init__(self, repo_root: Path, verbose: bool = False):
+        from src.acms.guardrails import PatternGuardrails
+        from src.acms.schema_utils import SchemaValidator
+
         self.repo_root = repo_root
+        self._repo_root_str = str(repo_root)
         self.verbose = verbose
         self.validator = SchemaValidator()
         self.results = []
@@ -46,11 +199,18 @@ class ArtifactValidator:
             except Exception as e:
                 print(f"⚠️  Failed to load pattern guardrails: {e}")
 
+        # Resolve each artifact's validation strategy once, up front
+        self._run_checks: Tuple[Tuple[str, str, bool, ArtifactCheck], ...] = tuple(
+            (file_name, artifact_name, required, self._make_check(kind, schema_name))
+            for file_name, artifact_name, required, kind, schema_name in _RUN_ARTIFACTS
+        )
+        self._pattern_index_check = self._custom_check(self._validate_pattern_index)
+
     def validate_run(self, run_id: str) -> Dict[str, any]:
         """Validate all artifacts for a specific run"""
-        run_dir = self.repo_root / ".acms_runs" / run_id
+        run_dir = os.path.join(self._repo_root_str, ".acms_runs", run_id)
 
-        if not run_dir.exists():
+        if not os.path.exists(run_dir):
             return {
                 "run_id": run_id,
                 "success": False,
@@ -59,7 +219,7 @@ class ArtifactValidator:
 
         results = {
             "run_id": run_id,
-            "run_dir": str(run_dir),
+            "run_dir": run_dir,
             "artifacts": [],
             "success": True,
             "total": 0,
@@ -67,53 +227,34 @@ class ArtifactValidator:
             "failed": 0,
         }
 
-        # Validate run_status.json
-        self._validate_artifact(
-            run_dir / "run_status.json", "run_status", "Run Status", results
-        )
-
-        # Validate gap_registry.json
-        self._validate_artifact(
-            run_dir / "gap_registry.json",
-            "gap_record",  # Individual gaps
-            "Gap Registry",
-            results,
-            validate_each_gap=True,
-        )
+        checks = self._run_checks
+        artifact_paths = [os.path.join(run_dir, row[0]) for row in checks]
+        pattern_index_path = os.path.join(self._repo_root_str, "PATTERN_INDEX.yaml")
+        patterns_dir = os.path.join(self._repo_root_str, "patterns")
 
-        # Validate workstreams.json
-        workstreams_path = run_dir / "workstreams.json"
-        if workstreams_path.exists():
-            self._validate_artifact(
-                workstreams_path,
-                "workstream_definition",
-                "Workstreams",
-                results,
-                validate_each_item=True,
-            )
+        # Each path is stat'ed once, in order; helpers are told the result
+        # rather than looking the path up again
 
-        # Validate execution plan
-        plan_path = run_dir / "mini_pipe_execution_plan.json"
-        if plan_path.exists():
-            self._validate_artifact(
-                plan_path, "minipipe_execution_plan", "Execution Plan", results
-            )
+        # Validate per-run JSON artifacts
+        for path, (_, artifact_name, required, check) in zip(artifact_paths, checks):
+            found = _stat(path) is not None
+            if required or found:
+                self._validate_artifact(path, artifact_name, check, results, found)
 
         # Validate PATTERN_INDEX.yaml if it exists
-        pattern_index_path = run_dir.parent.parent / "PATTERN_INDEX.yaml"
-        if pattern_index_path.exists():
+        if _stat(pattern_index_path) is not None:
             self._validate_artifact(
                 pattern_index_path,
-                None,  # No schema validation for now
                 "Pattern Index",
+                self._pattern_index_check,
                 results,
-                custom_validator=self._validate_pattern_index,
+                True,
             )
 
         # Validate pattern specs
-        patterns_dir = run_dir.parent.parent / "patterns"
-        if patterns_dir.exists():
-            self._validate_pattern_specs(patterns_dir, results)
+        patterns_st = _stat(patterns_dir)
+        if patterns_st is not None and stat.S_ISDIR(patterns_st.st_mode):
+            self._validate_pattern_specs(patterns_dir, patterns_st.st_mtime_ns, results)
 
         results["success"] = results["failed"] == 0
         return results
@@ -148,240 +289,184 @@ class ArtifactValidator:
         except Exception as e:
             return False, f"Validation error: {str(e)}"
 
-    def _validate_pattern_specs(self, patterns_dir: Path, results: Dict) -> None:
-        """Validate all pattern spec files"""
-        for spec_file in patterns_dir.glob("*.spec.yaml"):
-            results["total"] += 1
+    def _validate_pattern_specs(
+        self, patterns_dir: str, mtime_ns: int, results: Dict
+    ) -> None:
+        """Validate all pattern spec files (mtime_ns: the directory's)"""
+        spec_files = _list_spec_files(patterns_dir, mtime_ns)
 
-            is_valid, error = validate_pattern_spec(spec_file)
+        for spec_path, spec_name in spec_files:
+            st = os.stat(spec_path)
+            is_valid, error = _validate_spec_cached(
+                spec_path, st.st_mtime_ns, st.st_size
+            )
+            _record(
+                results,
+                _outcome(f"Pattern Spec: {spec_name}", spec_path, is_valid, error),
+            )
 
-            if is_valid:
-                results["artifacts"].append(
-                    {
-                        "name": f"Pattern Spec: {spec_file.stem}",
-                        "path": str(spec_file),
-                        "status": "valid",
-                    }
-                )
-                results["passed"] += 1
-            else:
-                results["artifacts"].append(
-                    {
-                        "name": f"Pattern Spec: {spec_file.stem}",
-                        "path": str(spec_file),
-                        "status": "invalid",
-                        "error": error,
-                    }
+    def _make_check(self, kind: str, schema_name: str) -> ArtifactCheck:
+        """Build the validation closure for one kind of JSON artifact"""
+        if kind == "each_gap":
+            return self._each_record_check(
+                schema_name, _gap_records, "gaps", "{key}: {error}"
+            )
+        if kind == "each_item":
+            return self._each_record_check(
+                schema_name, _list_records, "items", "Item {key}: {error}"
+            )
+        return self._standard_check(schema_name)
+
+    def _standard_check(self, schema_name: str) -> ArtifactCheck:
+        def check(path: str, name: str) -> ArtifactResult:
+            is_valid, error = self.validator.compile(schema_name)(_load_json(path))
+            return _outcome(name, path, is_valid, error)
+
+        return check
+
+    def _each_record_check(
+        self,
+        schema_name: str,
+        records_of: Callable[[Any], Optional[Tuple[Iterable, int]]],
+        noun: str,
+        detail_format: str,
+    ) -> ArtifactCheck:
+        def check(path: str, name: str) -> ArtifactResult:
+            data = _load_json(path)
+            found = records_of(data)
+            if found is None:
+                # Not the expected container shape; validate the whole document
+                is_valid, error = self.validator.compile(schema_name)(data)
+                return _outcome(name, path, is_valid, error)
+
+            records, total = found
+            failed = []
+            for key, is_valid, error in self._check_each(records, schema_name):
+                if not is_valid:
+                    failed.append(detail_format.format(key=key, error=error))
+                    if len(failed) >= _MAX_FAILURES:
+                        break
+
+            if failed:
+                return _outcome(
+                    name,
+                    path,
+                    False,
+                    f"{_failure_count(failed)}/{total} {noun} invalid",
+                    details=tuple(failed[:5]),  # First 5 errors
                 )
-                results["failed"] += 1
-                results["success"] = False
+            return _outcome(name, path, True, None, info=f"{total} {noun} validated")
+
+        return check
+
+    def _custom_check(
+        self, validate: Callable[[Path], Tuple[bool, Optional[str]]]
+    ) -> ArtifactCheck:
+        def check(path: str, name: str) -> ArtifactResult:
+            is_valid, error = validate(Path(path))
+            return _outcome(name, path, is_valid, error)
+
+        return check
 
     def _validate_artifact(
         self,
-        path: Path,
-        schema_name: str,
+        path: str,
         artifact_name: str,
+        check: ArtifactCheck,
         results: Dict,
-        validate_each_gap: bool = False,
-        validate_each_item: bool = False,
-        custom_validator=None,
+        exists: bool,
     ) -> None:
-        """Validate a single artifact"""
-        results["total"] += 1
-
-        if not path.exists():
-            results["artifacts"].append(
-                {
-                    "name": artifact_name,
-                    "path": str(path),
-                    "status": "missing",
-                    "error": "File not found",
-                }
+        """Validate a single artifact (exists: whether path was found)"""
+        if not exists:
+            artifact = ArtifactResult(
+                name=artifact_name, path=path, status="missing", error="File not found"
             )
-            results["failed"] += 1
-            results["success"] = False
-            return
-
-        try:
-            # Use custom validator if provided
-            if custom_validator:
-                is_valid, error = custom_validator(path)
-                if is_valid:
-                    results["artifacts"].append(
-                        {"name": artifact_name, "path": str(path), "status": "valid"}
-                    )
-                    results["passed"] += 1
-                else:
-                    results["artifacts"].append(
-                        {
-                            "name": artifact_name,
-                            "path": str(path),
-                            "status": "invalid",
-                            "error": error,
-                        }
-                    )
-                    results["failed"] += 1
-                    results["success"] = False
-                return
-
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Special handling for gap registry (validate each gap)
-            if validate_each_gap and isinstance(data, dict) and "gaps" in data:
-                gaps = data.get("gaps", {})
-                total_gaps = len(gaps)
-                failed_gaps = []
-
-                for gap_id, gap_data in gaps.items():
-                    is_valid, error = self.validator.validate(gap_data, schema_name)
-                    if not is_valid:
-                        failed_gaps.append(f"{gap_id}: {error}")
-
-                if failed_gaps:
-                    results["artifacts"].append(
-                        {
-                            "name": artifact_name,
-                            "path": str(path),
-                            "status": "invalid",
-                            "error": f"{len(failed_gaps)}/{total_gaps} gaps invalid",
-                            "details": failed_gaps[:5],  # First 5 errors
-                        }
-                    )
-                    results["failed"] += 1
-                    results["success"] = False
-                else:
-                    results["artifacts"].append(
-                        {
-                            "name": artifact_name,
-                            "path": str(path),
-                            "status": "valid",
-                            "info": f"{total_gaps} gaps validated",
-                        }
-                    )
-                    results["passed"] += 1
-                return
-
-            # Special handling for arrays of items
-            if validate_each_item and isinstance(data, list):
-                total_items = len(data)
-                failed_items = []
-
-                for i, item in enumerate(data):
-                    is_valid, error = self.validator.validate(item, schema_name)
-                    if not is_valid:
-                        failed_items.append(f"Item {i}: {error}")
-
-                if failed_items:
-                    results["artifacts"].append(
-                        {
-                            "name": artifact_name,
-                            "path": str(path),
-                            "status": "invalid",
-                            "error": f"{len(failed_items)}/{total_items} items invalid",
-                            "details": failed_items[:5],
-                        }
-                    )
-                    results["failed"] += 1
-                    results["success"] = False
-                else:
-                    results["artifacts"].append(
-                        {
-                            "name": artifact_name,
-                            "path": str(path),
-                            "status": "valid",
-                            "info": f"{total_items} items validated",
-                        }
-                    )
-                    results["passed"] += 1
-                return
-
-            # Standard validation
-            is_valid, error = self.validator.validate(data, schema_name)
-
-            if is_valid:
-                results["artifacts"].append(
-                    {"name": artifact_name, "path": str(path), "status": "valid"}
-                )
-                results["passed"] += 1
-            else:
-                results["artifacts"].append(
-                    {
-                        "name": artifact_name,
-                        "path": str(path),
-                        "status": "invalid",
-                        "error": error,
-                    }
+        else:
+            try:
+                artifact = check(path, artifact_name)
+            except Exception as e:
+                artifact = ArtifactResult(
+                    name=artifact_name, path=path, status="error", error=str(e)
                 )
-                results["failed"] += 1
-                results["success"] = False
-
-        except Exception as e:
-            results["artifacts"].append(
-                {
-                    "name": artifact_name,
-                    "path": str(path),
-                    "status": "error",
-                    "error": str(e),
-                }
-            )
-            results["failed"] += 1
-            results["success"] = False
+        _record(results, artifact)
+
+    def _check_each(
+        self, records: Iterable[Tuple[Any, Any]], schema_name: str
+    ) -> Iterable[Tuple[Any, bool, Optional[str]]]:
+        """
+        Validate (key, data) records lazily, in input order
+
+        Checks run inline: they are cheap and hold the GIL, so a pool would
+        only add startup and pickling costs. Stopping iteration early skips
+        the remaining records.
+        """
+        check = self.validator.compile(schema_name)
+        for key, data in records:
+            yield (key, *check(data))
 
     def print_results(self, results: Dict) -> None:
         """Print validation results"""
-        print(f"\n{'='*70}")
-        print(f"VALIDATION RESULTS - Run {results['run_id']}")
-        print(f"{'='*70}\n")
+        rule = "=" * 70
+        lines = ["", rule, f"VALIDATION RESULTS - Run {results['run_id']}", rule, ""]
+        add = lines.append
 
         for artifact in results["artifacts"]:
-            status_icon = {
-                "valid": "✓",
-                "invalid": "✗",
-                "missing": "⚠",
-                "error": "✗",
-            }.get(artifact["status"], "?")
+            status_icon = _STATUS_ICONS.get(artifact.status, "?")
 
-            status_color = {
-                "valid": "green",
-                "invalid": "red",
-                "missing": "yellow",
-                "error": "red",
-            }.get(artifact["status"], "white")
+            add(f"  {status_icon} {artifact.name}")
 
-            print(f"  {status_icon} {artifact['name']}")
+            if self.verbose or artifact.status != "valid":
+                add(f"     Path: {artifact.path}")
 
-            if self.verbose or artifact["status"] != "valid":
-                print(f"     Path: {artifact['path']}")
+            if artifact.error is not None:
+                add(f"     Error: {artifact.error}")
 
-            if "error" in artifact:
-                print(f"     Error: {artifact['error']}")
+            if artifact.info is not None:
+                add(f"     Info: {artifact.info}")
 
-            if "info" in artifact:
-                print(f"     Info: {artifact['info']}")
+            if self.verbose and artifact.details:
+                add("     Details:")
+                for detail in artifact.details:
+                    add(f"       - {detail}")
 
-            if self.verbose and "details" in artifact:
-                print(f"     Details:")
-                for detail in artifact["details"]:
-                    print(f"       - {detail}")
+            add("")
 
-            print()
-
-        print(f"{'='*70}")
-        print(
+        add(rule)
+        add(
             f"Total: {results['total']} | Passed: {results['passed']} | Failed: {results['failed']}"
         )
-        print(
-            f"Status: {'✓ ALL VALID' if results['success'] else '✗ VALIDATION FAILED'}"
+        add(f"Status: {'✓ ALL VALID' if results['success'] else '✗ VALIDATION FAILED'}")
+        add(rule)
+        add("")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _latest_run_id(runs_dir: Path) -> Optional[str]:
+    """Name of the most recently modified run directory, if any"""
+    with os.scandir(runs_dir) as it:
+        latest = max(
+            (e for e in it if e.is_dir()),
+            key=lambda e: e.stat().st_mtime,
+            default=None,
         )
-        print(f"{'='*70}\n")
+    return latest.name if latest is not None else None
+
+
+def _all_run_ids(runs_dir: Path) -> List[str]:
+    """Names of every run directory, oldest name first"""
+    with os.scandir(runs_dir) as it:
+        return sorted(e.name for e in it if e.is_dir())
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate ACMS artifacts")
-    parser.add_argument(
-        "--run-id", help="Specific run ID to validate (default: latest)"
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument(
+        "--run-id",
+        action="append",
+        help="Run ID to validate; repeat for several runs (default: latest)",
     )
+    target.add_argument("--all", action="store_true", help="Validate every run")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument(
         "--repo-root",
@@ -392,7 +477,7 @@ def main():
 
     args = parser.parse_args()
 
-    # Find run to validate
+    # Find runs to validate
     runs_dir = args.repo_root / ".acms_runs"
 
     if not runs_dir.exists():
@@ -400,23 +485,34 @@ def main():
         sys.exit(1)
 
     if args.run_id:
-        run_id = args.run_id
+        run_ids = args.run_id
+    elif args.all:
+        run_ids = _all_run_ids(runs_dir)
     else:
         # Get latest run
-        runs = sorted(runs_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True)
-        if not runs:
-            print(f"✗ No runs found in {runs_dir}")
-            sys.exit(1)
-        run_id = runs[0].name
-        print(f"Using latest run: {run_id}\n")
+        latest = _latest_run_id(runs_dir)
+        run_ids = [latest] if latest is not None else []
+        if run_ids:
+            print(f"Using latest run: {latest}\n")
+
+    if not run_ids:
+        print(f"✗ No runs found in {runs_dir}")
+        sys.exit(1)
 
     # Validate
+    # One run after another: validation is CPU-bound under the GIL, and
+    # the validator's compiled-schema cache is not thread-safe
     validator = ArtifactValidator(args.repo_root, args.verbose)
-    results = validator.validate_run(run_id)
-    validator.print_results(results)
+    all_results = [validator.validate_run(run_id) for run_id in run_ids]
+
+    for results in all_results:
+        if "artifacts" in results:
+            validator.print_results(results)
+        else:
+            print(f"✗ {results['error']}\n")
 
     # Exit with appropriate code
-    sys.exit(0 if results["success"] else 1)
+    sys.exit(0 if all(r["success"] for r in all_results) else 1)
 
 
 if __name__ == "__main__":
@@ -9,16 +9,24 @@ concurrency limits.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
+import queue
+import select
+import shlex
+import shutil
 import signal
+import sqlite3
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Optional database integration
 try:
@@ -39,6 +47,55 @@ class DaemonConfig:
     auto_cleanup_completed: bool = True
     log_dir: Optional[Path] = None
     minipipe_command: str = "python -m src.minipipe.orchestrator"
+    # Put the run database in WAL mode for the writer thread. Off by default:
+    # journal_mode=WAL is stored in the database file and so affects every
+    # other user of it.
+    db_wal_mode: bool = False
+    
+    def __post_init__(self):
+        # Split the command at config load rather than per spawn
+        _split_command(self.minipipe_command)
+
+
+# Per-run log files: truncated like open(path, "w"), not inherited by
+# unrelated children (O_CLOEXEC does not exist on Windows)
+_LOG_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+@functools.lru_cache(maxsize=8)
+def _split_command(command: str) -> Tuple[str, ...]:
+    """
+    Split a run command into argv.
+    
+    Cached per command string, so each spawn reuses the parsed argv even if a
+    config's command is changed after creation. The executable is not
+    resolved here: PATH or the binary may change while the daemon runs.
+    """
+    if os.name == "posix":
+        return tuple(shlex.split(command))
+    # shlex's POSIX rules would eat backslashes in Windows paths
+    return tuple(command.split())
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the asctime seconds part once per second."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second: Optional[int] = None
+        self._cached_time = ""
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(
+                self.default_time_format, self.converter(record.created)
+            )
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_time, record.msecs)
 
 
 class DaemonOrchestrator:
@@ -52,6 +109,16 @@ class DaemonOrchestrator:
     - Cleanup completed runs
     """
     
+    # Kept as a constant string so sqlite3's statement cache reuses the
+    # prepared statement across polls
+    _PENDING_IDS_SQL = """
+        SELECT run_id
+        FROM runs
+        WHERE state = 'PENDING'
+        ORDER BY created_at ASC
+        LIMIT ?
+    """
+    
     def __init__(
         self,
         config: Optional[DaemonConfig] = None,
@@ -72,6 +139,30 @@ class DaemonOrchestrator:
         self.running_processes: Dict[str, subprocess.Popen] = {}
         self.should_stop = False
         
+        # (updated_at, run_id) rows written in one transaction per check pass,
+        # handed to a writer thread so commits never block the main loop
+        self._pending_cleanups: List[Tuple[str, str]] = []
+        self._write_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        # Batches the writer could not commit, retried inline by the main loop
+        self._unwritten: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer_failed = False
+        
+        # Linux: wake the main loop as soon as a child exits (pidfd + epoll)
+        # or a run is enqueued (eventfd, see wake()) instead of sleeping a
+        # full poll interval. Elsewhere we just sleep.
+        self._epoll = None
+        self._pidfds: Dict[str, int] = {}
+        self._wake_fd: Optional[int] = None
+        if hasattr(os, "pidfd_open") and hasattr(select, "epoll"):
+            try:
+                self._epoll = select.epoll()
+            except OSError:
+                self._epoll = None
+        if self._epoll is not None and hasattr(os, "eventfd"):
+            self._wake_fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+            self._epoll.register(self._wake_fd, select.EPOLLIN)
+        
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -87,7 +178,7 @@ class DaemonOrchestrator:
         
         handler = logging.StreamHandler(sys.stdout)
         handler.setFormatter(
-            logging.Formatter(
+            _CachedTimeFormatter(
                 "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             )
         )
@@ -99,6 +190,44 @@ class DaemonOrchestrator:
         """Handle shutdown signals gracefully."""
         self.logger.info(f"Received signal {signum}, initiating shutdown...")
         self.should_stop = True
+        self.wake()
+    
+    def _wake_handler(self, signum, frame):
+        """Handle SIGUSR1 by polling for pending runs right away."""
+        self.wake()
+    
+    def wake(self) -> None:
+        """
+        Wake the main loop so it polls for pending runs now.
+        
+        Call after enqueuing a run instead of waiting for the next poll
+        interval. Safe from other threads and signal handlers; a no-op where
+        eventfd is unavailable.
+        """
+        if self._wake_fd is not None:
+            os.eventfd_write(self._wake_fd, 1)
+    
+    def close(self) -> None:
+        """
+        Release the epoll, eventfd and pidfd handles.
+        
+        Called by cleanup(); call it directly (or use the daemon as a context
+        manager) when start() is never run. Safe to call more than once.
+        """
+        for run_id in list(self._pidfds):
+            self._unwatch_process(run_id)
+        if self._epoll is not None:
+            self._epoll.close()
+            self._epoll = None
+        if self._wake_fd is not None:
+            os.close(self._wake_fd)
+            self._wake_fd = None
+    
+    def __enter__(self) -> "DaemonOrchestrator":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
     
     def start(self) -> None:
         """
@@ -114,6 +243,12 @@ class DaemonOrchestrator:
             self.logger.warning("Database not available - daemon will not function")
             return
         
+        # Lets other processes (e.g. whatever inserted a PENDING run) trigger
+        # an immediate poll while the loop runs: kill -USR1 <daemon pid>
+        has_usr1 = hasattr(signal, "SIGUSR1")
+        if has_usr1:
+            previous_usr1 = signal.signal(signal.SIGUSR1, self._wake_handler)
+        
         try:
             while not self.should_stop:
                 try:
@@ -123,14 +258,17 @@ class DaemonOrchestrator:
                     # Check running processes
                     self.check_running_processes()
                     
-                    # Sleep until next poll
-                    time.sleep(self.config.poll_interval_seconds)
+                    # Sleep until next poll or until a child exits
+                    self._wait_for_exits(self.config.poll_interval_seconds)
                 
                 except Exception as e:
                     self.logger.error(f"Error in main loop: {e}", exc_info=True)
                     time.sleep(self.config.poll_interval_seconds)
         
         finally:
+            if has_usr1:
+                # None means a handler not installed from Python
+                signal.signal(signal.SIGUSR1, previous_usr1 or signal.SIG_DFL)
             self.cleanup()
     
     def poll_and_start_runs(self) -> None:
@@ -145,20 +283,19 @@ class DaemonOrchestrator:
             return
         
         # Fetch pending runs
-        pending_runs = self._fetch_pending_runs(
+        pending_run_ids = self._fetch_pending_run_ids(
             limit=self.config.max_concurrent_runs - current_count
         )
         
-        if not pending_runs:
+        if not pending_run_ids:
             self.logger.debug("No pending runs found")
             return
         
         # Start runs
-        for run in pending_runs:
+        for run_id in pending_run_ids:
             if len(self.running_processes) >= self.config.max_concurrent_runs:
                 break
             
-            run_id = run["run_id"]
             self.logger.info(f"Starting run: {run_id}")
             
             try:
@@ -166,35 +303,13 @@ class DaemonOrchestrator:
             except Exception as e:
                 self.logger.error(f"Failed to start run {run_id}: {e}", exc_info=True)
     
-    def _fetch_pending_runs(self, limit: int = 10) -> List[Dict]:
-        """Fetch pending runs from database."""
+    def _fetch_pending_run_ids(self, limit: int = 10) -> List[str]:
+        """Fetch the IDs of pending runs, oldest first."""
         if not self.db:
             return []
         
         try:
-            cursor = self.db.conn.execute(
-                """
-                SELECT run_id, project_id, phase_id, created_at, metadata
-                FROM runs
-                WHERE state = 'PENDING'
-                ORDER BY created_at ASC
-                LIMIT ?
-                """,
-                (limit,)
-            )
-            
-            runs = []
-            for row in cursor.fetchall():
-                run_id, project_id, phase_id, created_at, metadata = row
-                runs.append({
-                    "run_id": run_id,
-                    "project_id": project_id,
-                    "phase_id": phase_id,
-                    "created_at": created_at,
-                    "metadata": metadata,
-                })
-            
-            return runs
+            return [row[0] for row in self.db.conn.execute(self._PENDING_IDS_SQL, (limit,))]
         
         except Exception as e:
             self.logger.error(f"Error fetching pending runs: {e}")
@@ -207,43 +322,104 @@ class DaemonOrchestrator:
         Args:
             run_id: Run identifier to start
         """
-        # Build command
-        cmd = self.config.minipipe_command.split() + ["--run-id", run_id]
+        # Build command. The binary is looked up on every spawn; None leaves
+        # the lookup to Popen
+        args = _split_command(self.config.minipipe_command)
+        executable = shutil.which(args[0]) if args else None
+        cmd = [*args, "--run-id", run_id]
         
-        # Setup log files if log directory is configured
-        stdout_file = None
-        stderr_file = None
+        # Setup log files if log directory is configured. Raw fds are enough:
+        # Popen only dup2()s them into the child, so no file objects needed
+        stdout_fd = None
+        stderr_fd = None
         
         if self.config.log_dir:
             stdout_path = self.config.log_dir / f"{run_id}.stdout.log"
             stderr_path = self.config.log_dir / f"{run_id}.stderr.log"
             
-            stdout_file = open(stdout_path, "w")
-            stderr_file = open(stderr_path, "w")
+            stdout_fd = os.open(stdout_path, _LOG_OPEN_FLAGS, 0o644)
+            try:
+                stderr_fd = os.open(stderr_path, _LOG_OPEN_FLAGS, 0o644)
+            except OSError:
+                os.close(stdout_fd)
+                raise
             
             self.logger.info(f"Logs: {stdout_path}, {stderr_path}")
         
-        # Spawn subprocess
+        # Spawn subprocess. Keep these arguments vfork-eligible: no preexec_fn
+        # and no user/group/umask changes, so CPython (3.10+) spawns via vfork
+        # instead of copying the daemon's page tables with fork. posix_spawn
+        # itself is off the table because detaching needs start_new_session.
         try:
             proc = subprocess.Popen(
                 cmd,
-                stdout=stdout_file or subprocess.DEVNULL,
-                stderr=stderr_file or subprocess.DEVNULL,
+                executable=executable,
+                close_fds=True,
+                stdout=subprocess.DEVNULL if stdout_fd is None else stdout_fd,
+                stderr=subprocess.DEVNULL if stderr_fd is None else stderr_fd,
                 start_new_session=True,  # Detach from parent
             )
             
             self.running_processes[run_id] = proc
+            self._watch_process(run_id, proc)
             self.logger.info(f"Started run {run_id} (PID: {proc.pid})")
         
-        except Exception as e:
-            if stdout_file:
-                stdout_file.close()
-            if stderr_file:
-                stderr_file.close()
-            raise
+        finally:
+            # The child holds its own copies; the parent never writes the logs
+            if stdout_fd is not None:
+                os.close(stdout_fd)
+            if stderr_fd is not None:
+                os.close(stderr_fd)
+    
+    def _watch_process(self, run_id: str, proc: subprocess.Popen) -> None:
+        """Register a child's pidfd so its exit wakes the main loop."""
+        if self._epoll is None:
+            return
+        
+        try:
+            fd = os.pidfd_open(proc.pid)
+        except (OSError, TypeError):
+            # Already reaped, no kernel support, or not a real process
+            return
+        
+        self._epoll.register(fd, select.EPOLLIN)
+        self._pidfds[run_id] = fd
+    
+    def _unwatch_process(self, run_id: str) -> None:
+        """Drop and close a child's pidfd, if one was registered."""
+        fd = self._pidfds.pop(run_id, None)
+        if fd is None:
+            return
+        
+        try:
+            self._epoll.unregister(fd)
+        except (OSError, ValueError):
+            pass
+        os.close(fd)
+    
+    def _wait_for_exits(self, timeout: float) -> None:
+        """
+        Block for up to ``timeout`` seconds.
+        
+        Returns early when a watched child exits, which the caller then reaps
+        via check_running_processes, or when wake() is called.
+        """
+        if self._epoll is None or (not self._pidfds and self._wake_fd is None):
+            time.sleep(timeout)
+            return
+        
+        for fd, _ in self._epoll.poll(timeout):
+            if fd == self._wake_fd:
+                # Reset the counter so the next wait blocks again
+                try:
+                    os.eventfd_read(fd)
+                except BlockingIOError:
+                    pass
     
     def check_running_processes(self) -> None:
         """Poll running processes and cleanup completed ones."""
+        # One timestamp per pass, taken only if something completed
+        now_iso = None
         for run_id in list(self.running_processes.keys()):
             proc = self.running_processes[run_id]
             
@@ -256,34 +432,176 @@ class DaemonOrchestrator:
                 
                 # Remove from tracking
                 del self.running_processes[run_id]
+                self._unwatch_process(run_id)
                 
                 # Cleanup if configured
                 if self.config.auto_cleanup_completed:
-                    self._cleanup_run(run_id, exit_code)
+                    if now_iso is None:
+                        now_iso = datetime.now(UTC).isoformat() + "Z"
+                    self._cleanup_run(run_id, exit_code, now_iso)
+        
+        self._flush_cleanups()
     
-    def _cleanup_run(self, run_id: str, exit_code: int) -> None:
+    def _cleanup_run(
+        self, run_id: str, exit_code: int, updated_at: Optional[str] = None
+    ) -> None:
         """
         Cleanup completed run.
         
         Args:
             run_id: Run identifier
             exit_code: Process exit code
+            updated_at: ISO timestamp to record (defaults to now)
         """
-        # Update run state in database
+        # Queue run state update; written by _flush_cleanups
         if self.db and exit_code == 0:
+            if updated_at is None:
+                updated_at = datetime.now(UTC).isoformat() + "Z"
+            self._pending_cleanups.append((updated_at, run_id))
+    
+    def _flush_cleanups(self) -> None:
+        """Hand queued run state updates to the writer as one batch."""
+        rows, self._pending_cleanups = self._pending_cleanups, []
+        rows.extend(self._drain(self._unwritten))
+        if not rows:
+            return
+        
+        if self._writer is None and not self._start_writer():
+            # No database file to open a second connection on: write inline
+            self._write_cleanups(self.db.conn, rows)
+            return
+        if self._writer_failed or not self._writer.is_alive():
+            self._write_cleanups(self.db.conn, rows)
+            return
+        
+        self._write_queue.put(rows)
+    
+    def _start_writer(self) -> bool:
+        """Start the writer thread on its own connection to the run database."""
+        try:
+            db_file = self.db.conn.execute("PRAGMA database_list").fetchone()[2]
+        except Exception:
+            db_file = None
+        if not isinstance(db_file, str) or not db_file:
+            # In-memory or temporary database
+            return False
+        
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            args=(db_file,),
+            name="daemon-db-writer",
+            daemon=True,
+        )
+        self._writer.start()
+        return True
+    
+    def _writer_loop(self, db_file: str) -> None:
+        """
+        Write queued batches until cleanup() sends the None sentinel.
+        
+        Batches that can't be committed here, including every batch after a
+        failed connect, go to _unwritten for the main loop to write inline.
+        """
+        conn = None
+        try:
+            conn = sqlite3.connect(db_file)
+            if self.config.db_wal_mode:
+                # WAL: commits don't block the daemon's readers, and with
+                # synchronous=NORMAL they don't fsync on every transaction
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.Error as e:
+            self.logger.error(
+                f"DB writer could not open {db_file}: {e}; writing inline"
+            )
+            self._writer_failed = True
+            if conn is not None:
+                conn.close()
+            conn = None
+        
+        try:
+            stopping = False
+            while not stopping:
+                rows = self._write_queue.get()
+                if rows is None:
+                    break
+                
+                # Coalesce whatever else is already queued into one commit
+                while True:
+                    try:
+                        more = self._write_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if more is None:
+                        stopping = True
+                        break
+                    rows.extend(more)
+                
+                if conn is None or not self._write_cleanups(conn, rows):
+                    self._unwritten.put(rows)
+        finally:
+            if conn is not None:
+                conn.close()
+    
+    def _stop_writer(self) -> int:
+        """
+        Flush outstanding updates and stop the writer thread.
+        
+        Returns the number of run updates that could not be written.
+        """
+        if self._writer is not None:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+        
+        # Anything the writer handed back, or never got to if it died
+        rows = self._drain(self._unwritten) + self._drain(self._write_queue)
+        if rows and self._write_cleanups(self.db.conn, rows):
+            rows = []
+        if rows:
+            self.logger.error(
+                f"{len(rows)} run state updates were never written: "
+                + ", ".join(run_id for _, run_id in rows)
+            )
+        return len(rows)
+    
+    @staticmethod
+    def _drain(batches: queue.SimpleQueue) -> List[Tuple[str, str]]:
+        """Take every queued batch as one list of rows, skipping sentinels."""
+        rows: List[Tuple[str, str]] = []
+        while True:
             try:
-                self.db.conn.execute(
-                    """
-                    UPDATE runs
-                    SET state = 'SUCCEEDED', updated_at = ?
-                    WHERE run_id = ?
-                    """,
-                    (datetime.now(UTC).isoformat() + "Z", run_id)
-                )
-                self.db.conn.commit()
-                self.logger.info(f"Marked run {run_id} as SUCCEEDED")
-            except Exception as e:
-                self.logger.error(f"Failed to update run {run_id}: {e}")
+                batch = batches.get_nowait()
+            except queue.Empty:
+                return rows
+            if batch is not None:
+                rows.extend(batch)
+    
+    def _write_cleanups(
+        self, conn: sqlite3.Connection, rows: List[Tuple[str, str]]
+    ) -> bool:
+        """Write run state updates in a single transaction; True if committed."""
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                """
+                UPDATE runs
+                SET state = 'SUCCEEDED', updated_at = ?
+                WHERE run_id = ?
+                """,
+                rows
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            run_ids = ", ".join(run_id for _, run_id in rows)
+            self.logger.error(f"Failed to update runs {run_ids}: {e}")
+            return False
+        
+        for _, run_id in rows:
+            self.logger.info(f"Marked run {run_id} as SUCCEEDED")
+        return True
     
     def stop_run(self, run_id: str, timeout: float = 30.0) -> bool:
         """
@@ -296,37 +614,64 @@ class DaemonOrchestrator:
         Returns:
             True if stopped successfully, False otherwise
         """
-        if run_id not in self.running_processes:
-            self.logger.warning(f"Run {run_id} not found in running processes")
-            return False
+        return self.stop_runs([run_id], timeout=timeout)[run_id]
+    
+    def stop_runs(self, run_ids: List[str], timeout: float = 30.0) -> Dict[str, bool]:
+        """
+        Stop several runs gracefully, sharing one shutdown deadline.
         
-        proc = self.running_processes[run_id]
+        Every run is sent SIGTERM before any is waited on, so stopping N runs
+        takes at most ``timeout`` seconds in total rather than N times that.
+        Runs still alive at the deadline are force killed.
         
-        # Send SIGTERM for graceful shutdown
-        self.logger.info(f"Stopping run {run_id} (PID: {proc.pid})...")
-        proc.terminate()
+        Args:
+            run_ids: Run identifiers to stop
+            timeout: Timeout in seconds for graceful shutdown of all runs
         
-        try:
-            # Wait for graceful shutdown
-            proc.wait(timeout=timeout)
-            self.logger.info(f"Run {run_id} stopped gracefully")
-            del self.running_processes[run_id]
-            return True
+        Returns:
+            Mapping of run_id to True if stopped, False if it was not running
+        """
+        results: Dict[str, bool] = {}
+        stopping: Dict[str, subprocess.Popen] = {}
+        
+        for run_id in run_ids:
+            proc = self.running_processes.get(run_id)
+            if proc is None:
+                self.logger.warning(f"Run {run_id} not found in running processes")
+                results[run_id] = False
+                continue
+            
+            # Send SIGTERM for graceful shutdown
+            self.logger.info(f"Stopping run {run_id} (PID: {proc.pid})...")
+            proc.terminate()
+            stopping[run_id] = proc
         
-        except subprocess.TimeoutExpired:
-            # Force kill if graceful shutdown failed
-            self.logger.warning(f"Run {run_id} did not stop gracefully, force killing...")
-            proc.kill()
-            proc.wait()
+        deadline = time.monotonic() + timeout
+        for run_id, proc in stopping.items():
+            try:
+                # Wait for graceful shutdown within what is left of the deadline
+                proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+                self.logger.info(f"Run {run_id} stopped gracefully")
+            
+            except subprocess.TimeoutExpired:
+                # Force kill if graceful shutdown failed
+                self.logger.warning(f"Run {run_id} did not stop gracefully, force killing...")
+                proc.kill()
+                proc.wait()
+            
             del self.running_processes[run_id]
-            return True
+            self._unwatch_process(run_id)
+            results[run_id] = True
+        
+        return results
     
     def cleanup(self) -> None:
         """Cleanup all running processes before shutdown."""
         self.logger.info("Cleaning up running processes...")
         
-        for run_id in list(self.running_processes.keys()):
-            self.stop_run(run_id, timeout=10.0)
+        self.stop_runs(list(self.running_processes.keys()), timeout=10.0)
+        self._stop_writer()
+        self.close()
         
         self.logger.info("Daemon orchestrator stopped")
     
@@ -386,6 +731,12 @@ def run_daemon(
         config_path: Path to config file
         db_path: Path to SQLite database
     """
+    # The daemon's log format never shows thread or process info, so skip
+    # collecting it for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     config = load_config(config_path)
     
     db = None
@@ -393,8 +744,8 @@ def run_daemon(
         db = Database(db_path)
         db.connect()
     
-    daemon = DaemonOrchestrator(config=config, db=db)
-    daemon.start()
+    with DaemonOrchestrator(config=config, db=db) as daemon:
+        daemon.start()
 
 
 __all__ = ["DaemonOrchestrator", "DaemonConfig", "run_daemon", "load_config"]
@@ -22,14 +22,83 @@ DOC_ID: DOC-INVOKE-TOOLS-WRAPPER-001
 """
 
 from invoke import Context, Config
-from typing import Dict, Any, Optional
+from invoke.exceptions import CommandTimedOut, UnexpectedExit
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
+import functools
 import time
 from datetime import datetime, UTC
 
 from .tools import ToolResult, get_tool_profile, render_command
 
 
+# Context value types whose rendering is fully determined by (type, value)
+_CACHEABLE_VALUE_TYPES = (str, int, float, bool, type(None))
+
+_ContextKey = Tuple[Tuple[str, type, Any], ...]
+
+
+def _context_key(context: Dict[str, Any]) -> Optional[_ContextKey]:
+    """
+    Build the render-cache key for a template context, or None if uncacheable.
+    
+    Each value's type is part of the key: 1, 1.0 and True hash and compare
+    equal but render differently. Only scalar values are cached, since
+    containers could hold such look-alikes at any depth.
+    """
+    items = []
+    for key, value in sorted(context.items()):
+        if type(value) not in _CACHEABLE_VALUE_TYPES:
+            return None
+        items.append((key, type(value), value))
+    return tuple(items)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_cached(
+    tool_id: str, ctx_key: _ContextKey, cwd: str
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Render and join a tool command, memoized per (tool_id, context, cwd).
+    
+    ``cwd`` is part of the key because render_command substitutes it into
+    ``{cwd}`` templates. Call invalidate_render_cache() after reloading tool
+    profiles. The returned profile is shared; callers must not modify it.
+    """
+    return _render(tool_id, {key: value for key, _, value in ctx_key})
+
+
+def _render(tool_id: str, context: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """Render a tool command and join it into the string Invoke expects."""
+    profile = get_tool_profile(tool_id)
+    cmd_parts = render_command(tool_id, context, profile)
+    
+    # Invoke expects a string, not a list
+    if isinstance(cmd_parts, list):
+        cmd_str = " ".join(str(part) for part in cmd_parts)
+    else:
+        cmd_str = str(cmd_parts)
+    return cmd_str, profile
+
+
+@functools.lru_cache(maxsize=8)
+def _default_context(project_location: str) -> Context:
+    """
+    Shared project-config Context per project directory.
+    
+    Building a Config loads invoke.yaml from disk, so it is done once rather
+    than on every tool call. The returned Context is shared by every caller
+    in that directory and must be treated as read-only; use
+    create_invoke_context() for a Context with its own overrides.
+    """
+    return Context(config=Config(project_location=project_location))
+
+
+def invalidate_render_cache() -> None:
+    """Drop memoized command renders (e.g. after editing tool profiles)."""
+    _render_cached.cache_clear()
+
+
 def run_tool_via_invoke(
     tool_id: str,
     context: Dict[str, Any],
@@ -75,21 +144,18 @@ def run_tool_via_invoke(
         ToolResult interface. Calling code doesn't need to change when migrating
         from run_tool() to run_tool_via_invoke().
     """
-    # Create Invoke context if not provided
+    # Reuse the shared project context if none was provided
     if invoke_ctx is None:
-        config = Config(project_location=str(Path.cwd()))
-        invoke_ctx = Context(config=config)
+        invoke_ctx = _default_context(str(Path.cwd()))
     
-    # Get tool profile and render command
-    profile = get_tool_profile(tool_id)
-    cmd_parts = render_command(tool_id, context, profile)
-    
-    # Join command parts into a single string for Invoke
-    # (Invoke expects a string, not a list)
-    if isinstance(cmd_parts, list):
-        cmd_str = " ".join(str(part) for part in cmd_parts)
+    # Get tool profile and rendered command string; repeated calls with the
+    # same scalar-valued context reuse the memoized render
+    ctx_key = _context_key(context)
+    if ctx_key is None:
+        # Container values (lists, dicts): render uncached
+        cmd_str, profile = _render(tool_id, context)
     else:
-        cmd_str = str(cmd_parts)
+        cmd_str, profile = _render_cached(tool_id, ctx_key, str(Path.cwd()))
     
     # Determine timeout (override > profile > default)
     effective_timeout = timeout or profile.get("timeout", 300)
@@ -109,44 +175,57 @@ def run_tool_via_invoke(
             pty=False,  # Windows compatibility
             encoding='utf-8',  # Explicit encoding
         )
-        
-        completed_at = datetime.now(UTC).isoformat()
-        duration_sec = time.time() - start_time
-        
-        # Convert Invoke Result to ToolResult
-        return ToolResult(
-            tool_id=tool_id,
-            command_line=cmd_str,
-            exit_code=result.return_code if result else -1,
-            stdout=result.stdout or "" if result else "",
-            stderr=result.stderr or "" if result else "",
-            timed_out=False,  # Invoke raises exception on timeout
-            started_at=started_at,
-            completed_at=completed_at,
-            duration_sec=duration_sec,
-            success=(result.return_code == 0) if result else False
-        )
+    
+    except CommandTimedOut as e:
+        # Raised on timeout regardless of warn
+        return _failed_result(tool_id, cmd_str, started_at, start_time, str(e), True)
+    
+    except UnexpectedExit as e:
+        # Only raised with warn=False; the command's exit status still applies
+        result = e.result
     
     except Exception as e:
-        # Handle timeouts and other errors
-        completed_at = datetime.now(UTC).isoformat()
-        duration_sec = time.time() - start_time
-        
-        # Check if it was a timeout
-        is_timeout = "timeout" in str(e).lower() or duration_sec >= effective_timeout
-        
-        return ToolResult(
-            tool_id=tool_id,
-            command_line=cmd_str,
-            exit_code=-1,
-            stdout="",
-            stderr=str(e),
-            timed_out=is_timeout,
-            started_at=started_at,
-            completed_at=completed_at,
-            duration_sec=duration_sec,
-            success=False
-        )
+        return _failed_result(tool_id, cmd_str, started_at, start_time, str(e), False)
+    
+    completed_at = datetime.now(UTC).isoformat()
+    duration_sec = time.time() - start_time
+    
+    # Convert Invoke Result to ToolResult
+    return ToolResult(
+        tool_id=tool_id,
+        command_line=cmd_str,
+        exit_code=result.return_code if result else -1,
+        stdout=result.stdout or "" if result else "",
+        stderr=result.stderr or "" if result else "",
+        timed_out=False,  # Invoke raises CommandTimedOut on timeout
+        started_at=started_at,
+        completed_at=completed_at,
+        duration_sec=duration_sec,
+        success=(result.return_code == 0) if result else False
+    )
+
+
+def _failed_result(
+    tool_id: str,
+    cmd_str: str,
+    started_at: str,
+    start_time: float,
+    error: str,
+    timed_out: bool,
+) -> ToolResult:
+    """Build the ToolResult for a run that raised instead of returning."""
+    return ToolResult(
+        tool_id=tool_id,
+        command_line=cmd_str,
+        exit_code=-1,
+        stdout="",
+        stderr=error,
+        timed_out=timed_out,
+        started_at=started_at,
+        completed_at=datetime.now(UTC).isoformat(),
+        duration_sec=time.time() - start_time,
+        success=False
+    )
 
 
 def create_invoke_context(config_overrides: Optional[Dict[str, Any]] = None) -> Context:
@@ -181,11 +260,10 @@ def create_invoke_context(config_overrides: Optional[Dict[str, Any]] = None) ->
 # Convenience aliases for common patterns
 def run_tool_safe(tool_id: str, context: Dict[str, Any], **kwargs) -> ToolResult:
     """
-    Run tool with automatic context creation (convenience wrapper).
+    Run tool with a shared project context (convenience wrapper).
     
-    Equivalent to:
-        >>> ctx = create_invoke_context()
-        >>> run_tool_via_invoke(tool_id, context, ctx, **kwargs)
+    Like create_invoke_context() + run_tool_via_invoke(), except the context
+    is built once per working directory and reused across calls.
     
     Args:
         tool_id: Tool identifier
@@ -195,5 +273,5 @@ def run_tool_safe(tool_id: str, context: Dict[str, Any], **kwargs) -> ToolResult
     Returns:
         ToolResult
     """
-    ctx = create_invoke_context()
+    ctx = _default_context(str(Path.cwd()))
     return run_tool_via_invoke(tool_id, context, ctx, **kwargs)
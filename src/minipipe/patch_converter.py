@@ -5,13 +5,130 @@ Standardizes patches from different tools (aider, custom tools)
 
 # DOC_ID: DOC-CORE-ENGINE-PATCH-CONVERTER-152
 
+import io
+import os
 import re
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Dict
-
-
-@dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+_GIT_DIFF_MARKER = "diff --git"
+
+# "--- old" / "+++ new" file header lines, each preceded by "\n"
+_FILE_HEADER_RE = re.compile(r"\n(---|\+\+\+) ([^\n]*)")
+
+# Line boundaries str.splitlines() recognises besides "\n"
+_OTHER_LINE_BREAK_RE = re.compile("[\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+
+# convert_many only fans out to worker processes once this much tool
+# output is queued; below it, pickling the outputs costs more than it saves
+_PARALLEL_MIN_CHARS = 4 * 1024 * 1024
+
+
+def _unified_diff_chunks(output: str) -> List[str]:
+    """
+    Split out "--- ... +++ ..." regions.
+
+    Each chunk runs from a "---" to the first "+++" line after it, then on
+    to the next "---" (or end of output). Plain str.find scans keep this
+    linear on large tool outputs.
+    """
+    chunks = []
+    pos = 0
+    while True:
+        start = output.find("---", pos)
+        if start == -1:
+            break
+        header = output.find("\n+++", start + 3)
+        if header == -1:
+            break
+        end = output.find("---", header + 4)
+        if end == -1:
+            end = len(output)
+        chunks.append(output[start:end])
+        pos = end
+    return chunks
+
+
+def _read_lines(path: str, block_size: int = 1 << 20) -> Iterator[str]:
+    """Yield a text file's lines split on "\n" only, terminators kept."""
+    with open(path, encoding="utf-8", errors="replace", newline="") as fh:
+        pending = ""
+        for block in iter(lambda: fh.read(block_size), ""):
+            lines = (pending + block).split("\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line + "\n"
+        if pending:
+            yield pending
+
+
+def _extract_git_diff_lines(lines: Iterable[str]) -> Tuple[str, int]:
+    """
+    Streaming form of PatchConverter.extract_git_diff.
+
+    ``lines`` must be split on "\n" only, keeping terminators. Only diff text
+    is retained, so large tool logs never have to be held in memory whole.
+
+    Returns:
+        (diff, number of characters read)
+    """
+    marker = _GIT_DIFF_MARKER
+    git_diff = None  # StringIO once the first marker has been seen
+    chunks: List[str] = []  # "--- ... +++ ..." fallback chunks
+    pieces: List[str] = []  # fallback chunk being collected
+    state = "seek"  # fallback: seek "---" -> "header" "+++" line -> "body"
+    total = 0
+
+    for line in lines:
+        total += len(line)
+        if git_diff is not None:
+            git_diff.write(line.replace(marker, "\n" + marker))
+            continue
+
+        start = line.find(marker)
+        if start != -1:
+            # Git diffs win over the fallback; drop what it collected
+            git_diff = io.StringIO()
+            rest = line[start + len(marker) :]
+            git_diff.write(marker + rest.replace(marker, "\n" + marker))
+            chunks, pieces = [], []
+            continue
+
+        pos = 0
+        while True:
+            if state == "seek":
+                start = line.find("---", pos)
+                if start != -1:
+                    # The "+++" header can only be on a later line
+                    pieces = [line[start:]]
+                    state = "header"
+                break
+
+            if state == "header" and not line.startswith("+++"):
+                pieces.append(line)
+                break
+
+            if state == "header":
+                state = "body"
+                pos = 3  # a "---" inside the "+++" marker doesn't count
+            end = line.find("---", pos)
+            if end == -1:
+                pieces.append(line)
+                break
+            pieces.append(line[:end])
+            chunks.append("".join(pieces))
+            state, pos = "seek", end
+
+    if git_diff is not None:
+        return git_diff.getvalue(), total
+    if state == "body":
+        chunks.append("".join(pieces))
+    return "\n".join(chunks), total
+
+
+@dataclass(slots=True)
 class DiffStats:
     """Statistics about a patch/diff."""
 
@@ -60,14 +177,45 @@ class PatchConverter:
     def __init__(self):
         self.patch_count = 0
 
-    def convert_aider_patch(self, tool_result: Dict) -> UnifiedPatch:
-        """Convert aider output to unified patch."""
+    def _next_patch_id(self, now: Optional[datetime]) -> Tuple[str, str]:
+        """Return (patch_id, created_at) for the next patch, stamped at ``now``."""
+        if now is None:
+            now = datetime.now(UTC)
+        created_at = now.isoformat()
+        # YYYYmmdd-HHMMSS sliced out of "YYYY-mm-ddTHH:MM:SS...", saving a
+        # strftime call per patch
+        stamp = (
+            f"{created_at[0:4]}{created_at[5:7]}{created_at[8:10]}-"
+            f"{created_at[11:13]}{created_at[14:16]}{created_at[17:19]}"
+        )
         self.patch_count += 1
-        patch_id = f"patch-{datetime.now(UTC).strftime('%Y%m%d-%H%M%S')}-{self.patch_count:04d}"
+        return f"patch-{stamp}-{self.patch_count:04d}", created_at
+
+    def convert_batch(self, tool_results: Iterable[Dict]) -> List[UnifiedPatch]:
+        """Convert several aider outputs, stamping them all with one timestamp."""
+        now = datetime.now(UTC)
+        return [self.convert_aider_patch(result, now=now) for result in tool_results]
+
+    def convert_aider_patch(
+        self, tool_result: Dict, now: Optional[datetime] = None
+    ) -> UnifiedPatch:
+        """
+        Convert aider output to unified patch.
+
+        The output is read from ``tool_result["output"]``, or streamed from
+        the file at ``tool_result["output_path"]`` (e.g. a run's stdout log)
+        when no in-memory output is given.
+        """
+        patch_id, created_at = self._next_patch_id(now)
 
         # Extract git diff from aider output
-        content = tool_result.get("output", "")
-        git_diff = self.extract_git_diff(content)
+        if "output" not in tool_result and "output_path" in tool_result:
+            lines = _read_lines(tool_result["output_path"])
+            git_diff, output_length = _extract_git_diff_lines(lines)
+        else:
+            content = tool_result.get("output", "")
+            git_diff = self.extract_git_diff(content)
+            output_length = len(content)
 
         # Compute diff stats
         diff_stats = self.compute_diff_stats(git_diff)
@@ -77,62 +225,106 @@ class PatchConverter:
             workstream_id=tool_result.get("workstream_id", "unknown"),
             content=git_diff,
             status="created",
-            created_at=datetime.now(UTC).isoformat(),
-            metadata={"tool": "aider", "original_output_length": len(content)},
+            created_at=created_at,
+            metadata={"tool": "aider", "original_output_length": output_length},
             diff_stats=diff_stats,
         )
 
+    def convert_many(self, tool_results: List[Dict]) -> List[UnifiedPatch]:
+        """
+        Convert generic tool outputs, in order, with one timestamp.
+
+        Each result carries ``tool_id``, ``output`` and optionally
+        ``workstream_id``. Large batches are analysed in worker processes;
+        patch ids are still assigned here, in input order.
+        """
+        outputs = [result.get("output", "") for result in tool_results]
+
+        if len(outputs) < 2 or sum(map(len, outputs)) < _PARALLEL_MIN_CHARS:
+            analysed = [_analyse_tool_output(output) for output in outputs]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            workers = min(len(outputs), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                analysed = list(executor.map(_analyse_tool_output, outputs))
+
+        now = datetime.now(UTC)
+        return [
+            self._tool_patch(
+                result["tool_id"],
+                output,
+                result.get("workstream_id", "unknown"),
+                now,
+                git_diff,
+                diff_stats,
+            )
+            for result, output, (git_diff, diff_stats) in zip(
+                tool_results, outputs, analysed
+            )
+        ]
+
     def convert_tool_patch(
-        self, tool_id: str, output: str, workstream_id: str = "unknown"
+        self,
+        tool_id: str,
+        output: str,
+        workstream_id: str = "unknown",
+        now: Optional[datetime] = None,
     ) -> UnifiedPatch:
         """Convert generic tool output to unified patch."""
-        self.patch_count += 1
-        patch_id = f"patch-{datetime.now(UTC).strftime('%Y%m%d-%H%M%S')}-{self.patch_count:04d}"
-
         git_diff = self.extract_git_diff(output)
-        content = git_diff if git_diff else output
+        diff_stats = self.compute_diff_stats(git_diff if git_diff else output)
+        return self._tool_patch(
+            tool_id, output, workstream_id, now, git_diff, diff_stats
+        )
 
-        # Compute diff stats
-        diff_stats = self.compute_diff_stats(content)
+    def _tool_patch(
+        self,
+        tool_id: str,
+        output: str,
+        workstream_id: str,
+        now: Optional[datetime],
+        git_diff: str,
+        diff_stats: DiffStats,
+    ) -> UnifiedPatch:
+        """Assemble a generic tool patch from its analysed output."""
+        patch_id, created_at = self._next_patch_id(now)
+        content = git_diff if git_diff else output
 
         return UnifiedPatch(
             patch_id=patch_id,
             workstream_id=workstream_id,
             content=content,
             status="created",
-            created_at=datetime.now(UTC).isoformat(),
+            created_at=created_at,
             metadata={"tool": tool_id, "has_git_diff": bool(git_diff)},
             diff_stats=diff_stats,
         )
 
+    def extract_git_diff_file(self, path: str) -> str:
+        """Extract git diff from a tool output file, streaming it line by line."""
+        return _extract_git_diff_lines(_read_lines(path))[0]
+
     def extract_git_diff(self, output: str) -> str:
         """Extract git diff from tool output."""
-        # Look for git diff markers
-        diff_pattern = r"diff --git.*?(?=diff --git|\Z)"
-        matches = re.findall(diff_pattern, output, re.DOTALL)
-
-        if matches:
-            return "\n".join(matches)
+        # Everything from the first "diff --git" marker to the end, one
+        # chunk per marker
+        start = output.find(_GIT_DIFF_MARKER)
+        if start != -1:
+            chunks = output[start:].split(_GIT_DIFF_MARKER)
+            return "\n".join(_GIT_DIFF_MARKER + chunk for chunk in chunks[1:])
 
         # Fallback: look for unified diff format
-        unified_pattern = r"---.*?\n\+\+\+.*?(?=---|\Z)"
-        matches = re.findall(unified_pattern, output, re.DOTALL)
-
-        if matches:
-            return "\n".join(matches)
-
-        return ""
+        return "\n".join(_unified_diff_chunks(output))
 
     def validate_unified_diff(self, diff: str) -> bool:
         """Validate that string is a valid unified diff."""
         if not diff:
             return False
 
-        # Check for diff markers
-        has_header = "---" in diff and "+++" in diff
-        has_hunks = "@@" in diff
-
-        return has_header or has_hunks
+        # Hunk markers first: real diffs have one near the top, so the scan
+        # stops early; "---"/"+++" headers are only searched if it is absent
+        return "@@" in diff or ("---" in diff and "+++" in diff)
 
     def compute_diff_stats(self, patch_content: str) -> DiffStats:
         """
@@ -151,29 +343,41 @@ class PatchConverter:
         if not patch_content:
             return stats
 
+        # One "\n" before every line, so line prefixes can be counted with
+        # C-level str.count. Normalize only if other line breaks (\r\n,
+        # \r, ...) that splitlines() honours are present.
+        if _OTHER_LINE_BREAK_RE.search(patch_content):
+            text = "\n" + "\n".join(patch_content.splitlines())
+        else:
+            text = "\n" + patch_content
+
+        # "+++"/"---" lines are file headers (or look like them), not changes
+        stats.lines_added = text.count("\n+") - text.count("\n+++")
+        stats.lines_deleted = text.count("\n-") - text.count("\n---")
+
+        # Only header lines need Python-level work
         current_file_old = None
-        current_file_new = None
-
-        for line in patch_content.splitlines():
-            # Track file changes
-            if line.startswith("--- "):
-                current_file_old = line[4:].strip()
-            elif line.startswith("+++ "):
-                current_file_new = line[4:].strip()
-
-                # Determine file status
-                if current_file_old and current_file_new:
-                    if current_file_old == "/dev/null":
-                        stats.files_added += 1
-                    elif current_file_new == "/dev/null":
-                        stats.files_deleted += 1
-                    else:
-                        stats.files_modified += 1
-
-            # Count line changes (skip file headers and hunk headers)
-            elif line.startswith("+") and not line.startswith("+++"):
-                stats.lines_added += 1
-            elif line.startswith("-") and not line.startswith("---"):
-                stats.lines_deleted += 1
+        for match in _FILE_HEADER_RE.finditer(text):
+            name = match.group(2).strip()
+            if match.group(1) == "---":
+                current_file_old = name
+            elif current_file_old and name:
+                if current_file_old == "/dev/null":
+                    stats.files_added += 1
+                elif name == "/dev/null":
+                    stats.files_deleted += 1
+                else:
+                    stats.files_modified += 1
 
         return stats
+
+
+def _analyse_tool_output(output: str) -> Tuple[str, DiffStats]:
+    """Extract and measure the diff in generic tool output (worker entry point)."""
+    git_diff = _ANALYSER.extract_git_diff(output)
+    return git_diff, _ANALYSER.compute_diff_stats(git_diff if git_diff else output)
+
+
+# Stateless helper instance; extract_git_diff/compute_diff_stats never touch
+# patch_count
+_ANALYSER = PatchConverter()
@@ -7,15 +7,30 @@ Integrated with UET tool profiles for contract-compliant routing.
 
 # DOC_ID: DOC-CORE-ENGINE-ROUTER-157
 
+import heapq
+import itertools
 import json
 import logging
-from collections import defaultdict
-from datetime import datetime, timezone
+import math
+import os
+import sys
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Mapping, Optional, Protocol, Tuple
 
 from contracts.path_registry import resolve_path
-from contracts.uet_tool_adapters import get_tool_profile, load_tool_profiles
+from contracts.uet_tool_adapters import get_tool_profile
+
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
 
 try:
     from core.events.event_bus import EventBus, EventType
@@ -31,6 +46,60 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Routing decisions kept in memory unless config sets "decision_log_max"
+DEFAULT_DECISION_LOG_MAX = 10_000
+
+# Distinct (task_kind, risk_tier, complexity) keys kept by _matching_rules
+_ROUTE_CACHE_MAX = 1024
+
+# Marks a routing criterion the rule leaves unconstrained
+_ANY = object()
+
+
+def _as_lookup(values: Any) -> Any:
+    """Return list criteria as a frozenset; other values are used as given"""
+    if isinstance(values, (list, tuple)):
+        try:
+            return frozenset(values)
+        except TypeError:
+            pass
+    return values
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file from its raw bytes, using orjson when installed"""
+    raw = path.read_bytes()
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_EMPTY_TOOL_METRICS = {
+    "success_count": 0,
+    "failure_count": 0,
+    "total_latency_ms": 0.0,
+    "call_count": 0,
+}
+
+# Fresh per-tool metrics record; a module function (not a lambda) so stores
+# stay picklable
+_new_tool_metrics = _EMPTY_TOOL_METRICS.copy
+
+
+def _dumps_line(record: Any) -> bytes:
+    """Serialize one compact JSON line, newline included"""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write ``data`` as indented JSON, using orjson when installed"""
+    if _ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
 
 class RoutingStateStore(Protocol):
     """Protocol for routing state persistence"""
@@ -47,90 +116,193 @@ class RoutingStateStore(Protocol):
     def flush(self) -> None:
         ...
 
-    def mark_dirty(self) -> None:
+    def mark_dirty(self, tool_id: Optional[str] = None) -> None:
         ...
 
 
 class FileBackedStateStore:
-    """File-based implementation of routing state store with persistence"""
+    """
+    File-based implementation of routing state store with persistence
 
-    def __init__(self, state_file: str = ".state/router_state.json", auto_save_interval: int = 10):
+    Checkpoints append the round-robin indices and tool metrics changed since
+    the last write to a JSONL journal next to the state file. flush(), or a
+    journal longer than compact_after lines, folds everything back into the
+    base state file and truncates the journal. Loading replays the journal
+    over the base file.
+    """
+
+    def __init__(
+        self,
+        state_file: str = ".state/router_state.json",
+        auto_save_interval: int = 10,
+        auto_save_seconds: float = 2.0,
+        compact_after: int = 1000,
+    ):
         self.state_file = Path(state_file)
+        self.journal_file = self.state_file.with_suffix(".jsonl")
         self._dirty = False
         self.auto_save_interval = auto_save_interval
+        self.auto_save_seconds = auto_save_seconds
+        self.compact_after = compact_after
         self._update_count = 0
+        self._last_save_ts = time.monotonic()
+        self._journal_lines = 0
+        # Keys changed since the last checkpoint
+        self._dirty_rules: set = set()
+        self._touched_tools: set = set()
+        # Set by mark_dirty() without a tool_id: changes we can't journal
+        self._needs_rewrite = False
         self._load_state()
 
     def _load_state(self):
-        """Load state from file if it exists"""
+        """Load state from file if it exists, then replay the journal"""
         if self.state_file.exists():
             try:
-                data = json.loads(self.state_file.read_text(encoding="utf-8"))
+                data = _read_json(self.state_file)
                 self._round_robin_indices = data.get("round_robin", {})
                 self._tool_metrics = defaultdict(
-                    lambda: {
-                        "success_count": 0,
-                        "failure_count": 0,
-                        "total_latency_ms": 0.0,
-                        "call_count": 0,
-                    },
-                    data.get("metrics", {}),
+                    _new_tool_metrics, data.get("metrics", {})
                 )
             except (json.JSONDecodeError, IOError) as e:
                 logger.warning(f"Failed to load router state: {e}, starting fresh")
                 self._init_empty_state()
         else:
             self._init_empty_state()
+        self._replay_journal()
+
+    def _replay_journal(self):
+        """Apply journal records written since the last compaction"""
+        try:
+            raw = self.journal_file.read_bytes()
+        except FileNotFoundError:
+            return
+        except IOError as e:
+            logger.warning(f"Failed to read router state journal: {e}")
+            return
+
+        for line in raw.splitlines():
+            try:
+                record = orjson.loads(line) if _ORJSON_AVAILABLE else json.loads(line)
+            except ValueError:
+                # A torn final line from an interrupted append
+                continue
+            self._journal_lines += 1
+            if record.get("op") == "rr":
+                self._round_robin_indices[record["rule"]] = record["i"]
+            elif record.get("op") == "metrics":
+                self._tool_metrics[record["tool"]] = record["m"]
 
     def _init_empty_state(self):
         """Initialize empty state"""
         self._round_robin_indices: Dict[str, int] = {}
-        self._tool_metrics: Dict[str, Dict[str, Any]] = defaultdict(
-            lambda: {
-                "success_count": 0,
-                "failure_count": 0,
-                "total_latency_ms": 0.0,
-                "call_count": 0,
-            }
-        )
+        self._tool_metrics: Dict[str, Dict[str, Any]] = defaultdict(_new_tool_metrics)
 
     def _save_state(self):
-        """Persist state to file (only if dirty)"""
+        """Checkpoint changed entries to the journal (only if dirty)"""
         if not self._dirty:
             return
+        if self._needs_rewrite or not (self._dirty_rules or self._touched_tools):
+            # Dirty without known keys: only a full rewrite is safe
+            self._compact()
+            return
+
+        records = [
+            {"op": "rr", "rule": rule_id, "i": self._round_robin_indices[rule_id]}
+            for rule_id in self._dirty_rules
+        ]
+        records.extend(
+            {"op": "metrics", "tool": tool_id, "m": self._tool_metrics[tool_id]}
+            for tool_id in self._touched_tools
+        )
+        try:
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_file, "ab") as f:
+                f.write(b"".join(_dumps_line(record) for record in records))
+        except IOError as e:
+            logger.error(f"Failed to save router state: {e}")
+            return
+
+        self._journal_lines += len(records)
+        self._mark_saved()
+        if self._journal_lines >= self.compact_after:
+            self._compact()
+
+    def _compact(self):
+        """
+        Rewrite the base state file and drop the journal
+
+        Writes a sibling temp file and swaps it in with os.replace(), so a
+        crash mid-write leaves the previous state file intact. Journal
+        records only set values, so replaying one that survived a crash
+        after the swap is harmless.
+        """
+        tmp_file = self.state_file.with_name(self.state_file.name + ".tmp")
         try:
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
             data = {
                 "round_robin": self._round_robin_indices,
                 "metrics": dict(self._tool_metrics),
             }
-            self.state_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
-            self._dirty = False
+            _write_json(tmp_file, data)
+            os.replace(tmp_file, self.state_file)
+            self.journal_file.unlink(missing_ok=True)
         except IOError as e:
             logger.error(f"Failed to save router state: {e}")
+            return
+
+        self._journal_lines = 0
+        self._mark_saved()
+
+    def _mark_saved(self):
+        self._dirty = False
+        self._needs_rewrite = False
+        self._dirty_rules.clear()
+        self._touched_tools.clear()
+        self._update_count = 0
+        self._last_save_ts = time.monotonic()
 
     def flush(self):
-        """Force write state to disk"""
-        self._save_state()
+        """Force write state to disk, folding the journal into the state file"""
+        if self._dirty or self._journal_lines:
+            self._compact()
 
     def get_round_robin_index(self, rule_id: str) -> int:
         return self._round_robin_indices.get(rule_id, 0)
 
     def set_round_robin_index(self, rule_id: str, index: int) -> None:
         self._round_robin_indices[rule_id] = index
+        self._dirty_rules.add(rule_id)
+        self._note_update()
+
+    def _note_update(self):
         self._dirty = True
         self._update_count += 1
-        
-        if self._update_count >= self.auto_save_interval:
+
+        # Save every auto_save_interval updates, or sooner once
+        # auto_save_seconds have passed since the last write
+        if (
+            self._update_count >= self.auto_save_interval
+            or time.monotonic() - self._last_save_ts >= self.auto_save_seconds
+        ):
             self._save_state()
-            self._update_count = 0
 
     def get_tool_metrics(self, tool_id: str) -> Dict[str, Any]:
         return self._tool_metrics[tool_id]
 
-    def mark_dirty(self):
-        """Mark state as dirty (for metric updates)"""
-        self._dirty = True
+    def mark_dirty(self, tool_id: Optional[str] = None):
+        """
+        Mark state as dirty (for metric updates)
+
+        Callers update the dict from get_tool_metrics() in place, then pass
+        its tool_id here so the next checkpoint journals just that tool.
+        Without a tool_id the next save rewrites the whole state file.
+        """
+        if tool_id is None:
+            self._dirty = True
+            self._needs_rewrite = True
+            return
+        self._touched_tools.add(tool_id)
+        self._note_update()
 
 
 class InMemoryStateStore:
@@ -138,14 +310,7 @@ class InMemoryStateStore:
 
     def __init__(self):
         self._round_robin_indices: Dict[str, int] = defaultdict(int)
-        self._tool_metrics: Dict[str, Dict[str, Any]] = defaultdict(
-            lambda: {
-                "success_count": 0,
-                "failure_count": 0,
-                "total_latency_ms": 0.0,
-                "call_count": 0,
-            }
-        )
+        self._tool_metrics: Dict[str, Dict[str, Any]] = defaultdict(_new_tool_metrics)
 
     def get_round_robin_index(self, rule_id: str) -> int:
         return self._round_robin_indices[rule_id]
@@ -160,14 +325,58 @@ class InMemoryStateStore:
         """No-op for in-memory store"""
         pass
 
-    def mark_dirty(self):
+    def mark_dirty(self, tool_id: Optional[str] = None):
         """No-op for in-memory store"""
         pass
 
 
+def _weighted_schedule(
+    candidates: List[str], weights: Dict[str, int]
+) -> Tuple[str, ...]:
+    """
+    Expand per-tool weights into one interleaved weighted round-robin cycle
+
+    Uses the LVS interleaved WRR scheme: weights 4, 3, 2 for a, b, c give
+    a a b a b c a b c. Candidates missing from weights count as 1; those
+    with weight <= 0 are left out.
+    """
+    weighted = [(tool_id, int(weights.get(tool_id, 1))) for tool_id in candidates]
+    weighted = [(tool_id, weight) for tool_id, weight in weighted if weight > 0]
+    if not weighted:
+        return ()
+
+    step = math.gcd(*(weight for _, weight in weighted))
+    schedule = []
+    current = max(weight for _, weight in weighted)
+    while current > 0:
+        schedule.extend(tool_id for tool_id, weight in weighted if weight >= current)
+        current -= step
+    return tuple(schedule)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern plain strings so repeated ids share one object across decisions"""
+    return sys.intern(value) if type(value) is str else value
+
+
 class RoutingDecision:
     """Records a routing decision for observability"""
 
+    __slots__ = (
+        "task_kind",
+        "selected_tool",
+        "strategy",
+        "candidates",
+        "rule_id",
+        "metadata",
+        "_ts_ns",
+        "task_id",
+        "run_id",
+    )
+
     def __init__(
         self,
         task_kind: str,
@@ -179,15 +388,25 @@ class RoutingDecision:
         task_id: Optional[str] = None,
         run_id: Optional[str] = None,
     ):
-        self.task_kind = task_kind
-        self.selected_tool = selected_tool
-        self.strategy = strategy
+        self.task_kind = _intern(task_kind)
+        self.selected_tool = _intern(selected_tool)
+        self.strategy = _intern(strategy)
         self.candidates = candidates
-        self.rule_id = rule_id
+        self.rule_id = _intern(rule_id)
         self.metadata = metadata or {}
-        self.timestamp = datetime.now(timezone.utc).isoformat()
+        # Formatted on demand; most decisions are never serialized
+        self._ts_ns = time.time_ns()
         self.task_id = task_id
-        self.run_id = run_id
+        self.run_id = _intern(run_id)
+
+    @property
+    def created_at(self) -> datetime:
+        """When the decision was made, as an aware UTC datetime"""
+        return _EPOCH + timedelta(microseconds=self._ts_ns // 1000)
+
+    @property
+    def timestamp(self) -> str:
+        return self.created_at.isoformat()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -228,24 +447,47 @@ class TaskRouter:
         self.config = self._load_config()
         self.apps = self.config.get("apps", {})
         self.routing_rules = self.config.get("routing", {}).get("rules", [])
+        self._rules_by_task_kind, self._wildcard_rules = self._index_rules(
+            self.routing_rules
+        )
+        self._route_cache: Dict[Tuple, List[Dict[str, Any]]] = {}
+        # Kept off the rule dicts so self.config stays as read from disk
+        self._wrr_schedules: Dict[str, Tuple[str, ...]] = {
+            rule["id"]: _weighted_schedule(
+                rule.get("select_from", []), rule.get("weights", {})
+            )
+            for rule in self.routing_rules
+            if rule.get("strategy") == "weighted_round_robin" and rule.get("id")
+        }
+        self._capable_by_kind, self._domains_by_tool = self._index_capabilities(
+            self.apps
+        )
         self.defaults = self.config.get("defaults", {})
+        self._resolve_tool_limits()
         self.state_store = state_store or InMemoryStateStore()
-        self.decision_log: List[RoutingDecision] = []
+        # Oldest decisions are dropped once the log is full
+        self.decision_log: Deque[RoutingDecision] = deque(
+            maxlen=self.config.get("decision_log_max", DEFAULT_DECISION_LOG_MAX)
+        )
         self.event_bus = event_bus
         self.decision_registry = decision_registry
+        # Registry decision ids: router start time plus a per-router sequence,
+        # unique even for many routes of one task within a second
+        self._start_ns = time.time_ns()
+        self._decision_seq = itertools.count()
 
         # Load UET tool profiles
         self.tool_profiles_path = tool_profiles_path or "config/tool_profiles.json"
-        self.tool_profiles = self._load_tool_profiles()
-        self.operation_kind_map = self._build_operation_kind_map()
+        profiles_config = self._read_tool_profiles_config()
+        self.tool_profiles = self._load_tool_profiles(profiles_config)
+        self.operation_kind_map = self._build_operation_kind_map(profiles_config)
 
     def _load_config(self) -> Dict[str, Any]:
         """Load and parse router configuration"""
         if not self.config_path.exists():
             raise FileNotFoundError(f"Router config not found: {self.config_path}")
 
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = _read_json(self.config_path)
 
         # Validate required fields
         if "apps" not in config:
@@ -255,14 +497,10 @@ class TaskRouter:
 
         return config
 
-    def _load_tool_profiles(self) -> Dict[str, Any]:
-        """Load UET tool profiles from configuration."""
+    def _read_tool_profiles_config(self) -> Dict[str, Any]:
+        """Parse tool_profiles.json once for both profiles and operation_kind map."""
         try:
-            profiles = load_tool_profiles(self.tool_profiles_path)
-            logger.info(
-                f"Loaded {len(profiles)} tool profiles from {self.tool_profiles_path}"
-            )
-            return profiles
+            return _read_json(Path(self.tool_profiles_path))
         except FileNotFoundError:
             logger.warning(
                 f"Tool profiles not found at {self.tool_profiles_path}, using empty profiles"
@@ -272,22 +510,19 @@ class TaskRouter:
             logger.error(f"Failed to load tool profiles: {e}, using empty profiles")
             return {}
 
-    def _build_operation_kind_map(self) -> Dict[str, str]:
-        """Build mapping from operation_kind to tool_id from profiles."""
-        op_map = {}
-
-        # Load from tool profiles if available
-        try:
-            profiles_config_path = Path(self.tool_profiles_path)
-            if profiles_config_path.exists():
-                with open(profiles_config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    routing_rules = config.get("routing_rules", {})
-                    op_map = routing_rules.get("operation_kind_to_tool", {})
-        except Exception as e:
-            logger.warning(f"Failed to load operation_kind mapping: {e}")
+    def _load_tool_profiles(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract UET tool profiles from the parsed profiles config."""
+        profiles = config.get("profiles", {})
+        if config:
+            logger.info(
+                f"Loaded {len(profiles)} tool profiles from {self.tool_profiles_path}"
+            )
+        return profiles
 
-        return op_map
+    def _build_operation_kind_map(self, config: Dict[str, Any]) -> Dict[str, str]:
+        """Build mapping from operation_kind to tool_id from the profiles config."""
+        routing_rules = config.get("routing_rules", {})
+        return routing_rules.get("operation_kind_to_tool", {})
 
     def route_by_operation_kind(self, operation_kind: str) -> Optional[str]:
         """
@@ -309,10 +544,12 @@ class TaskRouter:
         tool_id = self.operation_kind_map.get(operation_kind)
 
         if tool_id:
-            logger.info(f"Routed operation_kind '{operation_kind}' to tool '{tool_id}'")
+            logger.info(
+                "Routed operation_kind '%s' to tool '%s'", operation_kind, tool_id
+            )
         else:
             logger.warning(
-                f"No tool mapping found for operation_kind '{operation_kind}'"
+                "No tool mapping found for operation_kind '%s'", operation_kind
             )
 
         return tool_id
@@ -350,66 +587,73 @@ class TaskRouter:
         Returns:
             tool_id: ID of selected tool, or None if no match
         """
-        # Try to match routing rules first
-        for rule in self.routing_rules:
-            if self._matches_rule(rule, task_kind, risk_tier, complexity):
-                candidates = rule.get("select_from", [])
-                strategy = rule.get("strategy", "fixed")
-                rule_id = rule.get("id")
-
-                if candidates:
-                    selected = self._apply_strategy(candidates, strategy, rule_id)
-                    if selected:
-                        # Log decision
-                        decision = RoutingDecision(
-                            task_kind=task_kind,
-                            selected_tool=selected,
-                            strategy=strategy,
-                            candidates=candidates,
-                            rule_id=rule_id,
-                            metadata={
-                                "risk_tier": risk_tier,
-                                "complexity": complexity,
-                                "domain": domain,
-                            },
-                            task_id=task_id,
-                            run_id=run_id,
-                        )
-                        self.decision_log.append(decision)
-                        logger.info(
-                            f"Routed {task_kind} to {selected} via rule {rule_id} (strategy: {strategy})"
-                        )
+        # Try to match routing rules first (memoized per task attributes)
+        for rule in self._matching_rules(task_kind, risk_tier, complexity):
+            candidates = rule.get("select_from", [])
+            strategy = rule.get("strategy", "fixed")
+            rule_id = rule.get("id")
+
+            if candidates:
+                selected = self._apply_strategy(candidates, strategy, rule_id)
+                if selected:
+                    # Log decision
+                    decision = RoutingDecision(
+                        task_kind=task_kind,
+                        selected_tool=selected,
+                        strategy=strategy,
+                        candidates=candidates,
+                        rule_id=rule_id,
+                        metadata={
+                            "risk_tier": risk_tier,
+                            "complexity": complexity,
+                            "domain": domain,
+                        },
+                        task_id=task_id,
+                        run_id=run_id,
+                    )
+                    self.decision_log.append(decision)
+                    logger.info(
+                        "Routed %s to %s via rule %s (strategy: %s)",
+                        task_kind,
+                        selected,
+                        rule_id,
+                        strategy,
+                    )
+                    if self.event_bus:
                         self._emit_routing_event(
-                            EventType.ROUTING_COMPLETE,
+                            EventType.ROUTING_COMPLETE if EventType else "ROUTING_COMPLETE",
                             run_id,
                             task_id,
                             decision.to_dict(),
                         )
 
-                        # Log to decision registry
-                        if self.decision_registry:
-                            reg_decision = Decision(
-                                decision_id=f"ROUTE-{task_id or 'UNKNOWN'}-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}",
-                                timestamp=datetime.now(timezone.utc).isoformat(),
-                                category="routing",
-                                context={
-                                    "task_kind": task_kind,
-                                    "risk_tier": risk_tier,
-                                    "complexity": complexity,
-                                    "domain": domain,
-                                },
-                                options=candidates,
-                                selected_option=selected,
-                                rationale=f"Strategy: {strategy}, Rule: {rule_id}",
-                                metadata={
-                                    "run_id": run_id,
-                                    "task_id": task_id,
-                                    "rule_id": rule_id,
-                                },
-                            )
-                            self.decision_registry.log_decision(reg_decision)
-
-                        return selected
+                    # Log to decision registry
+                    if self.decision_registry:
+                        reg_decision = Decision(
+                            decision_id=(
+                                f"ROUTE-{task_id or 'UNKNOWN'}-"
+                                f"{self._start_ns:x}-{next(self._decision_seq)}"
+                            ),
+                            timestamp=decision.timestamp,
+                            category="routing",
+                            context={
+                                "task_kind": task_kind,
+                                "risk_tier": risk_tier,
+                                "complexity": complexity,
+                                "domain": domain,
+                            },
+                            options=candidates,
+                            selected_option=selected,
+                            rationale=f"Strategy: {strategy}, Rule: {rule_id}",
+                            metadata={
+                                "run_id": run_id,
+                                "task_id": task_id,
+                                "rule_id": rule_id,
+                            },
+                        )
+                        self.decision_registry.log_decision(reg_decision)
+
+                    return selected
 
         # Fallback: find any tool that can handle this task_kind
         capable_tools = self._find_capable_tools(task_kind, domain)
@@ -417,20 +661,6 @@ class TaskRouter:
         if capable_tools:
             # Default to first capable tool
             selected = capable_tools[0]
-            if hasattr(self, "event_bus") and self.event_bus:
-                try:
-                    self.event_bus.emit(
-                        "ROUTING_FALLBACK",
-                        run_id=run_id,
-                        task_id=task_id,
-                        payload={
-                            "task_kind": task_kind,
-                            "candidates": capable_tools,
-                            "reason": "no_matching_rule",
-                        },
-                    )
-                except Exception:
-                    pass
             decision = RoutingDecision(
                 task_kind=task_kind,
                 selected_tool=selected,
@@ -441,13 +671,24 @@ class TaskRouter:
                 run_id=run_id,
             )
             self.decision_log.append(decision)
-            logger.info(f"Routed {task_kind} to {selected} via fallback")
-            self._emit_routing_event(
-                "ROUTING_FALLBACK", run_id, task_id, decision.to_dict()
-            )
+            logger.info("Routed %s to %s via fallback", task_kind, selected)
+            if self.event_bus:
+                self._emit_routing_event(
+                    "ROUTING_FALLBACK",
+                    run_id,
+                    task_id,
+                    {
+                        "task_kind": task_kind,
+                        "candidates": capable_tools,
+                        "reason": "no_matching_rule",
+                    },
+                )
+                self._emit_routing_event(
+                    "ROUTING_FALLBACK", run_id, task_id, decision.to_dict()
+                )
             return selected
 
-        logger.warning(f"No capable tools found for {task_kind}")
+        logger.warning("No capable tools found for %s", task_kind)
         return None
 
     def _emit_routing_event(
@@ -470,54 +711,128 @@ class TaskRouter:
         except Exception:
             return
 
-    def _matches_rule(
-        self,
-        rule: Dict[str, Any],
+    @staticmethod
+    def _index_rules(
+        rules: List[Dict[str, Any]],
+    ) -> Tuple[Dict[str, List[Tuple[int, Dict, Tuple]]], List[Tuple[int, Dict, Tuple]]]:
+        """
+        Compile routing rules and bucket them by task_kind
+
+        Rules listing their task kinds go into a bucket per kind; the rest
+        (no task_kind, or a non-list value) are checked for every task. List
+        criteria become frozensets so membership tests hash instead of scan.
+        """
+        by_task_kind: Dict[str, List[Tuple[int, Dict, Tuple]]] = defaultdict(list)
+        wildcard: List[Tuple[int, Dict, Tuple]] = []
+
+        for index, rule in enumerate(rules):
+            match = rule.get("match", {})
+            task_kinds = _as_lookup(match.get("task_kind"))
+            risk_tiers = _as_lookup(match.get("risk_tier"))
+            complexity = match.get("complexity", _ANY)
+
+            if isinstance(task_kinds, frozenset):
+                # The bucket itself guarantees the task_kind check
+                entry = (index, rule, (None, risk_tiers, complexity))
+                for kind in task_kinds:
+                    by_task_kind[kind].append(entry)
+            else:
+                wildcard.append((index, rule, (task_kinds, risk_tiers, complexity)))
+
+        return dict(by_task_kind), wildcard
+
+    def _matching_rules(
+        self, task_kind: str, risk_tier: Optional[str], complexity: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Rules matching the task attributes, in config order
+
+        Matching depends only on these attributes and the rules, which are
+        fixed once the router is built, so results are cached per key. The
+        cache is dropped when it grows past _ROUTE_CACHE_MAX entries.
+        """
+        key = (task_kind, risk_tier, complexity)
+        rules = self._route_cache.get(key)
+        if rules is None:
+            rules = [
+                rule
+                for rule, match in self._rules_for_task_kind(task_kind)
+                if self._matches_compiled(match, task_kind, risk_tier, complexity)
+            ]
+            if len(self._route_cache) >= _ROUTE_CACHE_MAX:
+                self._route_cache.clear()
+            self._route_cache[key] = rules
+        return rules
+
+    def _rules_for_task_kind(self, task_kind: str) -> List[Tuple[Dict, Tuple]]:
+        """Rules that may match task_kind, as (rule, compiled match), in config order"""
+        bucket = self._rules_by_task_kind.get(task_kind, [])
+        if not self._wildcard_rules:
+            entries = bucket
+        elif not bucket:
+            entries = self._wildcard_rules
+        else:
+            entries = heapq.merge(bucket, self._wildcard_rules, key=itemgetter(0))
+        return [(rule, match) for _, rule, match in entries]
+
+    @staticmethod
+    def _matches_compiled(
+        match: Tuple,
         task_kind: str,
         risk_tier: Optional[str],
         complexity: Optional[str],
     ) -> bool:
-        """Check if task matches routing rule"""
-        match = rule.get("match", {})
+        """Check if task matches a routing rule compiled by _index_rules"""
+        task_kinds, risk_tiers, required_complexity = match
+
+        if task_kinds is not None and task_kind not in task_kinds:
+            return False
+        if risk_tier and risk_tiers is not None and risk_tier not in risk_tiers:
+            return False
+        if (
+            complexity
+            and required_complexity is not _ANY
+            and complexity != required_complexity
+        ):
+            return False
+        return True
 
-        # Check task_kind
-        if "task_kind" in match:
-            if task_kind not in match["task_kind"]:
-                return False
+    @staticmethod
+    def _index_capabilities(
+        apps: Dict[str, Any],
+    ) -> Tuple[Dict[str, List[str]], Dict[str, frozenset]]:
+        """
+        Build task_kind -> sorted tool_ids and tool_id -> supported domains
 
-        # Check risk_tier
-        if risk_tier and "risk_tier" in match:
-            if risk_tier not in match["risk_tier"]:
-                return False
+        An empty domain set means the tool accepts any domain.
+        """
+        by_kind: Dict[str, List[str]] = defaultdict(list)
+        domains_by_tool: Dict[str, frozenset] = {}
 
-        # Check complexity
-        if complexity and "complexity" in match:
-            if complexity != match["complexity"]:
-                return False
+        for tool_id, app_config in apps.items():
+            capabilities = app_config.get("capabilities", {})
+            for task_kind in set(capabilities.get("task_kinds", [])):
+                by_kind[task_kind].append(tool_id)
+            domains_by_tool[tool_id] = frozenset(capabilities.get("domains", []))
 
-        return True
+        for tools in by_kind.values():
+            tools.sort()
+        return dict(by_kind), domains_by_tool
 
     def _find_capable_tools(
         self, task_kind: str, domain: Optional[str] = None
     ) -> List[str]:
         """Find all tools capable of handling task_kind"""
-        capable = []
+        tools = self._capable_by_kind.get(task_kind, ())
+        if not domain:
+            return list(tools)
 
-        for tool_id, app_config in self.apps.items():
-            capabilities = app_config.get("capabilities", {})
-
-            # Check if tool supports this task_kind
-            supported_tasks = capabilities.get("task_kinds", [])
-            if task_kind in supported_tasks:
-                # If domain specified, check domain match
-                if domain:
-                    supported_domains = capabilities.get("domains", [])
-                    if domain in supported_domains or not supported_domains:
-                        capable.append(tool_id)
-                else:
-                    capable.append(tool_id)
-
-        return sorted(capable)
+        domains_by_tool = self._domains_by_tool
+        return [
+            tool_id
+            for tool_id in tools
+            if not domains_by_tool[tool_id] or domain in domains_by_tool[tool_id]
+        ]
 
     def _apply_strategy(
         self, candidates: List[str], strategy: str, rule_id: Optional[str] = None
@@ -527,7 +842,8 @@ class TaskRouter:
 
         Args:
             candidates: List of candidate tool IDs
-            strategy: Routing strategy ('fixed', 'round_robin', 'metrics', 'auto')
+            strategy: Routing strategy ('fixed', 'round_robin',
+                'weighted_round_robin', 'metrics', 'auto')
             rule_id: Optional rule ID for state tracking
 
         Returns:
@@ -540,14 +856,17 @@ class TaskRouter:
             # Always return first candidate
             return candidates[0]
 
-        elif strategy == "round_robin":
-            # Round-robin with persistent state
+        elif strategy in ("round_robin", "weighted_round_robin"):
+            # Round-robin with persistent state; the weighted variant cycles
+            # through the schedule precomputed from the rule's weights
+            if strategy == "weighted_round_robin":
+                candidates = self._wrr_schedules.get(rule_id) or candidates
             if rule_id:
                 index = self.state_store.get_round_robin_index(rule_id)
                 selected = candidates[index % len(candidates)]
-                # Update index for next call
+                # Update index for next call; the store batches its writes
                 self.state_store.set_round_robin_index(rule_id, index + 1)
-                logger.debug(f"Round-robin selected {selected} (index {index})")
+                logger.debug("Round-robin selected %s (index %d)", selected, index)
                 return selected
             else:
                 # No rule_id, fall back to first
@@ -581,37 +900,34 @@ class TaskRouter:
         """
         best_tool = None
         best_score = -1.0
+        get_metrics = self.state_store.get_tool_metrics
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         for tool_id in candidates:
-            metrics = self.state_store.get_tool_metrics(tool_id)
+            metrics = get_metrics(tool_id)
             call_count = metrics.get("call_count", 0)
 
             if call_count == 0:
                 # No history, give it a neutral score
                 score = 0.5
             else:
-                success_count = metrics.get("success_count", 0)
-                total_latency = metrics.get("total_latency_ms", 0.0)
-
-                # Success rate (0-1)
-                success_rate = success_count / call_count
-
-                # Normalized latency (invert so lower latency = higher score)
-                avg_latency = total_latency / call_count if call_count > 0 else 1000.0
-                latency_score = 1.0 / (
-                    1.0 + (avg_latency / 1000.0)
-                )  # Normalize around 1000ms
+                # Success rate (0-1), plus latency normalized around 1000ms and
+                # inverted so lower latency = higher score
+                success_rate = metrics.get("success_count", 0) / call_count
+                avg_latency = metrics.get("total_latency_ms", 0.0) / call_count
+                latency_score = 1.0 / (1.0 + avg_latency / 1000.0)
 
                 # Combined score (weighted: 70% success rate, 30% latency)
                 score = (0.7 * success_rate) + (0.3 * latency_score)
 
-            logger.debug(f"Tool {tool_id} score: {score:.3f}")
+            if debug:
+                logger.debug("Tool %s score: %.3f", tool_id, score)
 
             if score > best_score:
                 best_score = score
                 best_tool = tool_id
 
-        logger.info(f"Metrics-based selection: {best_tool} (score: {best_score:.3f})")
+        logger.info("Metrics-based selection: %s (score: %.3f)", best_tool, best_score)
         return best_tool or candidates[0]
 
     def get_tool_config(self, tool_id: str) -> Optional[Dict[str, Any]]:
@@ -625,22 +941,32 @@ class TaskRouter:
             return tool_config.get("command")
         return None
 
-    def get_tool_limits(self, tool_id: str) -> Dict[str, Any]:
-        """Get limits for a tool (timeout, max_parallel, etc.)"""
-        tool_config = self.get_tool_config(tool_id)
-        if tool_config:
+    def get_tool_limits(self, tool_id: str) -> Mapping[str, Any]:
+        """
+        Get limits for a tool (timeout, max_parallel, etc.)
+
+        Resolved against defaults when the config is loaded; the returned
+        mapping is read-only.
+        """
+        return self._tool_limits.get(tool_id, self._default_limits)
+
+    def _resolve_tool_limits(self) -> None:
+        """Merge each tool's limits with the config defaults, once"""
+        default_timeout = self.defaults.get("timeout_seconds", 600)
+        self._default_limits = MappingProxyType(
+            {"max_parallel": 1, "timeout_seconds": default_timeout}
+        )
+        self._tool_limits: Dict[str, Mapping[str, Any]] = {}
+        for tool_id, tool_config in self.apps.items():
+            if not tool_config:
+                continue
             limits = tool_config.get("limits", {})
-            # Merge with defaults
-            return {
-                "max_parallel": limits.get("max_parallel", 1),
-                "timeout_seconds": limits.get(
-                    "timeout_seconds", self.defaults.get("timeout_seconds", 600)
-                ),
-            }
-        return {
-            "max_parallel": 1,
-            "timeout_seconds": self.defaults.get("timeout_seconds", 600),
-        }
+            self._tool_limits[tool_id] = MappingProxyType(
+                {
+                    "max_parallel": limits.get("max_parallel", 1),
+                    "timeout_seconds": limits.get("timeout_seconds", default_timeout),
+                }
+            )
 
     def list_tools(self) -> List[str]:
         """List all available tool IDs"""
@@ -665,7 +991,9 @@ class TaskRouter:
         """
         decisions = self.decision_log
         if last_n:
-            decisions = decisions[-last_n:]
+            decisions = itertools.islice(
+                decisions, max(0, len(decisions) - last_n), None
+            )
         return [d.to_dict() for d in decisions]
 
     def clear_decision_log(self) -> None:
@@ -685,17 +1013,14 @@ class TaskRouter:
             latency_ms: Execution latency in milliseconds
         """
         metrics = self.state_store.get_tool_metrics(tool_id)
+        outcome = "success_count" if success else "failure_count"
         metrics["call_count"] = metrics.get("call_count", 0) + 1
         metrics["total_latency_ms"] = metrics.get("total_latency_ms", 0.0) + latency_ms
+        metrics[outcome] = metrics.get(outcome, 0) + 1
 
-        if success:
-            metrics["success_count"] = metrics.get("success_count", 0) + 1
-        else:
-            metrics["failure_count"] = metrics.get("failure_count", 0) + 1
-
-        self.state_store.mark_dirty()
+        self.state_store.mark_dirty(tool_id)
         logger.debug(
-            f"Recorded {tool_id} result: success={success}, latency={latency_ms}ms"
+            "Recorded %s result: success=%s, latency=%sms", tool_id, success, latency_ms
         )
 
 
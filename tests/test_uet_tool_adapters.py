@@ -217,6 +217,112 @@ class TestRunTool:
             except Exception as e:
                 pytest.fail(f"run_tool raised exception: {e}")
 
+    def test_deleted_working_directory_reported(self, tmp_path):
+        """Test a remembered working directory deleted later is reported as missing."""
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        request = ToolRunRequestV1(
+            tool_id="python",
+            cmd=["python", "-c", "pass"],
+            cwd=str(worktree),
+            env={},
+            timeout_seconds=10,
+        )
+        assert run_tool(request).exit_code == 0
+
+        worktree.rmdir()
+        result = run_tool(request)
+
+        assert result.exit_code == -3
+        assert "does not exist" in result.stderr
+        assert run_tool(request).exit_code == -3
+
+    def test_legacy_keeps_full_output(self, tmp_path):
+        """Test the subprocess fallback does not drop early output lines."""
+        from src.acms.uet_tool_adapters import _run_tool_legacy
+
+        request = ToolRunRequestV1(
+            tool_id="python",
+            cmd=["python", "-c", "for i in range(20000): print(i)"],
+            cwd=str(tmp_path),
+            env={},
+            timeout_seconds=30,
+        )
+
+        result = _run_tool_legacy(request)
+
+        lines = result.stdout.splitlines()
+        assert result.exit_code == 0
+        assert len(lines) == 20000
+        assert lines[0] == "0"
+
+    def test_legacy_timeout_with_unread_stdin(self, tmp_path):
+        """Test large stdin the tool never reads does not hold off the timeout."""
+        from src.acms.uet_tool_adapters import _run_tool_legacy
+
+        request = ToolRunRequestV1(
+            tool_id="sleep",
+            cmd=["python", "-c", "import time; time.sleep(10)"],
+            cwd=str(tmp_path),
+            env={},
+            timeout_seconds=1,
+            stdin_data="x" * 2_000_000,  # far larger than a pipe buffer
+        )
+
+        result = _run_tool_legacy(request)
+
+        assert result.timed_out
+        assert result.exit_code == -1
+        assert result.duration_seconds < 5
+
+    def test_legacy_feeds_stdin(self, tmp_path):
+        """Test stdin larger than a pipe buffer reaches a tool that reads it."""
+        from src.acms.uet_tool_adapters import _run_tool_legacy
+
+        request = ToolRunRequestV1(
+            tool_id="python",
+            cmd=["python", "-c", "import sys; print(len(sys.stdin.read()))"],
+            cwd=str(tmp_path),
+            env={},
+            timeout_seconds=30,
+            stdin_data="x" * 200_000,
+        )
+
+        result = _run_tool_legacy(request)
+
+        assert result.exit_code == 0
+        assert result.stdout.strip() == "200000"
+
+    def test_legacy_kills_process_on_error(self, tmp_path):
+        """Test the subprocess fallback never leaves the tool running."""
+        import subprocess
+        from src.acms import uet_tool_adapters
+
+        started = []
+        real_popen = subprocess.Popen
+
+        def popen(*args, **kwargs):
+            proc = real_popen(*args, **kwargs)
+            started.append(proc)
+            return proc
+
+        request = ToolRunRequestV1(
+            tool_id="sleep",
+            cmd=["python", "-c", "import time; time.sleep(30)"],
+            cwd=str(tmp_path),
+            env={},
+            timeout_seconds=30,
+        )
+
+        with patch.object(uet_tool_adapters.subprocess, "Popen", popen), \
+                patch.object(uet_tool_adapters.threading, "Thread",
+                             side_effect=RuntimeError("no threads")):
+            result = uet_tool_adapters._run_tool_legacy(request)
+
+        assert result.exit_code == -3
+        assert "no threads" in result.stderr
+        assert started[0].poll() is not None
+
 
 class TestRunAider:
     """Tests for run_aider() - Aider-specific adapter"""
@@ -324,6 +430,82 @@ class TestBuildErrorEvent:
         assert error.context["exit_code"] == 1
 
 
+class TestLogEvent:
+    """Tests for batched event logging"""
+
+    def test_events_written_in_order_after_flush(self, capsys):
+        """Test queued log lines reach stderr, in order, once flushed."""
+        from src.acms.uet_submodule_io_contracts import LogEventV1
+        from src.acms.uet_tool_adapters import _log_event, flush_logs
+
+        # Drop lines still queued by earlier tests
+        flush_logs()
+        capsys.readouterr()
+
+        for i in range(40):
+            _log_event(LogEventV1(level="INFO", message=f"event {i}", context={"i": i}))
+        flush_logs()
+
+        lines = [json.loads(l) for l in capsys.readouterr().err.splitlines() if l]
+        assert [l["context"]["i"] for l in lines] == list(range(40))
+        assert lines[0]["message"] == "event 0"
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_starts_its_own_writer(self):
+        """Test a child forked after logging started can still log."""
+        from src.acms.uet_submodule_io_contracts import LogEventV1
+        from src.acms.uet_tool_adapters import _log_event, flush_logs
+
+        # Make sure the parent's writer thread is running before the fork
+        _log_event(LogEventV1(level="INFO", message="parent", context={}))
+        flush_logs()
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            import sys
+            sys.stderr = os.fdopen(write_fd, "w")
+            _log_event(LogEventV1(level="INFO", message="child", context={}))
+            flush_logs(timeout=5.0)
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            output = pipe.read()
+        os.waitpid(pid, 0)
+
+        assert json.loads(output)["message"] == "child"
+
+
+class TestUtcTimestamp:
+    """Tests for the shared ISO-8601 timestamp helper"""
+
+    def test_format_matches_datetime(self):
+        """Test timestamps are ISO-8601 UTC with microseconds and a Z suffix."""
+        from datetime import datetime, timedelta, timezone
+
+        from src.acms.uet_tool_adapters import _utc_timestamp
+
+        before = datetime.now(timezone.utc)
+        stamp = _utc_timestamp()
+        after = datetime.now(timezone.utc)
+
+        assert stamp.endswith("Z")
+        assert len(stamp) == len("2025-12-07T00:00:00.000000Z")
+        parsed = datetime.fromisoformat(stamp[:-1] + "+00:00")
+        assert before - timedelta(seconds=1) <= parsed <= after
+
+    def test_cached_prefix_rolls_over(self):
+        """Test the cached seconds prefix is rebuilt when the second changes."""
+        from src.acms import uet_submodule_io_contracts as contracts
+
+        with patch.object(contracts.time, "time", return_value=0.25):
+            assert contracts.utc_now_iso() == "1970-01-01T00:00:00.250000Z"
+        with patch.object(contracts.time, "time", return_value=61.5):
+            assert contracts.utc_now_iso() == "1970-01-01T00:01:01.500000Z"
+
+
 class TestToolProfiles:
     """Tests for tool profile loading"""
 
@@ -350,6 +532,24 @@ class TestToolProfiles:
         except (FileNotFoundError, KeyError):
             pytest.skip("Tool profiles not configured")
 
+    def test_load_tool_profiles_cached_until_invalidated(self, tmp_path):
+        """Test profiles are parsed once per path until the cache is cleared."""
+        from src.acms.uet_tool_adapters import (
+            invalidate_tool_profiles_cache,
+            load_tool_profiles,
+        )
+
+        profile_file = tmp_path / "tool_profiles.json"
+        profile_file.write_text(json.dumps({"profiles": {"aider": {"v": 1}}}))
+
+        first = load_tool_profiles(str(profile_file))
+        profile_file.write_text(json.dumps({"profiles": {"aider": {"v": 2}}}))
+
+        assert load_tool_profiles(str(profile_file)) is first
+
+        invalidate_tool_profiles_cache()
+        assert load_tool_profiles(str(profile_file))["aider"]["v"] == 2
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -10,7 +10,11 @@ from pathlib import Path
 
 import pytest
 
-from src.acms.uet_submodule_io_contracts import GitWorkspaceRefV1, WorkstreamV1
+from src.acms.uet_submodule_io_contracts import (
+    GitWorkspaceRefV1,
+    WorkstreamTaskV1,
+    WorkstreamV1,
+)
 from src.acms.uet_workstream_adapter import (
     UETWorkstreamAdapter,
     load_workstream_for_run,
@@ -169,6 +173,22 @@ class TestUETWorkstreamAdapter:
         assert requests[0].workspace.ws_id == "workspace-test"
         assert requests[0].workspace.root_path == "/test/repo"
 
+    def test_load_workstream_returns_independent_objects(
+        self, tmp_path, sample_workstream_data
+    ):
+        """Test changes to one loaded workstream don't leak into later loads."""
+        ws_file = tmp_path / "ws-test-001.json"
+        ws_file.write_text(json.dumps(sample_workstream_data))
+
+        first = UETWorkstreamAdapter().load_workstream(ws_file)
+        first.name = "Renamed Workstream"
+        first.tasks[0].metadata["retries"] = 1
+
+        second = UETWorkstreamAdapter().load_workstream(ws_file)
+        assert second is not first
+        assert second.name == sample_workstream_data["name"]
+        assert "retries" not in second.tasks[0].metadata
+
     def test_get_workstream_by_id(self, tmp_path, sample_workstream_data):
         """Test retrieving loaded workstream by ID."""
         ws_file = tmp_path / "ws-test-001.json"
@@ -208,6 +228,78 @@ class TestUETWorkstreamAdapter:
         assert "ws-test-002" in ids
 
 
+class TestDependencyLayers:
+    """Tests for dependency-ordered request conversion"""
+
+    @staticmethod
+    def _workstream(deps_by_task, workspace):
+        tasks = [
+            WorkstreamTaskV1(
+                task_id=task_id,
+                pattern_id="generic_fix",
+                operation_kind="EXEC-AIDER-EDIT",
+                dependencies=deps,
+            )
+            for task_id, deps in deps_by_task.items()
+        ]
+        return WorkstreamV1(
+            ws_id="ws-layers",
+            name="Layers",
+            description="Dependency layering",
+            tasks=tasks,
+            workspace_ref=workspace,
+        )
+
+    def test_layers_follow_dependencies(self, sample_workspace):
+        """Test tasks are grouped so dependencies come in earlier layers."""
+        ws = self._workstream(
+            {"t3": ["t1", "t2"], "t1": [], "t2": ["t1"], "t4": ["ws-other-task"]},
+            sample_workspace,
+        )
+
+        layers = UETWorkstreamAdapter().workstream_to_execution_layers(ws)
+
+        assert [[r.context["task_id"] for r in layer] for layer in layers] == [
+            ["t1", "t4"],
+            ["t2"],
+            ["t3"],
+        ]
+        assert layers[2][0].context["layer_index"] == 2
+
+    def test_requests_flattened_in_dependency_order(self, sample_workspace):
+        """Test the flat request list is topologically ordered."""
+        ws = self._workstream({"t2": ["t1"], "t1": []}, sample_workspace)
+
+        requests = UETWorkstreamAdapter().workstream_to_execution_requests(ws)
+
+        assert [r.context["task_id"] for r in requests] == ["t1", "t2"]
+
+    def test_cycle_raises(self, sample_workspace):
+        """Test a dependency cycle is rejected."""
+        ws = self._workstream({"t1": ["t2"], "t2": ["t1"]}, sample_workspace)
+
+        with pytest.raises(ValueError, match="cycle"):
+            UETWorkstreamAdapter().workstream_to_execution_requests(ws)
+
+
+class TestWorkstreamSerialization:
+    """Tests for WorkstreamV1 JSON output"""
+
+    def test_to_json_round_trips_through_adapter(
+        self, tmp_path, sample_workstream_data
+    ):
+        """Test to_json output matches to_dict and loads back unchanged."""
+        adapter = UETWorkstreamAdapter()
+        ws = adapter._dict_to_workstream(sample_workstream_data)
+
+        assert json.loads(ws.to_json()) == ws.to_dict()
+
+        ws_file = tmp_path / "ws-test-001.json"
+        ws_file.write_bytes(ws.to_json(indent=True))
+
+        assert adapter.load_workstream(ws_file).to_dict() == ws.to_dict()
+
+
 class TestConvenienceFunctions:
     """Tests for convenience functions"""
 
@@ -3,7 +3,14 @@ Tests for Daemon Orchestrator
 """
 
 import json
+import logging
+import os
+import shutil
+import signal
 import sqlite3
+import subprocess
+import sys
+import threading
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -15,6 +22,7 @@ from src.minipipe.daemon_orchestrator import (
     DaemonOrchestrator,
     load_config,
     DB_AVAILABLE,
+    _CachedTimeFormatter,
 )
 
 
@@ -125,11 +133,9 @@ class TestDaemonOrchestrator:
         db.connect()
         
         daemon = DaemonOrchestrator(config=daemon_config, db=db)
-        pending = daemon._fetch_pending_runs(limit=10)
+        pending = daemon._fetch_pending_run_ids(limit=10)
         
-        assert len(pending) == 2
-        assert pending[0]["run_id"] == "run-001"  # ASC order
-        assert pending[1]["run_id"] == "run-002"
+        assert pending == ["run-001", "run-002"]  # ASC order
     
     @pytest.mark.skipif(not DB_AVAILABLE, reason="Database not available")
     def test_fetch_pending_runs_with_limit(self, temp_db, daemon_config):
@@ -140,10 +146,33 @@ class TestDaemonOrchestrator:
         db.connect()
         
         daemon = DaemonOrchestrator(config=daemon_config, db=db)
-        pending = daemon._fetch_pending_runs(limit=1)
+        pending = daemon._fetch_pending_run_ids(limit=1)
         
-        assert len(pending) == 1
-        assert pending[0]["run_id"] == "run-001"
+        assert pending == ["run-001"]
+    
+    def test_fetch_pending_run_ids_skips_other_states(self, temp_db, daemon_config):
+        """Test only PENDING runs are returned, oldest first."""
+        conn = sqlite3.connect(temp_db)
+        conn.execute("UPDATE runs SET state = 'RUNNING' WHERE run_id = 'run-001'")
+        db = MagicMock()
+        db.conn = conn
+        daemon = DaemonOrchestrator(config=daemon_config, db=db)
+        
+        assert daemon._fetch_pending_run_ids(limit=10) == ["run-002"]
+    
+    def test_poll_starts_runs_from_pending_ids(self, temp_db, daemon_config):
+        """Test that polling only needs pending run IDs to start runs."""
+        db = MagicMock()
+        db.conn = sqlite3.connect(temp_db)
+        daemon = DaemonOrchestrator(config=daemon_config, db=db)
+        daemon_config.max_concurrent_runs = 3
+        started = []
+        daemon.start_run = started.append
+        
+        assert daemon._fetch_pending_run_ids(limit=1) == ["run-001"]
+        daemon.poll_and_start_runs()
+        
+        assert started == ["run-001", "run-002"]
     
     def test_start_run_creates_process(self, daemon_config):
         """Test that start_run creates a subprocess."""
@@ -161,6 +190,61 @@ class TestDaemonOrchestrator:
             mock_popen.assert_called_once()
             assert "test-run-001" in daemon.running_processes
     
+    def test_start_run_uses_parsed_command(self, daemon_config):
+        """Test that start_run spawns the pre-parsed argv and resolved binary."""
+        daemon_config.minipipe_command = f"{sys.executable} -m 'my pkg.orchestrator'"
+        daemon = DaemonOrchestrator(config=daemon_config)
+        
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value = MagicMock(pid=12345)
+            daemon.start_run("test-run-001")
+        
+        args, kwargs = mock_popen.call_args
+        assert args[0] == [
+            sys.executable, "-m", "my pkg.orchestrator", "--run-id", "test-run-001"
+        ]
+        assert kwargs["executable"] == shutil.which(sys.executable)
+        assert kwargs["close_fds"] is True
+        # preexec_fn/user/group changes would disable the vfork spawn path
+        assert not {"preexec_fn", "user", "group", "extra_groups", "umask"} & set(kwargs)
+    
+    def test_start_run_resolves_binary_per_spawn(self, daemon_config):
+        """Test that a binary moved on PATH is picked up by the next spawn."""
+        daemon = DaemonOrchestrator(config=daemon_config)
+        
+        with patch("subprocess.Popen") as mock_popen, \
+                patch("shutil.which", side_effect=["/old/python", "/new/python"]):
+            mock_popen.return_value = MagicMock(pid=12345)
+            daemon.start_run("run-001")
+            daemon.start_run("run-002")
+        
+        executables = [call.kwargs["executable"] for call in mock_popen.call_args_list]
+        assert executables == ["/old/python", "/new/python"]
+    
+    @pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc")
+    def test_start_run_writes_logs_without_leaking_fds(self, daemon_config):
+        """Test that run output reaches the log files and the parent closes them."""
+        daemon_config.log_dir.mkdir()
+        daemon_config.minipipe_command = (
+            f"{sys.executable} -c 'import sys; print(sys.argv[1:])'"
+        )
+        daemon = DaemonOrchestrator(config=daemon_config)
+        
+        daemon.start_run("log-run")
+        daemon.running_processes["log-run"].wait()
+        
+        open_paths = set()
+        for fd in os.listdir("/proc/self/fd"):
+            try:
+                open_paths.add(os.readlink(f"/proc/self/fd/{fd}"))
+            except OSError:
+                pass
+        assert not any(path.startswith(str(daemon_config.log_dir)) for path in open_paths)
+        stdout_log = daemon_config.log_dir / "log-run.stdout.log"
+        assert stdout_log.read_text().strip() == "['--run-id', 'log-run']"
+        assert (daemon_config.log_dir / "log-run.stderr.log").read_text() == ""
+        daemon.cleanup()
+    
     def test_check_running_processes_cleans_completed(self, daemon_config):
         """Test that completed processes are cleaned up."""
         daemon = DaemonOrchestrator(config=daemon_config)
@@ -189,6 +273,171 @@ class TestDaemonOrchestrator:
         # Verify process was not removed
         assert "test-run" in daemon.running_processes
     
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd not supported")
+    def test_wait_for_exits_wakes_on_child_exit(self, daemon_config):
+        """Test that a child exit ends the wait before the poll interval."""
+        daemon_config.minipipe_command = f"{sys.executable} -c pass"
+        daemon = DaemonOrchestrator(config=daemon_config)
+        daemon.start_run("quick-run")
+        
+        started = time.monotonic()
+        daemon._wait_for_exits(10.0)
+        assert time.monotonic() - started < 5.0
+        
+        daemon.running_processes["quick-run"].wait()
+        daemon.check_running_processes()
+        
+        assert "quick-run" not in daemon.running_processes
+        assert daemon._pidfds == {}
+        daemon.cleanup()
+    
+    @pytest.mark.skipif(not hasattr(os, "eventfd"), reason="eventfd not supported")
+    def test_wake_interrupts_wait(self, daemon_config):
+        """Test that wake() ends the wait early and is consumed by it."""
+        daemon = DaemonOrchestrator(config=daemon_config)
+        
+        timer = threading.Timer(0.05, daemon.wake)
+        timer.start()
+        started = time.monotonic()
+        daemon._wait_for_exits(10.0)
+        assert time.monotonic() - started < 5.0
+        timer.join()
+        
+        # The wakeup was drained, so the next wait runs its full timeout
+        started = time.monotonic()
+        daemon._wait_for_exits(0.1)
+        assert time.monotonic() - started >= 0.09
+        daemon.cleanup()
+    
+    @pytest.mark.skipif(not hasattr(os, "eventfd"), reason="eventfd not supported")
+    def test_context_manager_closes_handles(self, daemon_config):
+        """Test that leaving the context closes the epoll and eventfd handles."""
+        with DaemonOrchestrator(config=daemon_config) as daemon:
+            wake_fd = daemon._wake_fd
+            epoll = daemon._epoll
+            assert wake_fd is not None
+        
+        assert daemon._wake_fd is None
+        assert epoll.closed
+        with pytest.raises(OSError):
+            os.fstat(wake_fd)
+        daemon.wake()  # no-op once closed
+        daemon.close()  # idempotent
+    
+    @pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="SIGUSR1 not supported")
+    def test_sigusr1_handled_only_while_running(self, daemon_config):
+        """Test that SIGUSR1 is claimed by start(), not by construction."""
+        previous = signal.getsignal(signal.SIGUSR1)
+        daemon = DaemonOrchestrator(config=daemon_config, db=MagicMock())
+        assert signal.getsignal(signal.SIGUSR1) is previous
+        
+        seen = []
+        
+        def poll_once():
+            seen.append(signal.getsignal(signal.SIGUSR1))
+            daemon.should_stop = True
+        
+        with patch("src.minipipe.daemon_orchestrator.DB_AVAILABLE", True), \
+                patch.object(daemon, "poll_and_start_runs", side_effect=poll_once), \
+                patch.object(daemon, "check_running_processes"), \
+                patch.object(daemon, "_wait_for_exits"):
+            daemon.start()
+        
+        assert seen == [daemon._wake_handler]
+        assert signal.getsignal(signal.SIGUSR1) is previous
+    
+    def test_completed_runs_marked_in_one_commit(self, temp_db, daemon_config):
+        """Test that runs finishing together are written in one transaction."""
+        daemon_config.auto_cleanup_completed = True
+        # In-memory copy: no file for a writer thread, so writes stay inline
+        conn = sqlite3.connect(":memory:")
+        sqlite3.connect(temp_db).backup(conn)
+        commits = []
+        conn.set_trace_callback(
+            lambda sql: commits.append(sql) if sql == "COMMIT" else None
+        )
+        db = MagicMock()
+        db.conn = conn
+        daemon = DaemonOrchestrator(config=daemon_config, db=db)
+        
+        for run_id, exit_code in (("run-001", 0), ("run-002", 0), ("run-003", 1)):
+            proc = MagicMock()
+            proc.poll.return_value = exit_code
+            daemon.running_processes[run_id] = proc
+        
+        daemon.check_running_processes()
+        
+        states = dict(conn.execute("SELECT run_id, state FROM runs"))
+        assert states == {"run-001": "SUCCEEDED", "run-002": "SUCCEEDED"}
+        assert len(commits) == 1
+        assert daemon._pending_cleanups == []
+    
+    def test_completed_runs_written_by_writer_thread(self, temp_db, daemon_config):
+        """Test that file-backed run updates are committed off the main loop."""
+        daemon_config.auto_cleanup_completed = True
+        daemon_config.db_wal_mode = True
+        conn = sqlite3.connect(temp_db)
+        main_commits = []
+        conn.set_trace_callback(
+            lambda sql: main_commits.append(sql) if sql == "COMMIT" else None
+        )
+        db = MagicMock()
+        db.conn = conn
+        daemon = DaemonOrchestrator(config=daemon_config, db=db)
+        
+        for run_id in ("run-001", "run-002"):
+            proc = MagicMock()
+            proc.poll.return_value = 0
+            daemon.running_processes[run_id] = proc
+            daemon.check_running_processes()
+        
+        assert daemon._writer is not None
+        daemon.cleanup()
+        
+        states = dict(conn.execute("SELECT run_id, state FROM runs"))
+        assert states == {"run-001": "SUCCEEDED", "run-002": "SUCCEEDED"}
+        assert main_commits == []
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert daemon._writer is None
+    
+    def test_writer_connect_failure_falls_back_inline(self, temp_db, daemon_config):
+        """Test updates are written inline when the writer cannot connect."""
+        daemon_config.auto_cleanup_completed = True
+        db = MagicMock()
+        db.conn = sqlite3.connect(temp_db)
+        daemon = DaemonOrchestrator(config=daemon_config, db=db)
+        
+        with patch(
+            "src.minipipe.daemon_orchestrator.sqlite3.connect",
+            side_effect=sqlite3.OperationalError("database is locked"),
+        ):
+            for run_id in ("run-001", "run-002"):
+                proc = MagicMock()
+                proc.poll.return_value = 0
+                daemon.running_processes[run_id] = proc
+                daemon.check_running_processes()
+            unwritten = daemon._stop_writer()
+        
+        states = dict(db.conn.execute("SELECT run_id, state FROM runs"))
+        assert states == {"run-001": "SUCCEEDED", "run-002": "SUCCEEDED"}
+        assert unwritten == 0
+        assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] != "wal"
+    
+    def test_stop_writer_reports_unwritten_updates(self, temp_db, daemon_config):
+        """Test updates that can't be committed anywhere are reported."""
+        daemon_config.auto_cleanup_completed = True
+        db = MagicMock()
+        db.conn = sqlite3.connect(temp_db)
+        daemon = DaemonOrchestrator(config=daemon_config, db=db)
+        
+        with patch.object(daemon, "_write_cleanups", return_value=False):
+            proc = MagicMock()
+            proc.poll.return_value = 0
+            daemon.running_processes["run-001"] = proc
+            daemon.check_running_processes()
+            
+            assert daemon._stop_writer() == 1
+    
     def test_stop_run_graceful(self, daemon_config):
         """Test graceful run stop."""
         daemon = DaemonOrchestrator(config=daemon_config)
@@ -224,6 +473,28 @@ class TestDaemonOrchestrator:
         assert result is True
         mock_proc.kill.assert_called_once()
     
+    def test_stop_runs_share_one_deadline(self, daemon_config):
+        """Test that stopping several stuck runs waits for the timeout only once."""
+        daemon = DaemonOrchestrator(config=daemon_config)
+        
+        def stuck_wait(timeout=None):
+            if timeout is None:
+                return 0  # Reaped after kill
+            time.sleep(timeout)
+            raise subprocess.TimeoutExpired("run", timeout)
+        
+        for run_id in ("run-001", "run-002", "run-003"):
+            mock_proc = MagicMock()
+            mock_proc.wait.side_effect = stuck_wait
+            daemon.running_processes[run_id] = mock_proc
+        
+        started = time.monotonic()
+        results = daemon.stop_runs(["run-001", "run-002", "run-003", "missing"], timeout=0.3)
+        
+        assert time.monotonic() - started < 0.6
+        assert results == {"missing": False, "run-001": True, "run-002": True, "run-003": True}
+        assert daemon.running_processes == {}
+    
     def test_get_status(self, daemon_config):
         """Test getting daemon status."""
         daemon = DaemonOrchestrator(config=daemon_config)
@@ -261,6 +532,26 @@ class TestDaemonOrchestrator:
         mock_proc2.terminate.assert_called()
 
 
+class TestCachedTimeFormatter:
+    """Tests for the daemon's log formatter."""
+    
+    def test_matches_default_formatter(self):
+        """Test that cached asctime matches logging.Formatter output."""
+        fmt = "%(asctime)s - %(levelname)s - %(message)s"
+        cached = _CachedTimeFormatter(fmt)
+        default = logging.Formatter(fmt)
+        
+        with patch("time.strftime", wraps=time.strftime) as mock_strftime:
+            for created in (1700000000.001, 1700000000.5, 1700000000.9, 1700000001.2):
+                record = logging.LogRecord("d", logging.INFO, "f", 1, "msg", None, None)
+                record.created = created
+                record.msecs = int((created - int(created)) * 1000)
+                assert cached.format(record) == default.format(record)
+        
+        # Default formatter: one call per record; cached: one per second
+        assert mock_strftime.call_count == 4 + 2
+
+
 class TestLoadConfig:
     """Tests for load_config function."""
     
@@ -40,6 +40,14 @@ class TestDiffStats:
             "lines_deleted": 20,
         }
 
+    def test_diff_stats_has_no_instance_dict(self):
+        """Test that DiffStats uses slots instead of a per-instance __dict__."""
+        stats = DiffStats(lines_added=1)
+
+        assert not hasattr(stats, "__dict__")
+        with pytest.raises(AttributeError):
+            stats.line_added = 2
+
     def test_diff_stats_str(self):
         """Test DiffStats string representation."""
         stats = DiffStats(
@@ -254,6 +262,65 @@ diff --git a/test.py b/test.py
         assert patch.diff_stats.lines_added == 1
         assert patch.diff_stats.lines_deleted == 0
 
+    def test_convert_batch_shares_timestamp(self):
+        """Test that convert_batch stamps every patch with one timestamp."""
+        converter = PatchConverter()
+        results = [
+            {"output": "diff --git a/a.py b/a.py\n+x\n", "workstream_id": "ws-1"},
+            {"output": "no changes", "workstream_id": "ws-2"},
+        ]
+
+        patches = converter.convert_batch(results)
+
+        assert [p.workstream_id for p in patches] == ["ws-1", "ws-2"]
+        assert patches[0].created_at == patches[1].created_at
+        assert patches[0].patch_id.endswith("-0001")
+        assert patches[1].patch_id.endswith("-0002")
+        assert patches[0].patch_id[:-5] == patches[1].patch_id[:-5]
+        assert patches[0].diff_stats.lines_added == 1
+
+
+class TestConvertMany:
+    """Tests for convert_many batch conversion."""
+
+    RESULTS = [
+        {
+            "tool_id": "aider",
+            "output": "diff --git a/a.py b/a.py\n+x\n",
+            "workstream_id": "ws-1",
+        },
+        {"tool_id": "custom", "output": "--- a/b.py\n+++ b/b.py\n-y\n"},
+        {"tool_id": "custom", "output": "no diff here"},
+    ]
+
+    def _expected(self):
+        converter = PatchConverter()
+        return [
+            converter.convert_tool_patch(
+                r["tool_id"], r["output"], r.get("workstream_id", "unknown")
+            )
+            for r in self.RESULTS
+        ]
+
+    @pytest.mark.parametrize("min_chars", [10**9, 0])
+    def test_matches_convert_tool_patch(self, monkeypatch, min_chars):
+        """Test serial and process-pool paths match per-result conversion."""
+        monkeypatch.setattr(
+            "src.minipipe.patch_converter._PARALLEL_MIN_CHARS", min_chars
+        )
+        converter = PatchConverter()
+
+        patches = converter.convert_many(self.RESULTS)
+
+        for patch, expected in zip(patches, self._expected(), strict=True):
+            assert patch.patch_id[-5:] == expected.patch_id[-5:]
+            assert patch.workstream_id == expected.workstream_id
+            assert patch.content == expected.content
+            assert patch.metadata == expected.metadata
+            assert patch.diff_stats == expected.diff_stats
+        assert len({p.created_at for p in patches}) == 1
+        assert converter.patch_count == 3
+
 
 class TestDiffStatsEdgeCases:
     """Tests for edge cases in diff stats computation."""
@@ -304,3 +371,83 @@ class TestDiffStatsEdgeCases:
 
         assert stats.lines_added == 0
         assert stats.lines_deleted == 0
+
+
+class TestExtractGitDiff:
+    """Tests for extract_git_diff."""
+
+    def test_git_diff_chunks_split_per_file(self):
+        """Test leading chatter is dropped and file chunks are kept."""
+        output = (
+            "Applied edit.\n"
+            "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n-x\n+y\n"
+            "diff --git a/b.py b/b.py\n--- a/b.py\n+++ b/b.py\n+z\n"
+        )
+        converter = PatchConverter()
+
+        diff = converter.extract_git_diff(output)
+
+        assert diff == (
+            "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n-x\n+y\n"
+            "\n"
+            "diff --git a/b.py b/b.py\n--- a/b.py\n+++ b/b.py\n+z\n"
+        )
+
+    def test_unified_diff_fallback(self):
+        """Test plain unified diffs are found without git headers."""
+        output = "note\n--- a/f.py\n+++ b/f.py\n@@ -1 +1 @@\n-a\n+b\n"
+        converter = PatchConverter()
+
+        assert converter.extract_git_diff(output) == (
+            "--- a/f.py\n+++ b/f.py\n@@ -1 +1 @@\n-a\n+b\n"
+        )
+
+    def test_no_diff(self):
+        """Test output without any diff markers yields an empty string."""
+        converter = PatchConverter()
+
+        assert converter.extract_git_diff("--- header only\nno plus line") == ""
+
+    @pytest.mark.parametrize(
+        "output",
+        [
+            "Applied edit.\n"
+            "diff --git a/a.py b/a.py\n--- a/a.py\n+++ b/a.py\n-x\n+y\n"
+            "diff --git a/b.py b/b.py\n+z\n",
+            "note\n--- a/f.py\n+++ b/f.py\n-a --- b\n--- a/g.py\n+++ b/g.py\n+c",
+            "--- header only\nno plus line",
+            "",
+        ],
+    )
+    def test_file_matches_string_extraction(self, tmp_path, output):
+        """Test streaming a file gives the same diff as the in-memory scan."""
+        path = tmp_path / "stdout.log"
+        path.write_text(output, encoding="utf-8", newline="")
+        converter = PatchConverter()
+
+        expected = converter.extract_git_diff(output)
+        assert converter.extract_git_diff_file(str(path)) == expected
+
+        patch = converter.convert_aider_patch({"output_path": str(path)})
+        assert patch.content == expected
+        assert patch.metadata["original_output_length"] == len(output)
+
+
+class TestValidateUnifiedDiff:
+    """Tests for validate_unified_diff."""
+
+    @pytest.mark.parametrize(
+        "diff, expected",
+        [
+            ("", False),
+            ("plain text", False),
+            ("@@ -1 +1 @@\n-a\n+b\n", True),
+            ("--- a/f.py\n+++ b/f.py\n", True),
+            ("--- a/f.py only\n", False),
+            ("+++ b/f.py only\n", False),
+            ("--- a/f.py\n+++ b/f.py\n@@ -1 +1 @@\n", True),
+        ],
+    )
+    def test_markers(self, diff, expected):
+        """Test hunk markers or a full ---/+++ header make a diff valid."""
+        assert PatchConverter().validate_unified_diff(diff) is expected
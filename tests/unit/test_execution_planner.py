@@ -127,6 +127,16 @@ class TestExecutionPlanner(unittest.TestCase):
         # G5 depends on G3, and G3 is in the 'perf' workstream
         self.assertIn("WS_PERF_0002", ws_auth.dependencies)
 
+    def test_split_by_file_count(self):
+        """Tests that groups are closed once the file limit would be exceeded."""
+        planner = ExecutionPlanner(self.registry)
+        auth_gaps = [self.gaps[0], self.gaps[1], self.gaps[4]]
+
+        # G2 only touches f1.py, which G1 already covers, so it fits
+        groups = planner._split_by_file_count(auth_gaps, max_files=2)
+
+        self.assertEqual([[g.gap_id for g in grp] for grp in groups], [["G1", "G2"], ["G5"]])
+
     def test_get_prioritized_workstreams(self):
         """Tests that workstreams are sorted by priority."""
         planner = ExecutionPlanner(self.registry)
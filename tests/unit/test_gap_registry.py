@@ -72,6 +72,53 @@ class TestGapRegistry(unittest.TestCase):
         self.assertEqual(gap2.severity, GapSeverity.HIGH)
         self.assertIn("discovered_at", gap2.to_dict())
 
+    def test_load_from_dict(self):
+        """Tests loading gaps from an already-parsed report."""
+        registry = GapRegistry()
+        count = registry.load_from_dict(
+            {"gaps": [{"gap_id": "GAP_001", "title": "T", "severity": "critical"}]}
+        )
+
+        self.assertEqual(count, 1)
+        self.assertEqual(registry.get_gap("GAP_001").severity, GapSeverity.CRITICAL)
+
+        with self.assertRaises(ValueError):
+            registry.load_from_dict({"gaps": {}})
+
+    def test_indexed_queries_track_updates(self):
+        """Tests severity/category queries stay correct as gaps change."""
+        registry = GapRegistry()
+        registry.load_from_dict(
+            {
+                "gaps": [
+                    {"gap_id": "G1", "category": "perf", "severity": "high"},
+                    {"gap_id": "G2", "category": "auth", "severity": "high"},
+                ]
+            }
+        )
+        self.assertEqual(
+            [g.gap_id for g in registry.get_by_severity(GapSeverity.HIGH)],
+            ["G1", "G2"],
+        )
+
+        registry.load_from_dict(
+            {
+                "gaps": [
+                    {"gap_id": "G3", "category": "perf", "severity": "low"},
+                    {"gap_id": "G1", "category": "auth", "severity": "low"},
+                ]
+            }
+        )
+
+        self.assertEqual(
+            [g.gap_id for g in registry.get_by_category("auth")], ["G1", "G2"]
+        )
+        self.assertEqual(
+            [g.gap_id for g in registry.get_by_severity(GapSeverity.LOW)],
+            ["G1", "G3"],
+        )
+        self.assertEqual(registry.get_stats()["by_severity"]["high"], 1)
+
     def test_save_and_load(self):
         """Tests saving the registry to and loading from a file."""
         registry = GapRegistry(self.storage_path)
@@ -9,11 +9,14 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from invoke import Context, Result
+from invoke.exceptions import CommandTimedOut, UnexpectedExit
 
 from src.minipipe.invoke_tools import (
     run_tool_via_invoke,
     create_invoke_context,
     run_tool_safe,
+    invalidate_render_cache,
+    _default_context,
 )
 from src.minipipe.tools import ToolResult
 
@@ -22,6 +25,16 @@ from src.minipipe.tools import ToolResult
 # Fixtures
 # ============================================================================
 
+@pytest.fixture(autouse=True)
+def clear_render_cache():
+    """Keep memoized command renders and contexts from leaking between tests."""
+    invalidate_render_cache()
+    _default_context.cache_clear()
+    yield
+    invalidate_render_cache()
+    _default_context.cache_clear()
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock Invoke Context."""
@@ -122,8 +135,9 @@ def test_run_tool_via_invoke_failure(mock_context, mock_tool_profile, mock_faile
 
 def test_run_tool_via_invoke_timeout(mock_context, mock_tool_profile):
     """Test tool execution timeout handling."""
-    # Setup - simulate timeout exception
-    mock_context.run.side_effect = Exception("timeout exceeded")
+    # Setup - simulate Invoke's timeout exception
+    timeout_error = CommandTimedOut(Result(command="pytest", exited=-1), timeout=1)
+    mock_context.run.side_effect = timeout_error
     
     with patch('src.minipipe.invoke_tools.get_tool_profile', return_value=mock_tool_profile):
         with patch('src.minipipe.invoke_tools.render_command', return_value=["pytest", "tests/"]):
@@ -140,7 +154,43 @@ def test_run_tool_via_invoke_timeout(mock_context, mock_tool_profile):
     assert result.success is False
     assert result.exit_code == -1
     assert result.timed_out is True
-    assert "timeout" in result.stderr.lower()
+    assert result.stderr == str(timeout_error)
+
+
+def test_run_tool_via_invoke_timeout_not_guessed_from_message(mock_context, mock_tool_profile):
+    """Test that only CommandTimedOut marks a result as timed out."""
+    mock_context.run.side_effect = Exception("timeout exceeded")
+    
+    with patch('src.minipipe.invoke_tools.get_tool_profile', return_value=mock_tool_profile):
+        with patch('src.minipipe.invoke_tools.render_command', return_value=["pytest", "tests/"]):
+            result = run_tool_via_invoke(
+                tool_id="pytest",
+                context={"files": "tests/"},
+                invoke_ctx=mock_context,
+            )
+    
+    assert result.exit_code == -1
+    assert result.timed_out is False
+    assert result.stderr == "timeout exceeded"
+
+
+def test_run_tool_via_invoke_unexpected_exit(mock_context, mock_tool_profile, mock_failed_result):
+    """Test that warn=False failures still report the command's exit status."""
+    mock_context.run.side_effect = UnexpectedExit(mock_failed_result)
+    
+    with patch('src.minipipe.invoke_tools.get_tool_profile', return_value=mock_tool_profile):
+        with patch('src.minipipe.invoke_tools.render_command', return_value=["pytest"]):
+            result = run_tool_via_invoke(
+                tool_id="pytest",
+                context={},
+                invoke_ctx=mock_context,
+                warn=False,
+            )
+    
+    assert result.success is False
+    assert result.exit_code == 1
+    assert result.stderr == "Test error"
+    assert result.timed_out is False
 
 
 def test_run_tool_via_invoke_custom_timeout(mock_context, mock_tool_profile, mock_successful_result):
@@ -207,6 +257,20 @@ def test_run_tool_safe(mock_tool_profile, mock_successful_result):
                 assert result.success is True
 
 
+def test_run_tool_safe_reuses_context(mock_tool_profile, mock_successful_result):
+    """Test that run_tool_safe builds the project context only once."""
+    with patch('src.minipipe.invoke_tools.get_tool_profile', return_value=mock_tool_profile):
+        with patch('src.minipipe.invoke_tools.render_command', return_value=["echo", "test"]):
+            with patch('src.minipipe.invoke_tools.Context') as MockContext:
+                MockContext.return_value.run.return_value = mock_successful_result
+                
+                run_tool_safe("echo", {"message": "one"})
+                run_tool_safe("echo", {"message": "two"})
+                
+                assert MockContext.call_count == 1
+                assert MockContext.return_value.run.call_count == 2
+
+
 # ============================================================================
 # Command Rendering Tests
 # ============================================================================
@@ -245,6 +309,45 @@ def test_command_string_passed_through(mock_context, mock_tool_profile, mock_suc
     assert call_args[0][0] == "pytest -v"
 
 
+def test_render_cached_for_repeated_context(mock_context, mock_tool_profile, mock_successful_result):
+    """Test that identical hashable contexts render the command only once."""
+    mock_context.run.return_value = mock_successful_result
+    
+    with patch('src.minipipe.invoke_tools.get_tool_profile', return_value=mock_tool_profile):
+        with patch('src.minipipe.invoke_tools.render_command', return_value=["pytest", "tests/"]) as render:
+            for _ in range(3):
+                run_tool_via_invoke("pytest", {"files": "tests/"}, invoke_ctx=mock_context)
+            run_tool_via_invoke("pytest", {"files": ["a.py"]}, invoke_ctx=mock_context)
+            run_tool_via_invoke("pytest", {"files": ["a.py"]}, invoke_ctx=mock_context)
+    
+    # One cached render plus two uncached renders for the unhashable context
+    assert render.call_count == 3
+    assert mock_context.run.call_args[0][0] == "pytest tests/"
+
+
+def test_render_cache_keyed_on_value_type(mock_context, mock_tool_profile, mock_successful_result):
+    """Test that equal-comparing values of different types render separately."""
+    mock_context.run.return_value = mock_successful_result
+
+    def render(tool_id, context, profile):
+        return ["pytest", f"--n={context['n']}"]
+
+    with patch('src.minipipe.invoke_tools.get_tool_profile', return_value=mock_tool_profile):
+        with patch('src.minipipe.invoke_tools.render_command', side_effect=render):
+            commands = []
+            for value in (1, True, 1.0, (1,), (True,)):
+                run_tool_via_invoke("pytest", {"n": value}, invoke_ctx=mock_context)
+                commands.append(mock_context.run.call_args[0][0])
+
+    assert commands == [
+        "pytest --n=1",
+        "pytest --n=True",
+        "pytest --n=1.0",
+        "pytest --n=(1,)",
+        "pytest --n=(True,)",
+    ]
+
+
 # ============================================================================
 # Error Handling Tests
 # ============================================================================
@@ -107,6 +107,26 @@ class TestPhasePlanCompiler(unittest.TestCase):
             self.assertEqual(data["plan_id"], plan.plan_id)
             self.assertEqual(len(data["tasks"]), 5)
 
+    def test_save_plan_json_fallback_matches(self):
+        """Tests the stdlib fallback writes the same document."""
+        from unittest import mock
+
+        import src.acms.phase_plan_compiler as ppc
+
+        compiler = PhasePlanCompiler()
+        plan = compiler.compile_from_workstreams(self.workstreams, self.repo_root)
+        fast_path = self.test_dir / "fast.json"
+        slow_path = self.test_dir / "slow.json"
+
+        compiler.save_plan(plan, fast_path)
+        with mock.patch.object(ppc, "_ORJSON_AVAILABLE", False):
+            compiler.save_plan(plan, slow_path)
+
+        self.assertEqual(
+            json.loads(fast_path.read_text(encoding="utf-8")),
+            json.loads(slow_path.read_text(encoding="utf-8")),
+        )
+
     @unittest.skipIf(
         jsonschema is None,
         "jsonschema is not installed, skipping schema validation test.",
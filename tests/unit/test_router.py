@@ -0,0 +1,522 @@
+"""
+Tests for TaskRouter and routing state stores
+"""
+
+import json
+import pickle
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+# router.py depends on the contracts package, which is not always installed
+try:
+    from src.minipipe import router as router_module
+    from src.minipipe.router import (
+        FileBackedStateStore,
+        InMemoryStateStore,
+        RoutingDecision,
+        TaskRouter,
+    )
+
+    IMPORTS_AVAILABLE = True
+except ImportError as e:
+    IMPORTS_AVAILABLE = False
+    IMPORT_ERROR = str(e)
+
+
+pytestmark = pytest.mark.skipif(
+    not IMPORTS_AVAILABLE,
+    reason=f"Required imports unavailable: {IMPORT_ERROR if not IMPORTS_AVAILABLE else ''}",
+)
+
+
+@pytest.fixture
+def router_config(tmp_path):
+    """Write a small router config and return its path."""
+    config = {
+        "apps": {
+            "aider": {"capabilities": {"task_kinds": ["code_edit"]}},
+            "codex": {"capabilities": {"task_kinds": ["code_edit", "analysis"]}},
+        },
+        "routing": {
+            "rules": [
+                {
+                    "id": "edits",
+                    "match": {"task_kind": ["code_edit"], "risk_tier": ["low"]},
+                    "select_from": ["codex", "aider"],
+                    "strategy": "fixed",
+                }
+            ]
+        },
+        "defaults": {"timeout_seconds": 300},
+    }
+    path = tmp_path / "router_config.json"
+    path.write_text(json.dumps(config), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def tool_profiles(tmp_path):
+    """Write a tool profiles file with an operation_kind mapping."""
+    profiles = {
+        "profiles": {"aider": {"tool_id": "aider", "type": "ai"}},
+        "routing_rules": {
+            "operation_kind_to_tool": {
+                "EXEC-AIDER-EDIT": "aider",
+                "EXEC-PYTEST": "pytest",
+            }
+        }
+    }
+    path = tmp_path / "tool_profiles.json"
+    path.write_text(json.dumps(profiles), encoding="utf-8")
+    return path
+
+
+class TestFileBackedStateStore:
+    """Tests for FileBackedStateStore persistence."""
+
+    def test_state_round_trips_through_file(self, tmp_path):
+        """Test saved round-robin indices and metrics load back unchanged."""
+        state_file = tmp_path / "state" / "router_state.json"
+        store = FileBackedStateStore(str(state_file), auto_save_interval=100)
+        store.set_round_robin_index("rule-1", 3)
+        store.get_tool_metrics("aider")["call_count"] = 2
+        store.mark_dirty("aider")
+        store.flush()
+
+        reloaded = FileBackedStateStore(str(state_file))
+
+        assert reloaded.get_round_robin_index("rule-1") == 3
+        assert reloaded.get_tool_metrics("aider")["call_count"] == 2
+        assert json.loads(state_file.read_text(encoding="utf-8"))["round_robin"] == {
+            "rule-1": 3
+        }
+
+    def test_updates_coalesced_by_count_and_time(self, tmp_path):
+        """Test saves happen every K updates or after auto_save_seconds."""
+        state_file = tmp_path / "router_state.json"
+        store = FileBackedStateStore(
+            str(state_file), auto_save_interval=3, auto_save_seconds=60.0
+        )
+
+        with patch.object(store, "_save_state", wraps=store._save_state) as save:
+            for i in range(7):
+                store.set_round_robin_index("rule-1", i)
+            assert save.call_count == 2
+
+            store._last_save_ts -= 60.0
+            store.set_round_robin_index("rule-1", 7)
+            assert save.call_count == 3
+
+        reloaded = FileBackedStateStore(str(state_file))
+        assert reloaded.get_round_robin_index("rule-1") == 7
+        assert not (tmp_path / "router_state.json.tmp").exists()
+
+    def test_checkpoints_append_to_journal(self, tmp_path):
+        """Test checkpoints journal only changed keys and replay on load."""
+        state_file = tmp_path / "router_state.json"
+        journal = tmp_path / "router_state.jsonl"
+        store = FileBackedStateStore(str(state_file), auto_save_interval=2)
+        store.set_round_robin_index("rule-1", 1)
+        store.get_tool_metrics("aider")["call_count"] = 4
+        store.mark_dirty("aider")
+        store.get_tool_metrics("codex")  # read only: not journaled
+        store.set_round_robin_index("rule-1", 2)
+        store.set_round_robin_index("rule-2", 6)
+
+        assert not state_file.exists()
+        records = [json.loads(line) for line in journal.read_text().splitlines()]
+        assert {"op": "rr", "rule": "rule-2", "i": 6} in records
+        assert len(records) == 4  # rule-1 + aider, then rule-1 + rule-2
+        assert all(record.get("tool") != "codex" for record in records)
+
+        with open(journal, "ab") as f:
+            f.write(b'{"op": "rr", "ru')  # torn append
+        reloaded = FileBackedStateStore(str(state_file))
+        assert reloaded.get_round_robin_index("rule-1") == 2
+        assert reloaded.get_round_robin_index("rule-2") == 6
+        assert reloaded.get_tool_metrics("aider")["call_count"] == 4
+
+        reloaded.flush()
+        assert not journal.exists()
+        assert json.loads(state_file.read_text(encoding="utf-8"))["round_robin"] == {
+            "rule-1": 2,
+            "rule-2": 6,
+        }
+
+    def test_untracked_change_forces_full_rewrite(self, tmp_path):
+        """Test mark_dirty() without a tool_id saves the whole state."""
+        state_file = tmp_path / "router_state.json"
+        store = FileBackedStateStore(str(state_file), auto_save_interval=1)
+        store.get_tool_metrics("aider")["call_count"] = 3
+        store.mark_dirty()
+        store.set_round_robin_index("rule-1", 1)
+
+        assert not (tmp_path / "router_state.jsonl").exists()
+        reloaded = FileBackedStateStore(str(state_file))
+        assert reloaded.get_tool_metrics("aider")["call_count"] == 3
+        assert reloaded.get_round_robin_index("rule-1") == 1
+
+    def test_journal_compacted_past_threshold(self, tmp_path):
+        """Test a long journal is folded into the state file."""
+        state_file = tmp_path / "router_state.json"
+        store = FileBackedStateStore(
+            str(state_file), auto_save_interval=1, compact_after=3
+        )
+        for i in range(3):
+            store.set_round_robin_index(f"rule-{i}", i)
+
+        assert not (tmp_path / "router_state.jsonl").exists()
+        assert json.loads(state_file.read_text(encoding="utf-8"))["round_robin"] == {
+            "rule-0": 0,
+            "rule-1": 1,
+            "rule-2": 2,
+        }
+
+    def test_corrupt_state_starts_fresh(self, tmp_path):
+        """Test an unreadable state file falls back to empty state."""
+        state_file = tmp_path / "router_state.json"
+        state_file.write_text("{not json", encoding="utf-8")
+
+        store = FileBackedStateStore(str(state_file))
+
+        assert store.get_round_robin_index("rule-1") == 0
+
+
+class TestTaskRouter:
+    """Tests for TaskRouter configuration and routing."""
+
+    def test_loads_config_and_operation_map(self, router_config, tool_profiles):
+        """Test config fields and operation_kind mapping are loaded."""
+        router = TaskRouter(str(router_config), tool_profiles_path=str(tool_profiles))
+
+        assert router.list_tools() == ["aider", "codex"]
+        assert router.route_by_operation_kind("EXEC-PYTEST") == "pytest"
+        assert router.route_by_operation_kind("EXEC-UNKNOWN") is None
+        assert router.get_tool_profile("aider") == {"tool_id": "aider", "type": "ai"}
+
+    def test_tool_profiles_file_parsed_once(self, router_config, tool_profiles):
+        """Test profiles and operation_kind map come from a single parse."""
+        with patch.object(
+            router_module, "_read_json", wraps=router_module._read_json
+        ) as read_json:
+            TaskRouter(str(router_config), tool_profiles_path=str(tool_profiles))
+
+        parsed = [call.args[0] for call in read_json.call_args_list]
+        assert parsed.count(tool_profiles) == 1
+
+    def test_missing_tool_profiles_tolerated(self, router_config, tmp_path):
+        """Test a missing profiles file leaves profiles and mapping empty."""
+        router = TaskRouter(
+            str(router_config), tool_profiles_path=str(tmp_path / "missing.json")
+        )
+
+        assert router.tool_profiles == {}
+        assert router.operation_kind_map == {}
+
+    def test_tool_limits_resolved_against_defaults(self, router_config):
+        """Test tool limits fall back to defaults and cannot be mutated."""
+        config = json.loads(router_config.read_text(encoding="utf-8"))
+        config["apps"]["aider"]["limits"] = {"max_parallel": 4}
+        router_config.write_text(json.dumps(config), encoding="utf-8")
+        router = TaskRouter(str(router_config))
+
+        assert dict(router.get_tool_limits("aider")) == {
+            "max_parallel": 4,
+            "timeout_seconds": 300,
+        }
+        assert router.get_tool_limits("unknown")["timeout_seconds"] == 300
+        with pytest.raises(TypeError):
+            router.get_tool_limits("aider")["max_parallel"] = 8
+
+    def test_missing_routing_field_rejected(self, tmp_path):
+        """Test configs without a routing section are rejected."""
+        path = tmp_path / "router_config.json"
+        path.write_text(json.dumps({"apps": {}}), encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            TaskRouter(str(path))
+
+    def test_routers_do_not_share_config(self, router_config):
+        """Test changes to one router's config don't leak into another router."""
+        first = TaskRouter(str(router_config))
+        first.get_tool_config("aider")["command"] = "hacked"
+        first.config["routing"]["rules"].append({"id": "extra"})
+
+        second = TaskRouter(str(router_config))
+
+        assert second.get_tool_command("aider") != "hacked"
+        assert [r["id"] for r in second.routing_rules] == [
+            r["id"] for r in json.loads(router_config.read_text())["routing"]["rules"]
+        ]
+
+    def test_route_task_uses_matching_rule(self, router_config):
+        """Test rules are matched by task_kind and risk_tier with app fallback."""
+        router = TaskRouter(str(router_config))
+
+        assert router.route_task("code_edit", risk_tier="low") == "codex"
+        assert router.route_task("code_edit", risk_tier="high") == "aider"
+        assert router.route_task("analysis") == "codex"
+        assert router.route_task("unknown_kind") is None
+
+    def test_find_capable_tools_filters_by_domain(self, tmp_path):
+        """Test capable tools are sorted and filtered by supported domains."""
+        config = {
+            "apps": {
+                "zeta": {"capabilities": {"task_kinds": ["analysis"]}},
+                "alpha": {
+                    "capabilities": {"task_kinds": ["analysis"], "domains": ["web"]}
+                },
+                "beta": {"capabilities": {"task_kinds": ["code_edit"]}},
+            },
+            "routing": {"rules": []},
+        }
+        path = tmp_path / "router_config.json"
+        path.write_text(json.dumps(config), encoding="utf-8")
+        router = TaskRouter(str(path))
+
+        assert router._find_capable_tools("analysis") == ["alpha", "zeta"]
+        assert router._find_capable_tools("analysis", domain="web") == ["alpha", "zeta"]
+        assert router._find_capable_tools("analysis", domain="data") == ["zeta"]
+        assert router._find_capable_tools("unknown") == []
+
+    def test_record_execution_result_updates_metrics(self, router_config):
+        """Test results accumulate in fresh, picklable per-tool metrics."""
+        router = TaskRouter(str(router_config), state_store=InMemoryStateStore())
+        router.record_execution_result("aider", success=True, latency_ms=120.0)
+        router.record_execution_result("aider", success=False, latency_ms=80.0)
+
+        assert router.state_store.get_tool_metrics("aider") == {
+            "success_count": 1,
+            "failure_count": 1,
+            "total_latency_ms": 200.0,
+            "call_count": 2,
+        }
+        assert router.state_store.get_tool_metrics("codex")["call_count"] == 0
+        restored = pickle.loads(pickle.dumps(router.state_store))
+        assert restored.get_tool_metrics("aider")["call_count"] == 2
+
+    def test_weighted_round_robin_follows_schedule(self, tmp_path):
+        """Test weighted round-robin interleaves tools in proportion to weight."""
+        config = {
+            "apps": {"a": {}, "b": {}, "c": {}},
+            "routing": {
+                "rules": [
+                    {
+                        "id": "wrr",
+                        "match": {"task_kind": ["code_edit"]},
+                        "select_from": ["a", "b", "c"],
+                        "strategy": "weighted_round_robin",
+                        "weights": {"a": 4, "b": 3, "c": 2},
+                    }
+                ]
+            },
+        }
+        path = tmp_path / "router_config.json"
+        path.write_text(json.dumps(config), encoding="utf-8")
+        router = TaskRouter(str(path))
+
+        picks = "".join(router.route_task("code_edit") for _ in range(10))
+
+        assert picks == "aababcabca"
+
+    def test_route_task_logs_decision(self, router_config, caplog):
+        """Test routing decisions are logged with their arguments filled in."""
+        router = TaskRouter(str(router_config))
+
+        with caplog.at_level("INFO", logger=router_module.logger.name):
+            router.route_task("code_edit", risk_tier="low")
+
+        assert "Routed code_edit to codex via rule edits (strategy: fixed)" in (
+            caplog.messages
+        )
+
+    def test_rule_matching_memoized(self, router_config):
+        """Test repeated routes with the same attributes skip rule matching."""
+        router = TaskRouter(str(router_config))
+
+        with patch.object(
+            TaskRouter, "_matches_compiled", wraps=TaskRouter._matches_compiled
+        ) as matches:
+            first = [router.route_task("code_edit", risk_tier="low") for _ in range(3)]
+            assert matches.call_count == 1
+            router.route_task("code_edit", risk_tier="high")
+
+        assert first == ["codex"] * 3
+        assert matches.call_count == 2
+        assert len(router.get_decision_log()) == 4
+
+    def test_registry_decision_ids_unique(self, router_config):
+        """Test registry decision ids stay unique for repeated routes."""
+        registry = Mock()
+        router = TaskRouter(str(router_config), decision_registry=registry)
+
+        with patch.object(router_module, "Decision", side_effect=dict):
+            for _ in range(3):
+                router.route_task("code_edit", risk_tier="low", task_id="t1")
+
+        logged = [call.args[0] for call in registry.log_decision.call_args_list]
+        ids = [entry["decision_id"] for entry in logged]
+        assert len(set(ids)) == 3
+        assert all(decision_id.startswith("ROUTE-t1-") for decision_id in ids)
+        assert logged[0]["timestamp"] == router.get_decision_log()[0]["timestamp"]
+
+    def test_fallback_emits_events_when_bus_attached(self, router_config):
+        """Test fallback events go to an event bus attached after construction."""
+        router = TaskRouter(str(router_config))
+        assert router.route_task("analysis") == "codex"
+
+        router.event_bus = Mock()
+        router.event_bus.emit.side_effect = [None, RuntimeError("bus down")]
+        assert router.route_task("analysis", task_id="t1") == "codex"
+
+        calls = router.event_bus.emit.call_args_list
+        assert [call.args[0] for call in calls] == ["ROUTING_FALLBACK"] * 2
+        assert calls[0].kwargs["payload"]["reason"] == "no_matching_rule"
+        assert calls[1].kwargs["payload"]["strategy"] == "fallback"
+
+    def test_route_task_keeps_rule_order(self, tmp_path):
+        """Test indexed and wildcard rules are still tried in config order."""
+        config = {
+            "apps": {"aider": {}, "codex": {}},
+            "routing": {
+                "rules": [
+                    {
+                        "id": "any-high",
+                        "match": {"risk_tier": ["high"]},
+                        "select_from": ["aider"],
+                        "strategy": "fixed",
+                    },
+                    {
+                        "id": "edits",
+                        "match": {"task_kind": ["code_edit"]},
+                        "select_from": ["codex"],
+                        "strategy": "fixed",
+                    },
+                ]
+            },
+        }
+        path = tmp_path / "router_config.json"
+        path.write_text(json.dumps(config), encoding="utf-8")
+        router = TaskRouter(str(path))
+
+        assert router.route_task("code_edit", risk_tier="high") == "aider"
+        assert router.route_task("code_edit", risk_tier="low") == "codex"
+        assert router.route_task("refactor", risk_tier="high") == "aider"
+
+    def test_metrics_selection_prefers_reliable_fast_tool(self, router_config):
+        """Test metrics strategy scores success rate and latency."""
+        router = TaskRouter(str(router_config))
+        router.record_execution_result("aider", success=True, latency_ms=200.0)
+        router.record_execution_result("codex", success=True, latency_ms=5000.0)
+        router.record_execution_result("codex", success=False, latency_ms=5000.0)
+
+        assert router._select_by_metrics(["codex", "aider"]) == "aider"
+        # Untried tools score neutrally, below a proven one
+        assert router._select_by_metrics(["new-tool", "aider"]) == "aider"
+        assert router._select_by_metrics(["new-tool", "codex"]) == "new-tool"
+
+    def test_routing_checkpoints_through_journal(self, tmp_path):
+        """Test routing and results reach the journal without a flush."""
+        config = {
+            "apps": {"a": {}, "b": {}},
+            "routing": {
+                "rules": [
+                    {
+                        "id": "rr",
+                        "match": {"task_kind": ["code_edit"]},
+                        "select_from": ["a", "b"],
+                        "strategy": "round_robin",
+                    }
+                ]
+            },
+        }
+        config_path = tmp_path / "router_config.json"
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+        state_file = tmp_path / "router_state.json"
+        router = TaskRouter(
+            str(config_path),
+            state_store=FileBackedStateStore(str(state_file), auto_save_interval=3),
+        )
+
+        router.route_task("code_edit")
+        router.record_execution_result("a", success=True, latency_ms=10.0)
+        router._select_by_metrics(["a", "b"])
+        router.route_task("code_edit")
+
+        records = [
+            json.loads(line)
+            for line in (tmp_path / "router_state.jsonl").read_text().splitlines()
+        ]
+        assert records == [
+            {"op": "rr", "rule": "rr", "i": 2},
+            {
+                "op": "metrics",
+                "tool": "a",
+                "m": {
+                    "success_count": 1,
+                    "failure_count": 0,
+                    "total_latency_ms": 10.0,
+                    "call_count": 1,
+                },
+            },
+        ]
+
+        reloaded = FileBackedStateStore(str(state_file))
+        assert reloaded.get_round_robin_index("rr") == 2
+        assert reloaded.get_tool_metrics("a")["call_count"] == 1
+
+    def test_round_robin_shared_through_store(self, router_config):
+        """Test round-robin positions are written to the store on each pick."""
+        store = InMemoryStateStore()
+        store.set_round_robin_index("rr", 1)
+        first = TaskRouter(str(router_config), state_store=store)
+        second = TaskRouter(str(router_config), state_store=store)
+
+        picks = [
+            router._apply_strategy(["a", "b", "c"], "round_robin", "rr")
+            for router in (first, second, first, second)
+        ]
+
+        assert picks == ["b", "c", "a", "b"]
+        assert store.get_round_robin_index("rr") == 5
+
+    def test_decision_log_bounded(self, router_config):
+        """Test the decision log keeps only the newest decision_log_max entries."""
+        config = json.loads(router_config.read_text(encoding="utf-8"))
+        config["decision_log_max"] = 3
+        router_config.write_text(json.dumps(config), encoding="utf-8")
+        router = TaskRouter(str(router_config))
+
+        for i in range(5):
+            router.route_task("code_edit", risk_tier="low", task_id=f"t{i}")
+
+        assert [d["task_id"] for d in router.get_decision_log()] == ["t2", "t3", "t4"]
+        assert [d["task_id"] for d in router.get_decision_log(last_n=2)] == ["t3", "t4"]
+
+
+class TestRoutingDecision:
+    """Tests for RoutingDecision records."""
+
+    def test_slots_and_interned_fields(self):
+        """Test decisions carry no __dict__ and share repeated id strings."""
+        kind = "".join(["code", "_edit"])
+        first = RoutingDecision("code_edit", "aider", "fixed", ["aider"])
+        second = RoutingDecision(kind, "aider", "fixed", ["aider"], rule_id="edits")
+
+        assert not hasattr(first, "__dict__")
+        assert first.task_kind is second.task_kind
+        assert second.to_dict()["rule_id"] == "edits"
+        assert second.to_dict()["metadata"] == {}
+
+    def test_timestamp_formatted_from_creation_time(self):
+        """Test the lazily formatted timestamp matches the creation time."""
+        before = datetime.now(timezone.utc)
+        decision = RoutingDecision("code_edit", "aider", "fixed", ["aider"])
+        after = datetime.now(timezone.utc)
+
+        assert before <= decision.created_at <= after
+        assert datetime.fromisoformat(decision.to_dict()["timestamp"]) == (
+            decision.created_at
+        )
@@ -0,0 +1,94 @@
+"""
+Tests for ACMS schema validation helpers
+"""
+
+import json
+
+import pytest
+
+from src.acms import schema_utils
+from src.acms.schema_utils import SchemaValidator
+
+requires_validator = pytest.mark.skipif(
+    not (schema_utils.JSONSCHEMA_AVAILABLE or schema_utils.FASTJSONSCHEMA_AVAILABLE),
+    reason="no JSON schema validator installed",
+)
+
+
+@pytest.fixture
+def validator():
+    return SchemaValidator()
+
+
+class TestCompile:
+    """Tests for SchemaValidator.compile"""
+
+    def test_checker_is_reused(self, validator):
+        """Test the same checker is returned for repeated lookups."""
+        assert validator.compile("acms/gap_record") is validator.compile(
+            "acms/gap_record"
+        )
+
+    def test_validate_uses_compiled_checker(self, validator):
+        """Test validate() agrees with the compiled checker."""
+        data = {"gap_id": "GAP_1"}
+
+        assert validator.validate(data, "acms/gap_record") == validator.compile(
+            "acms/gap_record"
+        )(data)
+
+    def test_reports_invalid_and_unknown_schema(self, validator):
+        """Test invalid data and unknown schema names are reported."""
+        pytest.importorskip("jsonschema")
+
+        is_valid, error = validator.compile("acms/gap_record")({"gap_id": 1})
+        assert not is_valid
+        assert error.startswith("Validation error:")
+
+        assert validator.validate({}, "no/such_schema") == (
+            False,
+            "Schema 'no/such_schema' not found",
+        )
+
+
+@requires_validator
+class TestCheckSemantics:
+    """Tests that compiled checkers behave like jsonschema.validate"""
+
+    def test_input_not_mutated(self, validator):
+        """Test schema defaults are not written into the checked data."""
+        data = {
+            "gap_id": "GAP_TEST_001",
+            "title": "Test gap",
+            "description": "This is a test gap for validation",
+            "category": "testing",
+            "severity": "low",
+            "status": "discovered",
+            "file_paths": ["test.py"],
+        }
+        original = {key: value for key, value in data.items()}
+
+        assert validator.validate(data, "acms/gap_record") == (True, None)
+        assert data == original
+
+    def test_formats_not_enforced_and_path_reported(self, tmp_path):
+        """Test "format" is ignored and errors name the failing field."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "when": {"type": "string", "format": "date-time"},
+                "meta": {
+                    "type": "object",
+                    "properties": {"count": {"type": "integer"}},
+                },
+            },
+        }
+        (tmp_path / "demo.schema.json").write_text(
+            json.dumps(schema), encoding="utf-8"
+        )
+        check = SchemaValidator(schema_dir=tmp_path).compile("demo")
+
+        assert check({"when": "not a date"}) == (True, None)
+        is_valid, error = check({"meta": {"count": "many"}})
+        assert not is_valid
+        assert error.endswith(" at meta.count")
@@ -0,0 +1,95 @@
+"""
+Tests for the ACMS run viewer (show_run)
+"""
+
+import json
+
+import pytest
+
+from src.acms.show_run import RunViewer
+
+
+@pytest.fixture
+def viewer(tmp_path):
+    """RunViewer over a temporary repo with one run directory."""
+    (tmp_path / ".acms_runs" / "RUN1").mkdir(parents=True)
+    return RunViewer(tmp_path)
+
+
+def _write_ledger(viewer, entries, raw_lines=()):
+    ledger = viewer.runs_dir / "RUN1" / "run.ledger.jsonl"
+    lines = [json.dumps(e) for e in entries] + list(raw_lines)
+    ledger.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+class TestLoadLedgerSummary:
+    """Tests for the metadata-free ledger loader."""
+
+    def test_matches_full_load(self, viewer):
+        """Test brief entries carry the same state/event/ts as a full load."""
+        _write_ledger(
+            viewer,
+            [
+                {
+                    "ts": "2025-12-07T00:14:31+00:00",
+                    "run_id": "RUN1",
+                    "state": "init",
+                    "event": "enter_state",
+                    "previous_state": None,
+                    "meta": {"state": "nested", "count": 3},
+                },
+                {
+                    "ts": "2025-12-07T00:15:00+00:00",
+                    "run_id": "RUN1",
+                    "state": "gap_analysis",
+                    "event": "gaps_found",
+                    "meta": {},
+                },
+            ],
+        )
+
+        full = viewer.load_ledger("RUN1")
+        brief = viewer.load_ledger_summary("RUN1")
+
+        assert brief == [
+            {k: e[k] for k in ("state", "event", "ts")} for e in full
+        ]
+
+    def test_falls_back_to_json_for_escaped_values(self, viewer):
+        """Test lines with escaped strings are decoded properly."""
+        _write_ledger(
+            viewer,
+            [{"ts": "t1", "state": "s\"q", "event": "café", "meta": {}}],
+        )
+
+        assert viewer.load_ledger_summary("RUN1") == [
+            {"state": 's"q', "event": "café", "ts": "t1"}
+        ]
+
+    def test_skips_blank_lines_and_missing_file(self, viewer):
+        """Test blank lines are ignored and a missing ledger yields nothing."""
+        assert viewer.load_ledger_summary("RUN1") == []
+
+        _write_ledger(viewer, [{"ts": "t1", "state": "a", "event": "b"}], ["", "  "])
+
+        assert len(viewer.load_ledger_summary("RUN1")) == 1
+
+
+class TestLoadLedger:
+    """Tests for the full ledger loader."""
+
+    def test_reads_last_line_without_newline(self, viewer):
+        """Test a final entry with no trailing newline is still loaded."""
+        ledger = viewer.runs_dir / "RUN1" / "run.ledger.jsonl"
+        ledger.write_bytes(b'{"state": "a"}\n\n{"state": "b", "meta": {"k": 1}}')
+
+        assert viewer.load_ledger("RUN1") == [
+            {"state": "a"},
+            {"state": "b", "meta": {"k": 1}},
+        ]
+
+    def test_empty_ledger(self, viewer):
+        """Test an empty ledger file yields no entries."""
+        (viewer.runs_dir / "RUN1" / "run.ledger.jsonl").write_bytes(b"")
+
+        assert viewer.load_ledger("RUN1") == []
@@ -0,0 +1,314 @@
+"""
+Tests for the ACMS artifact validation CLI
+"""
+
+import json
+import os
+
+import pytest
+
+from src.cli.validate_everything import (
+    ArtifactResult,
+    ArtifactValidator,
+    _latest_run_id,
+    _list_spec_files,
+    _load_json,
+    _validate_spec_cached,
+)
+
+
+def _make_run(tmp_path, run_id="RUN1"):
+    run_dir = tmp_path / ".acms_runs" / run_id
+    run_dir.mkdir(parents=True)
+    return run_dir
+
+
+class TestValidateRun:
+    """Tests for ArtifactValidator.validate_run"""
+
+    def test_missing_run_dir(self, tmp_path):
+        """Test an unknown run id is reported without raising."""
+        results = ArtifactValidator(tmp_path).validate_run("NOPE")
+
+        assert results["success"] is False
+        assert "Run directory not found" in results["error"]
+
+    def test_missing_required_artifacts(self, tmp_path):
+        """Test absent run status and gap registry are reported as missing."""
+        run_dir = _make_run(tmp_path)
+
+        results = ArtifactValidator(tmp_path).validate_run("RUN1")
+
+        assert results["run_dir"] == str(run_dir)
+        assert results["total"] == 2
+        assert [a.status for a in results["artifacts"]] == ["missing", "missing"]
+        assert results["artifacts"][0].path == str(run_dir / "run_status.json")
+
+    def test_pattern_specs_discovered(self, tmp_path):
+        """Test only *.spec.yaml files under patterns/ are validated."""
+        _make_run(tmp_path)
+        patterns_dir = tmp_path / "patterns"
+        patterns_dir.mkdir()
+        (patterns_dir / "alpha.spec.yaml").write_text("id: alpha\n")
+        (patterns_dir / "notes.yaml").write_text("x: 1\n")
+        (patterns_dir / "dir.spec.yaml").mkdir()
+
+        results = ArtifactValidator(tmp_path).validate_run("RUN1")
+
+        names = [a.name for a in results["artifacts"]]
+        assert names[2:] == ["Pattern Spec: alpha.spec"]
+        assert results["artifacts"][2].path == str(patterns_dir / "alpha.spec.yaml")
+
+    def test_optional_artifacts_only_when_present(self, tmp_path):
+        """Test workstreams and plan are validated only if the files exist."""
+        run_dir = _make_run(tmp_path)
+        (run_dir / "workstreams.json").write_text("[]")
+
+        results = ArtifactValidator(tmp_path).validate_run("RUN1")
+
+        assert [a.name for a in results["artifacts"]] == [
+            "Run Status",
+            "Gap Registry",
+            "Workstreams",
+        ]
+
+
+    def test_each_path_stat_once(self, tmp_path, monkeypatch):
+        """Test run artifacts and pattern paths are looked up only once."""
+        import src.cli.validate_everything as ve
+
+        run_dir = _make_run(tmp_path)
+        (run_dir / "run_status.json").write_text("{}")
+        (tmp_path / "patterns").mkdir()
+        (tmp_path / "patterns" / "alpha.spec.yaml").write_text("id: alpha\n")
+        validator = ArtifactValidator(tmp_path)
+        real_stat = os.stat
+        seen = []
+        monkeypatch.setattr(
+            ve.os,
+            "stat",
+            lambda path, **kw: seen.append(str(path)) or real_stat(path, **kw),
+        )
+
+        validator.validate_run("RUN1")
+
+        assert len(seen) == len(set(seen))
+        assert str(run_dir / "run_status.json") in seen
+
+    def test_patterns_file_is_not_scanned(self, tmp_path):
+        """Test a plain file named patterns is ignored rather than listed."""
+        _make_run(tmp_path)
+        (tmp_path / "patterns").write_text("not a directory")
+
+        results = ArtifactValidator(tmp_path).validate_run("RUN1")
+
+        assert results["total"] == 2
+
+
+class TestLoadJson:
+    """Tests for the artifact JSON loader"""
+
+    def test_round_trips_unicode(self, tmp_path):
+        """Test UTF-8 artifacts decode to the same data as json.load."""
+        path = tmp_path / "gap_registry.json"
+        data = {"gaps": {"GAP_1": {"title": "café ✓", "n": [1, 2.5, None]}}}
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+        assert _load_json(str(path)) == data
+
+    def test_invalid_json_is_reported_as_error(self, tmp_path):
+        """Test malformed artifacts surface as an error entry."""
+        run_dir = _make_run(tmp_path)
+        (run_dir / "run_status.json").write_text("{not json")
+
+        results = ArtifactValidator(tmp_path).validate_run("RUN1")
+
+        assert results["artifacts"][0].status == "error"
+
+
+class TestCheckEach:
+    """Tests for per-record schema validation"""
+
+    def test_results_in_input_order(self, tmp_path):
+        """Test results come back lazily, keyed and ordered like the input."""
+        validator = ArtifactValidator(tmp_path)
+        records = [(f"GAP_{i}", {"gap_id": i}) for i in range(10)]
+        check = validator.validator.compile("acms/gap_record")
+
+        results = list(validator._check_each(iter(records), "acms/gap_record"))
+
+        assert results == [(key, *check(data)) for key, data in records]
+
+
+
+class TestLatestRunId:
+    """Tests for latest-run selection"""
+
+    def test_picks_newest_directory(self, tmp_path):
+        """Test the most recently modified run directory wins over files."""
+        runs_dir = tmp_path / ".acms_runs"
+        for name, mtime in (("OLD", 100), ("NEW", 300), ("MID", 200)):
+            (runs_dir / name).mkdir(parents=True)
+            os.utime(runs_dir / name, (mtime, mtime))
+        (runs_dir / "notes.txt").write_text("x")
+
+        assert _latest_run_id(runs_dir) == "NEW"
+
+    def test_empty_runs_dir(self, tmp_path):
+        """Test an empty runs directory yields None."""
+        assert _latest_run_id(tmp_path) is None
+
+
+class TestPrintResults:
+    """Tests for the results report"""
+
+    def test_report_layout(self, tmp_path, capsys):
+        """Test artifact lines, details and totals are rendered."""
+        results = {
+            "run_id": "RUN1",
+            "total": 2,
+            "passed": 1,
+            "failed": 1,
+            "success": False,
+            "artifacts": [
+                ArtifactResult(name="Run Status", path="/r", status="valid"),
+                ArtifactResult(
+                    name="Gap Registry",
+                    path="/g",
+                    status="invalid",
+                    error="1/2 gaps invalid",
+                    details=("GAP_1: bad",),
+                ),
+            ],
+        }
+
+        ArtifactValidator(tmp_path, verbose=True).print_results(results)
+
+        out = capsys.readouterr().out.splitlines()
+        assert out[:5] == ["", "=" * 70, "VALIDATION RESULTS - Run RUN1", "=" * 70, ""]
+        assert "  ✗ Gap Registry" in out
+        assert "       - GAP_1: bad" in out
+        assert "Total: 2 | Passed: 1 | Failed: 1" in out
+        assert out[-2:] == ["=" * 70, ""]
+
+
+class TestFailureCap:
+    """Tests for stopping validation after too many failures"""
+
+    def test_gap_validation_stops_early(self, tmp_path, monkeypatch):
+        """Test huge broken registries are cut short with a lower bound."""
+        import src.cli.validate_everything as ve
+
+        run_dir = _make_run(tmp_path)
+        (run_dir / "run_status.json").write_text("{}")
+        gaps = {f"GAP_{i}": {} for i in range(50)}
+        (run_dir / "gap_registry.json").write_text(json.dumps({"gaps": gaps}))
+
+        validator = ArtifactValidator(tmp_path)
+        checked = []
+
+        def failing(data):
+            checked.append(data)
+            return False, "bad"
+
+        monkeypatch.setattr(validator.validator, "compile", lambda name: failing)
+        results = validator.validate_run("RUN1")
+
+        registry = results["artifacts"][1]
+        assert registry.error == f"≥{ve._MAX_FAILURES}/50 gaps invalid"
+        assert len(registry.details) == 5
+        # run_status plus the gaps checked before giving up
+        assert len(checked) == 1 + ve._MAX_FAILURES
+
+
+class TestListSpecFiles:
+    """Tests for the cached pattern-spec listing"""
+
+    def test_listing_follows_directory_mtime(self, tmp_path):
+        """Test the listing is reused until the directory changes."""
+        (tmp_path / "b.spec.yaml").write_text("")
+        (tmp_path / "a.spec.yaml").write_text("")
+        os.utime(tmp_path, ns=(1, 1))
+
+        first = _list_spec_files(str(tmp_path), os.stat(tmp_path).st_mtime_ns)
+        assert [name for _, name in first] == ["a.spec", "b.spec"]
+
+        (tmp_path / "c.spec.yaml").write_text("")
+        os.utime(tmp_path, ns=(1, 1))
+        assert _list_spec_files(str(tmp_path), os.stat(tmp_path).st_mtime_ns) is first
+
+        os.utime(tmp_path, ns=(2, 2))
+        refreshed = _list_spec_files(str(tmp_path), os.stat(tmp_path).st_mtime_ns)
+        assert len(refreshed) == 3
+
+
+class TestValidateSpecCached:
+    """Tests for memoized pattern-spec validation"""
+
+    def test_revalidates_only_when_file_changes(self, tmp_path, monkeypatch):
+        """Test an unchanged spec is validated once across runs."""
+        import src.acms.guardrails as guardrails
+
+        calls = []
+        monkeypatch.setattr(
+            guardrails,
+            "validate_pattern_spec",
+            lambda path: calls.append(path) or (True, None),
+        )
+        _validate_spec_cached.cache_clear()
+
+        _make_run(tmp_path)
+        spec = tmp_path / "patterns" / "alpha.spec.yaml"
+        spec.parent.mkdir()
+        spec.write_text("id: alpha\n")
+        validator = ArtifactValidator(tmp_path)
+
+        validator.validate_run("RUN1")
+        validator.validate_run("RUN1")
+        assert len(calls) == 1
+
+        spec.write_text("id: alpha\nversion: 2\n")
+        validator.validate_run("RUN1")
+        assert len(calls) == 2
+
+
+class TestMain:
+    """Tests for the command-line entry point"""
+
+    def _run_main(self, monkeypatch, *argv):
+        from src.cli.validate_everything import main
+
+        monkeypatch.setattr("sys.argv", ["validate_everything.py", *argv])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        return exc.value.code
+
+    def test_all_runs_reported_in_order(self, tmp_path, monkeypatch, capsys):
+        """Test --all validates every run and fails if any run fails."""
+        for run_id in ("RUN_B", "RUN_A"):
+            _make_run(tmp_path, run_id)
+
+        code = self._run_main(monkeypatch, "--repo-root", str(tmp_path), "--all")
+
+        out = capsys.readouterr().out
+        assert code == 1
+        assert out.index("Run RUN_A") < out.index("Run RUN_B")
+
+    def test_repeated_run_id_with_unknown_run(self, tmp_path, monkeypatch, capsys):
+        """Test unknown run ids are reported alongside valid ones."""
+        _make_run(tmp_path)
+
+        code = self._run_main(
+            monkeypatch,
+            "--repo-root",
+            str(tmp_path),
+            "--run-id",
+            "RUN1",
+            "--run-id",
+            "NOPE",
+        )
+
+        out = capsys.readouterr().out
+        assert code == 1
+        assert "VALIDATION RESULTS - Run RUN1" in out
+        assert "✗ Run directory not found" in out